@@ -3,6 +3,9 @@ import pytest
 from rest_framework.test import APIClient
 from django.conf import settings
 
+from core.utils.activity_engine import activity_engine
+from core.utils.activity_engine_standin import StandInActivityEngine
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -11,4 +14,15 @@ def api_client():
 def authenticated_client(api_client, user_factory):
     user = user_factory()
     api_client.force_authenticate(user=user)
-    return api_client
\ No newline at end of file
+    return api_client
+
+@pytest.fixture
+def activity_engine_standin(settings):
+    """
+    A running activity-engine stand-in, which ACTIVITY_ENGINE_URL points to.
+    """
+    with StandInActivityEngine() as engine:
+        settings.ACTIVITY_ENGINE_URL = engine.url
+        # Failures of earlier tests must not leave the shared circuit open
+        activity_engine.breaker.record_success()
+        yield engine
@@ -0,0 +1,132 @@
+# core/assessment/bulk.py
+from django.db import transaction
+from rest_framework import serializers
+
+from .models import (
+    Assessment,
+    Question,
+    QuestionOption,
+    QuestionType,
+    NATSolution,
+    DescriptiveSolution,
+    MCQSolution,
+    MSQSolution,
+)
+from .constants import BULK_CREATE_BATCH_SIZE, BULK_QUESTIONS_MAX_COUNT
+from .serializers import QuestionSerializer
+
+
+QUESTION_FIELDS = ("assessment", "text", "hint", "type", "partial_marking", "marks")
+
+
+class BulkQuestionSerializer(QuestionSerializer):
+    """
+    Validates a question for bulk creation.
+
+    On top of `QuestionSerializer`, option indices are checked against the
+    question's own options, since they are resolved in memory when inserting.
+    The assessment is left to the caller.
+    """
+
+    class Meta(QuestionSerializer.Meta):
+        fields = [field for field in QuestionSerializer.Meta.fields if field not in ("id", "assessment")]
+
+    def validate(self, data):
+        data = super().validate(data)
+
+        option_count = len(data.get("options") or [])
+        if data["type"] == QuestionType.MCQ:
+            indices = [data["solution_option_index"]]
+        elif data["type"] == QuestionType.MSQ:
+            indices = data["solution_options_indices"]
+            if len(indices) != len(set(indices)):
+                raise serializers.ValidationError(
+                    {"solution_options_indices": "Solution option indices must be unique."}
+                )
+        else:
+            indices = []
+
+        if any(not 0 <= index < option_count for index in indices):
+            raise serializers.ValidationError("Solution option indices must refer to the question's options.")
+        return data
+
+
+class QuestionBankSerializer(serializers.Serializer):
+    """
+    Validates a list of questions of any type for one assessment.
+
+    Every question is validated before anything is written, and the assessment
+    is looked up once for all of them.
+    """
+
+    assessment = serializers.PrimaryKeyRelatedField(queryset=Assessment.objects.all())
+    questions = BulkQuestionSerializer(many=True, allow_empty=False, max_length=BULK_QUESTIONS_MAX_COUNT)
+
+    def create(self, validated_data):
+        assessment = validated_data["assessment"]
+        return bulk_create_questions([
+            {**question, "assessment": assessment} for question in validated_data["questions"]
+        ])
+
+
+def bulk_create_questions(questions):
+    """
+    Insert validated questions with their options and solutions.
+
+    Options are inserted in one pass and matched back to their questions by
+    position, so the number of queries does not depend on the number of
+    questions (one INSERT per model and batch).
+
+    Args:
+        questions (list[dict]): Data validated by `BulkQuestionSerializer`, each
+            with its `assessment` instance added.
+
+    Returns:
+        list[Question]: The created questions, in the given order.
+    """
+    with transaction.atomic():
+        created = Question.objects.bulk_create(
+            [
+                Question(**{field: data[field] for field in QUESTION_FIELDS if field in data})
+                for data in questions
+            ],
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+        options = QuestionOption.objects.bulk_create(
+            [
+                QuestionOption(question=question, **option)
+                for question, data in zip(created, questions)
+                for option in data.get("options") or []
+            ],
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+        solutions = {NATSolution: [], DescriptiveSolution: [], MCQSolution: [], MSQSolution: []}
+        position = 0
+        for question, data in zip(created, questions):
+            option_count = len(data.get("options") or [])
+            question_options = options[position:position + option_count]
+            position += option_count
+
+            if question.type == QuestionType.NAT:
+                solutions[NATSolution].append(NATSolution(question=question, **data["nat_solution"]))
+            elif question.type == QuestionType.DESC:
+                solutions[DescriptiveSolution].append(
+                    DescriptiveSolution(question=question, **data["descriptive_solution"])
+                )
+            elif question.type == QuestionType.MCQ:
+                solutions[MCQSolution].append(
+                    MCQSolution(question=question, choice=question_options[data["solution_option_index"]])
+                )
+            elif question.type == QuestionType.MSQ:
+                solutions[MSQSolution].extend(
+                    MSQSolution(question=question, choice=question_options[index])
+                    for index in data["solution_options_indices"]
+                )
+
+        for model, objects in solutions.items():
+            if objects:
+                model.objects.bulk_create(objects, batch_size=BULK_CREATE_BATCH_SIZE)
+
+    return created
@@ -14,3 +14,6 @@ QUESTION_MARKS_MAX_VAL = 1000
 SOLUTION_EXPLANATION_MAX_LEN = 1000
 
 MODEL_DESCRIPTIVE_SOLUTION_MAX_LEN = 1000
+
+BULK_CREATE_BATCH_SIZE = 1000
+BULK_QUESTIONS_MAX_COUNT = 1000
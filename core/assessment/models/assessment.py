@@ -3,10 +3,10 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from .. import constants as ct
-from ...auth.permissions import ModelPermissionsMixin
+from ...course.ancestry import CourseContentPermissionsMixin
 
 
-class Assessment(ModelPermissionsMixin, models.Model):
+class Assessment(CourseContentPermissionsMixin, models.Model):
     title = models.CharField(max_length=ct.ASSESSMENT_TITLE_MAX_LEN)
     question_visibility_limit = models.IntegerField(
         validators=[
@@ -24,6 +24,8 @@ class Assessment(ModelPermissionsMixin, models.Model):
     created_at = models.DateTimeField(auto_now_add=True)  # Add this field
     updated_at = models.DateTimeField(auto_now=True)  # Add this field
 
+    course_item_type = "assessment"
+
 
     def __str__(self):
         return self.title
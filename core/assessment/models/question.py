@@ -3,7 +3,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 
-from ...auth.permissions import ModelPermissionsMixin
+from ...course.ancestry import CourseContentPermissionsMixin
 from ...utils.models import TimestampMixin
 from .. import constants as ct
 
@@ -15,7 +15,7 @@ class QuestionType(models.TextChoices):
     DESC = "DESC", "Descriptive Question"
 
 
-class Question(TimestampMixin, ModelPermissionsMixin, models.Model):
+class Question(TimestampMixin, CourseContentPermissionsMixin, models.Model):
     assessment = models.ForeignKey(
         "assessment.Assessment", on_delete=models.CASCADE, related_name="questions")
     text = models.TextField(max_length=ct.QUESTION_TEXT_MAX_LEN, help_text="The question text.")
@@ -31,29 +31,8 @@ class Question(TimestampMixin, ModelPermissionsMixin, models.Model):
         help_text="The maximum marks for the question."
     )
 
-    def __getattr__(self, name):
-        """
-        Delegate permission checks to the related assessment object.
-        Handles permission method lookups that are not directly defined on the Question model.
-        """
-        # List of permission methods to delegate to the assessment
-        permission_methods = [
-            'student_has_access', 
-            'instructor_has_access', 
-            'staff_has_access', 
-            'moderator_has_access', 
-            'admin_has_access', 
-            'superadmin_has_access'
-        ]
-
-        if name in permission_methods:
-            # Delegate the permission check to the associated assessment
-            return getattr(self.assessment, name)
-        
-        # If it's not a known permission method, raise the standard AttributeError
-        raise AttributeError(
-            f"'{type(self).__name__}' object has no attribute '{name}'"
-        )
+    course_item_type = "assessment"
+    course_item_field = "assessment_id"
 
     # def admin_has_access(self, user: "User"):
     #     return True, True, True
\ No newline at end of file
@@ -0,0 +1,108 @@
+# tests/test_bulk_questions.py
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.assessment.models import (
+    Assessment,
+    DescriptiveSolution,
+    MCQSolution,
+    MSQSolution,
+    NATSolution,
+    Question,
+    QuestionOption,
+)
+from core.course.serializers import CourseBundleSerializer
+from core.course.tests.factories import UserFactory, make_bundle
+from core.institution.tests.factories import InstitutionFactory
+
+
+def question_bank(count):
+    """Return `count` questions cycling through every question type."""
+    templates = [
+        {
+            "text": "2 + 2?", "type": "MCQ", "marks": 1,
+            "options": [{"option_text": "3"}, {"option_text": "4"}],
+            "solution_option_index": 1,
+        },
+        {
+            "text": "Even numbers?", "type": "MSQ", "marks": 2,
+            "options": [{"option_text": "1"}, {"option_text": "2"}, {"option_text": "4"}],
+            "solution_options_indices": [1, 2],
+        },
+        {
+            "text": "Pi to two places?", "type": "NAT", "marks": 1,
+            "nat_solution": {
+                "value": 3.14, "tolerance_max": 3.15, "tolerance_min": 3.13,
+                "decimal_precision": 2, "solution_explanation": "Pi",
+            },
+        },
+        {
+            "text": "Explain recursion.", "type": "DESC", "marks": 5,
+            "descriptive_solution": {
+                "model_solution": "A function calling itself.", "max_word_limit": 100,
+                "min_word_limit": 5, "solution_explanation": "Recursion",
+            },
+        },
+    ]
+    return [{**templates[index % len(templates)], "text": f"Question {index}"} for index in range(count)]
+
+
+class TestBulkQuestions(APITestCase):
+    def setUp(self):
+        serializer = CourseBundleSerializer(data=make_bundle(InstitutionFactory(), modules=1, sections=1))
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        self.assessment = Assessment.objects.get(title='Quiz 0.0')
+        self.user = UserFactory(email='bank.admin@example.com', role='admin')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('question-bulk')
+
+    def post(self, questions):
+        return self.client.post(self.url, {'assessment': self.assessment.id, 'questions': questions})
+
+    def test_creates_mixed_question_types(self):
+        response = self.post(question_bank(4))
+
+        assert response.status_code == status.HTTP_201_CREATED
+        mcq, msq, nat, desc = Question.objects.filter(id__in=response.data['ids']).order_by('id')
+        assert MCQSolution.objects.get(question=mcq).choice.option_text == '4'
+        assert {solution.choice.option_text for solution in MSQSolution.objects.filter(question=msq)} == {'2', '4'}
+        assert NATSolution.objects.get(question=nat).value == 3.14
+        assert DescriptiveSolution.objects.filter(question=desc).exists()
+        assert {question.assessment_id for question in (mcq, msq, nat, desc)} == {self.assessment.id}
+
+    def test_query_count_does_not_grow_with_bank(self):
+        with CaptureQueriesContext(connection) as small:
+            self.post(question_bank(8))
+        with CaptureQueriesContext(connection) as large:
+            self.post(question_bank(80))
+        assert len(large) == len(small)
+
+    def test_invalid_questions_create_nothing(self):
+        questions = question_bank(4)
+        questions[3] = {**questions[0], 'solution_option_index': 5}
+        before = Question.objects.count()
+
+        response = self.post(questions)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['questions'][3]
+        assert Question.objects.count() == before
+
+    def test_students_cannot_create_questions(self):
+        self.client.force_authenticate(user=UserFactory(email='bank.student@example.com', role='student'))
+        assert self.post(question_bank(1)).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_option_edits_are_not_hidden_by_conditional_get(self):
+        question_id = self.post(question_bank(1)).data['ids'][0]
+        url = reverse('question-detail', args=[question_id])
+        etag = self.client.get(url).get('ETag', '"none"')
+
+        QuestionOption.objects.filter(question_id=question_id, option_text='4').update(option_text='Four')
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert 'Four' in [option['option_text'] for option in response.data['options']]
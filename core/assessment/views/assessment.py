@@ -5,6 +5,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 from ..models import Assessment
 from ..serializers import AssessmentSerializer
 from ...course.models import Section
+from ...utils.views import ConditionalGetMixin
 from django.forms import ValidationError
 
 
@@ -43,10 +44,11 @@ from django.forms import ValidationError
         responses={"204": "Assessment deleted successfully."},
     ),
 )
-class AssessmentViewSet(viewsets.ModelViewSet):
+class AssessmentViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     A ViewSet for managing Assessments.
     """
+    conditional_actions = ("retrieve",)
     queryset = Assessment.objects.all()
     serializer_class = AssessmentSerializer
 
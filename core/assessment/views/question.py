@@ -1,10 +1,16 @@
 # core/assessment/views/question.py
 
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, extend_schema_view
+from ..bulk import QuestionBankSerializer
 from ..models import Question
 from ..serializers import QuestionSerializer
+from ...auth.permissions import WriteAccessPermission
+from ...utils.pagination import KeysetPagination
 
 
 @extend_schema_view(
@@ -58,14 +64,35 @@ from ..serializers import QuestionSerializer
         description="Delete an existing question by ID.",
         responses={"204": "Question deleted successfully."},
     ),
+    bulk=extend_schema(
+        tags=["Question"],
+        summary="Bulk Create Questions",
+        description=(
+            "Create a bank of MCQ, MSQ, NAT and descriptive questions for an assessment at once. "
+            "Every question is validated before anything is written, then questions, options and "
+            "solutions are inserted in a fixed number of queries, in one transaction."
+        ),
+        request=QuestionBankSerializer,
+        responses={
+            201: {
+                "type": "object",
+                "properties": {"ids": {"type": "array", "items": {"type": "integer"}}},
+            },
+        },
+    ),
 )
 
 class QuestionViewSet(viewsets.ModelViewSet):
     """
     A ViewSet for managing Questions.
+
+    Questions embed their options and solutions, which have no timestamps and
+    change without touching the question, so they are not served conditionally.
     """
     queryset = Question.objects.all()
     serializer_class = QuestionSerializer
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
 
     def list(self, request, *args, **kwargs):
         """
@@ -82,3 +109,14 @@ class QuestionViewSet(viewsets.ModelViewSet):
         paginated_queryset = self.paginate_queryset(queryset)
         serializer = self.get_serializer(paginated_queryset, many=True)
         return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["post"], permission_classes=[IsAuthenticated, WriteAccessPermission])
+    def bulk(self, request, *args, **kwargs):
+        """
+        Create many questions of mixed types for one assessment in a fixed number of queries.
+        """
+        serializer = QuestionBankSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.check_object_permissions(request, serializer.validated_data["assessment"])
+        questions = serializer.save()
+        return Response({"ids": [question.id for question in questions]}, status=status.HTTP_201_CREATED)
@@ -0,0 +1,74 @@
+from django.db import DEFAULT_DB_ALIAS
+from oauth2_provider.contrib.rest_framework import OAuth2Authentication
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from ..user.models import User
+from .signed_tokens import read_signed_token, revocations, signed_tokens_enabled
+from .token_cache import cache_token, get_cached_token
+
+
+def get_bearer_token(request):
+    """
+    Return the token of an `Authorization: Bearer` header, or None.
+    """
+    auth_type, _, token = request.META.get("HTTP_AUTHORIZATION", "").partition(" ")
+    if auth_type.lower() != "bearer" or not token:
+        return None
+    return token.strip()
+
+
+class CachedOAuth2Authentication(OAuth2Authentication):
+    """
+    OAuth2 authentication that skips the `AccessToken` lookup for tokens
+    validated recently, on this worker or on another one sharing the cache.
+    """
+
+    def authenticate(self, request):
+        if request is None:
+            return None
+
+        token = get_bearer_token(request)
+        if token:
+            access_token = get_cached_token(token)
+            if access_token is not None:
+                return access_token.user, access_token
+
+        result = super().authenticate(request)
+        if result is not None and token == result[1].token and not getattr(result[1], "resource", None):
+            # Audience restricted tokens are validated against each request URI
+            cache_token(result[1])
+        return result
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Authenticates self-contained signed tokens without a database lookup,
+    when `AUTH_TOKEN_MODE` is "signed". Other bearer tokens are left to the
+    next authentication class.
+
+    The user is built from the token claims with only `id`, `role` and
+    `is_active` loaded; other fields are deferred and fetched on first access.
+    """
+
+    www_authenticate_realm = "api"
+
+    def authenticate(self, request):
+        if not signed_tokens_enabled():
+            return None
+
+        token = get_bearer_token(request)
+        claims = read_signed_token(token) if token else None
+        if claims is None:
+            return None
+        if revocations.is_revoked(claims):
+            raise AuthenticationFailed("Token has been revoked.")
+
+        loaded = {"id": claims["uid"], "role": claims["role"], "is_active": True}
+        # from_db() expects the loaded values in model field order
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in loaded]
+        user = User.from_db(DEFAULT_DB_ALIAS, field_names, [loaded[name] for name in field_names])
+        return user, claims
+
+    def authenticate_header(self, request):
+        return f'Bearer realm="{self.www_authenticate_realm}"'
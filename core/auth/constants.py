@@ -5,3 +5,7 @@ INSTRUCTOR_SCOPE = "instructor"
 STUDENT_SCOPE = "student"
 STAFF_SCOPE = "staff"
 ADMIN_SCOPE = "admin"
+
+# Access token modes, selected by the AUTH_TOKEN_MODE setting
+OAUTH2_TOKEN_MODE = "oauth2"
+SIGNED_TOKEN_MODE = "signed"
@@ -0,0 +1,70 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils.timezone import now
+from oauth2_provider.contrib.rest_framework import OAuth2Authentication
+from oauth2_provider.models import AccessToken, Application
+from rest_framework.request import Request
+
+from core.auth.authentication import CachedOAuth2Authentication, SignedTokenAuthentication
+from core.auth.constants import SIGNED_TOKEN_MODE
+from core.auth.signed_tokens import issue_signed_token
+from core.user.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the throughput of authenticating one request with an OAuth2 token, "
+        "a cached OAuth2 token and a signed token. Test data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=2000, help="Authentications per mode.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = User.objects.create_user(email="benchmark.auth@example.com", password="benchmark")
+            application = Application.objects.create(
+                name="Benchmark",
+                client_type=Application.CLIENT_CONFIDENTIAL,
+                authorization_grant_type=Application.GRANT_AUTHORIZATION_CODE,
+            )
+            oauth2_token = AccessToken.objects.create(
+                user=user, application=application, token="benchmark-auth-token",
+                expires=now() + timedelta(hours=1), scope="read write",
+            )
+            signed_token, _ = issue_signed_token(user)
+
+            modes = [
+                ("oauth2", OAuth2Authentication(), oauth2_token.token),
+                ("oauth2 (cached)", CachedOAuth2Authentication(), oauth2_token.token),
+                ("signed", SignedTokenAuthentication(), signed_token),
+            ]
+            with override_settings(AUTH_TOKEN_MODE=SIGNED_TOKEN_MODE):
+                for name, authentication, token in modes:
+                    self.run_mode(name, authentication, token, options["iterations"])
+
+            transaction.set_rollback(True)
+
+    def run_mode(self, name, authentication, token, iterations):
+        factory = RequestFactory()
+        requests = [
+            Request(factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")) for _ in range(iterations)
+        ]
+        # Warm up caches such as the revocation list and the token cache
+        assert authentication.authenticate(requests[0]) is not None
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for request in requests:
+                authentication.authenticate(request)
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{name}: {iterations / elapsed:,.0f} requests/s, "
+            f"{len(queries) / iterations:.2f} queries per request"
+        ))
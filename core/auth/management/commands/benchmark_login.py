@@ -0,0 +1,78 @@
+import secrets
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils.timezone import now
+from oauth2_provider.models import AccessToken, Application, Grant, RefreshToken
+from oauth2_provider.settings import oauth2_settings
+
+from core.auth.oauth2_tokens import issue_tokens
+from core.user.models import User
+
+
+def issue_tokens_with_grant(user, application, scope):
+    """
+    The former login issuance path, kept as the baseline of the benchmark.
+    """
+    AccessToken.objects.filter(user=user, expires__gt=now(), application=application).order_by("-expires").first()
+    grant = Grant.objects.create(
+        user=user, application=application, code=secrets.token_urlsafe(32),
+        expires=now() + timedelta(seconds=oauth2_settings.AUTHORIZATION_CODE_EXPIRE_SECONDS),
+        redirect_uri="", scope=scope,
+    )
+    access_token = AccessToken.objects.create(
+        user=user, application=application, token=secrets.token_urlsafe(32),
+        expires=now() + timedelta(seconds=oauth2_settings.ACCESS_TOKEN_EXPIRE_SECONDS), scope=scope,
+    )
+    refresh_token = RefreshToken.objects.create(
+        user=user, token=secrets.token_urlsafe(32), access_token=access_token, application=application,
+    )
+    grant.delete()
+    return access_token, refresh_token
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the token issuance throughput of a burst of logins, with the former "
+        "Grant-based path, the lean path and the lean path reusing valid tokens. "
+        "Password hashing is excluded. Test data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="Users logging in per run.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(email=f"benchmark.login.{index}@example.com", password="!")
+                for index in range(options["users"])
+            ])
+            application = Application.objects.create(
+                name="Benchmark",
+                client_type=Application.CLIENT_CONFIDENTIAL,
+                authorization_grant_type=Application.GRANT_AUTHORIZATION_CODE,
+            )
+
+            self.run("grant", issue_tokens_with_grant, users, application)
+            with override_settings(LOGIN_REUSE_ACCESS_TOKEN=False):
+                self.run("lean", issue_tokens, users, application)
+            with override_settings(LOGIN_REUSE_ACCESS_TOKEN=True):
+                # Every user already holds a valid token from the previous runs
+                self.run("lean (reuse)", issue_tokens, users, application)
+
+            transaction.set_rollback(True)
+
+    def run(self, name, issue, users, application):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for user in users:
+                issue(user, application, "read write")
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{name}: {len(users) / elapsed:,.0f} logins/s, "
+            f"{len(queries) / len(users):.2f} queries per login"
+        ))
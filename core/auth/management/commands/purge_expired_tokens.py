@@ -0,0 +1,41 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.auth.purge import purge_expired
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired OAuth2 access tokens, refresh tokens and grants, and revocations "
+        "of expired signed tokens, in short batched transactions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.TOKEN_PURGE_BATCH_SIZE,
+            help="Maximum rows deleted per transaction.",
+        )
+        parser.add_argument(
+            "--pause", type=float, default=0,
+            help="Seconds to sleep between batches, to leave room for other writes.",
+        )
+        parser.add_argument(
+            "--every", type=float,
+            help="Keep running and purge every this many seconds, instead of once.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.purge(options["batch_size"], options["pause"])
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
+
+    def purge(self, batch_size, pause):
+        for result in purge_expired(batch_size, pause):
+            self.stdout.write(self.style.SUCCESS(
+                f"Purged {result.deleted} {result.name} in {result.seconds:.2f}s "
+                f"({result.rate:,.0f} rows/s)."
+            ))
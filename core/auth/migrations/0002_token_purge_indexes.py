@@ -0,0 +1,50 @@
+from django.db import migrations
+
+
+# The OAuth2 models belong to django-oauth-toolkit, so their indexes are
+# created here rather than declared on the models.
+TOKEN_INDEXES = [
+    # Expired access token purge
+    ("oauth2_access_expires_idx", "oauth2_provider_accesstoken", "expires"),
+    # Valid tokens of a user at login
+    ("oauth2_access_user_app_idx", "oauth2_provider_accesstoken", "user_id, application_id, expires"),
+    # Revoked refresh token purge
+    ("oauth2_refresh_revoked_idx", "oauth2_provider_refreshtoken", "revoked"),
+    # Expired grant purge
+    ("oauth2_grant_expires_idx", "oauth2_provider_grant", "expires"),
+]
+
+
+class RunIndexSQL(migrations.RunSQL):
+    """
+    Runs `{concurrently}` index statements, concurrently on PostgreSQL.
+
+    The token tables are large and written on every login, so their indexes
+    are built without the lock that blocks writes for the whole build.
+    """
+
+    def _run_sql(self, schema_editor, sqls):
+        concurrently = "CONCURRENTLY " if schema_editor.connection.vendor == "postgresql" else ""
+        super()._run_sql(schema_editor, sqls.format(concurrently=concurrently))
+
+
+class Migration(migrations.Migration):
+
+    # Concurrent index builds cannot run in a transaction
+    atomic = False
+
+    dependencies = [
+        ('core_auth', '0001_revoked_token'),
+        # The toolkit migration these indexes were written against, shipped
+        # since django-oauth-toolkit 3.4.1. SQLite rebuilds altered tables
+        # without them, so they come after it.
+        ('oauth2_provider', '0022_refreshtoken_token_family_index'),
+    ]
+
+    operations = [
+        RunIndexSQL(
+            sql=f'CREATE INDEX {{concurrently}}"{name}" ON "{table}" ({columns})',
+            reverse_sql=f'DROP INDEX {{concurrently}}"{name}"',
+        )
+        for name, table, columns in TOKEN_INDEXES
+    ]
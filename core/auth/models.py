@@ -1,3 +1,34 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class RevokedToken(models.Model):
+    """
+    A signed access token revoked before its expiry, by its token ID.
+
+    Rows are only needed until the token would have expired anyway.
+    """
+
+    jti = models.CharField(max_length=32, unique=True)
+    expires = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.jti
+
+
+class UserTokenRevocation(models.Model):
+    """
+    Revokes the signed access tokens of a user issued before `issued_before`.
+
+    Signed tokens carry the user's role, so they are revoked when the role or
+    the active status changes. Rows are only needed until the last token
+    issued before the cutoff would have expired anyway.
+    """
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    issued_before = models.DateTimeField()
+    expires = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.user_id} before {self.issued_before}"
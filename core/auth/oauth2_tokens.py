@@ -0,0 +1,71 @@
+import secrets
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+from oauth2_provider.models import AccessToken, RefreshToken
+from oauth2_provider.settings import oauth2_settings
+
+
+def _reusable_token(user, application, scope):
+    """
+    Return the user's latest access token for the application and scope that
+    still has `LOGIN_TOKEN_REUSE_MIN_SECONDS` to live and a refresh token.
+    """
+    min_expires = now() + timedelta(seconds=settings.LOGIN_TOKEN_REUSE_MIN_SECONDS)
+    return (
+        AccessToken.objects.filter(
+            user=user, application=application, scope=scope,
+            expires__gt=min_expires, refresh_token__isnull=False,
+        )
+        .select_related("refresh_token")
+        .order_by("-expires")
+        .first()
+    )
+
+
+def issue_tokens(user, application, scope):
+    """
+    Issue an access token and its refresh token for a user who logged in.
+
+    Both tokens are written in one transaction, without an intermediate
+    authorization `Grant`. When `LOGIN_REUSE_ACCESS_TOKEN` is set, a still
+    valid token pair of the same user, application and scope is returned
+    instead, which turns repeated logins into a single read.
+
+    Args:
+        user (User): The authenticated user.
+        application (Application): The client application.
+        scope (str): The space-separated scopes of the token.
+
+    Returns:
+        tuple[AccessToken, RefreshToken]: The access and refresh tokens.
+    """
+    if settings.LOGIN_REUSE_ACCESS_TOKEN:
+        access_token = _reusable_token(user, application, scope)
+        if access_token is not None:
+            return access_token, access_token.refresh_token
+
+    with transaction.atomic():
+        access_token = AccessToken.objects.create(
+            user=user,
+            application=application,
+            token=secrets.token_urlsafe(32),
+            expires=now() + timedelta(seconds=oauth2_settings.ACCESS_TOKEN_EXPIRE_SECONDS),
+            scope=scope,
+        )
+        refresh_token = RefreshToken.objects.create(
+            user=user,
+            token=secrets.token_urlsafe(32),
+            access_token=access_token,
+            application=application,
+        )
+    return access_token, refresh_token
+
+
+def expires_in(access_token):
+    """
+    Return the whole seconds an access token has left to live.
+    """
+    return max(0, int((access_token.expires - now()).total_seconds()))
@@ -25,10 +25,112 @@ class ModelPermissionsMixin(models.Model):
     def superadmin_has_access(self, user: "User"):
         return (True, True, True)
 
+    @classmethod
+    def access_for(cls, user: "User", objects):
+        """
+        Return the (read, write, delete) access of `user` to each of `objects`.
+
+        The default evaluates the `<role>_has_access` method of every object;
+        models override this to resolve many objects in a fixed number of queries.
+
+        Args:
+            user (User): The user requesting access.
+            objects (Iterable[ModelPermissionsMixin]): Instances of this model.
+
+        Returns:
+            dict: The access tuples keyed by object pk.
+        """
+        return {obj.pk: role_access(user, obj) for obj in objects}
+
+    class Meta:
+        abstract = True
+
+
+class BatchPermissionsMixin(ModelPermissionsMixin):
+    """
+    For models whose role rules are written once, for many objects at a time,
+    in `role_access_for`. The per-object `<role>_has_access` methods evaluate
+    the same rules for a single object.
+    """
+
+    @classmethod
+    def role_access_for(cls, role: str, user: "User", objects) -> dict:
+        """
+        Return the (read, write, delete) access of a user with `role` to each
+        of `objects`, keyed by pk, in one or two queries.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def access_for(cls, user: "User", objects):
+        return cls.role_access_for(user.role, user, objects)
+
+    def _role_access(self, role, user: "User"):
+        return self.role_access_for(role, user, [self])[self.pk]
+
+    def student_has_access(self, user: "User"):
+        from ..user.models import Roles
+
+        return self._role_access(Roles.STUDENT, user)
+
+    def instructor_has_access(self, user: "User"):
+        from ..user.models import Roles
+
+        return self._role_access(Roles.INSTRUCTOR, user)
+
+    def staff_has_access(self, user: "User"):
+        from ..user.models import Roles
+
+        return self._role_access(Roles.STAFF, user)
+
+    def moderator_has_access(self, user: "User"):
+        from ..user.models import Roles
+
+        return self._role_access(Roles.MODERATOR, user)
+
+    def admin_has_access(self, user: "User"):
+        from ..user.models import Roles
+
+        return self._role_access(Roles.ADMIN, user)
+
+    def superadmin_has_access(self, user: "User"):
+        from ..user.models import Roles
+
+        return self._role_access(Roles.SUPERADMIN, user)
+
     class Meta:
         abstract = True
 
 
+def role_access(user: "User", obj):
+    """
+    Return the (read, write, delete) access of `user` to `obj` for the user's role.
+    """
+    from ..user.models import Roles
+
+    role: Roles = user.role
+
+    if role == Roles.STUDENT:
+        access = obj.student_has_access(user)
+
+    elif role == Roles.INSTRUCTOR:
+        access = obj.instructor_has_access(user)
+
+    elif role == Roles.STAFF:
+        access = obj.staff_has_access(user)
+
+    elif role == Roles.MODERATOR:
+        access = obj.moderator_has_access(user)
+
+    elif role == Roles.ADMIN:
+        access = obj.admin_has_access(user)
+
+    elif role == Roles.SUPERADMIN:
+        access = obj.superadmin_has_access(user)
+
+    return access
+
+
 class RoleBasedPermission(BasePermission):
     def has_permission(self, request, view):
         from ..user.models import Roles
@@ -39,34 +141,57 @@ class RoleBasedPermission(BasePermission):
         # Check access at the object level
         return True
 
-    def has_object_permission(self, request, view, obj: ModelPermissionsMixin):
-        from ..user.models import Roles
-
-        role: Roles = request.user.role
+    def permissions_for(self, user, objects):
+        """
+        Return the (read, write, delete) access of `user` to many objects of one model.
+
+        Models that define `access_for` resolve the whole set in one or two
+        queries per role; other objects are evaluated one at a time.
+
+        Args:
+            user (User): The user requesting access.
+            objects (QuerySet | Iterable[Model]): The objects to check.
+
+        Returns:
+            dict: The access tuples keyed by object pk.
+        """
+        objects = list(objects)
+        if not objects:
+            return {}
+        model = type(objects[0])
+        if hasattr(model, "access_for"):
+            return model.access_for(user, objects)
+        return {obj.pk: role_access(user, obj) for obj in objects}
+
+    def get_access(self, user, obj: ModelPermissionsMixin):
+        """
+        Return the (read, write, delete) access of `user` to `obj` for the user's role.
+        """
+        return self.permissions_for(user, [obj])[obj.pk]
 
+    def has_object_permission(self, request, view, obj: ModelPermissionsMixin):
         is_read = request.method in SAFE_METHODS
         is_delete = request.method == "DELETE"
         is_write = not is_read and not is_delete
 
-        if role == Roles.STUDENT:
-            access = obj.student_has_access(request.user)
+        access = self.get_access(request.user, obj)
+        return access[0] if is_read else access[1] if is_write else access[2]
 
-        elif role == Roles.INSTRUCTOR:
-            access = obj.instructor_has_access(request.user)
 
-        elif role == Roles.STAFF:
-            access = obj.staff_has_access(request.user)
+class WriteAccessPermission(RoleBasedPermission):
+    """
+    Requires write access even for safe methods, for read-only endpoints that
+    expose authoring data such as solutions.
+    """
 
-        elif role == Roles.MODERATOR:
-            access = obj.moderator_has_access(request.user)
+    def has_permission(self, request, view):
+        from ..user.models import Roles
 
-        elif role == Roles.ADMIN:
-            access = obj.admin_has_access(request.user)
+        return request.user.role != Roles.STUDENT
 
-        elif role == Roles.SUPERADMIN:
-            access = obj.superadmin_has_access(request.user)
+    def has_object_permission(self, request, view, obj: ModelPermissionsMixin):
+        return self.get_access(request.user, obj)[1]
 
-        return access[0] if is_read else access[1] if is_write else access[2]
 
 class AllowAllAuthenticatedUsers(BasePermission):
     """
@@ -0,0 +1,108 @@
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils.timezone import now
+from oauth2_provider.models import get_access_token_model, get_grant_model, get_refresh_token_model
+from oauth2_provider.settings import oauth2_settings
+
+from .models import RevokedToken, UserTokenRevocation
+
+
+@dataclass
+class PurgeResult:
+    """
+    The rows purged from one model and the time it took.
+    """
+
+    name: str
+    deleted: int
+    seconds: float
+
+    @property
+    def rate(self):
+        return self.deleted / self.seconds if self.seconds else 0.0
+
+
+def _expired_queries():
+    """
+    Return the purged models in deletion order, with the query of their expired rows.
+
+    Refresh tokens go first: an expired access token is kept while a refresh
+    token can still use it to issue a new one. Refresh tokens are purged once
+    revoked, once their access token is gone, or `REFRESH_TOKEN_EXPIRE_SECONDS`
+    after their access token expired.
+    """
+    current_time = now()
+    revoked_before = current_time - timedelta(seconds=oauth2_settings.REFRESH_TOKEN_GRACE_PERIOD_SECONDS or 0)
+    refresh_query = Q(revoked__lte=revoked_before) | Q(revoked__isnull=True, access_token__isnull=True)
+    if oauth2_settings.REFRESH_TOKEN_EXPIRE_SECONDS:
+        idle_before = current_time - timedelta(seconds=oauth2_settings.REFRESH_TOKEN_EXPIRE_SECONDS)
+        refresh_query |= Q(revoked__isnull=True, access_token__expires__lte=idle_before)
+
+    return [
+        ("refresh tokens", get_refresh_token_model(), refresh_query),
+        ("access tokens", get_access_token_model(), Q(refresh_token__isnull=True, expires__lt=current_time)),
+        ("grants", get_grant_model(), Q(expires__lt=current_time)),
+        ("revoked signed tokens", RevokedToken, Q(expires__lte=current_time)),
+        ("user token revocations", UserTokenRevocation, Q(expires__lte=current_time)),
+    ]
+
+
+def purge_model(model, query, batch_size, pause=0):
+    """
+    Delete the rows of a model matching a query, in batches of primary keys.
+
+    Each batch deletes the matching rows of a range of at most `batch_size`
+    primary keys in its own transaction, so locks are held only briefly and
+    concurrent logins are not blocked behind one long delete.
+
+    Args:
+        model (Model): The model to purge.
+        query (Q): The rows to delete.
+        batch_size (int): The maximum number of rows per batch.
+        pause (float): Seconds to sleep between batches.
+
+    Returns:
+        int: The number of rows deleted.
+    """
+    deleted = 0
+    last_pk = None
+    while True:
+        candidates = model.objects.filter(query)
+        if last_pk is not None:
+            candidates = candidates.filter(pk__gt=last_pk)
+        pks = list(candidates.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return deleted
+
+        with transaction.atomic():
+            _, per_model = model.objects.filter(query, pk__gte=pks[0], pk__lte=pks[-1]).delete()
+        deleted += per_model.get(model._meta.label, 0)
+        last_pk = pks[-1]
+
+        if len(pks) < batch_size:
+            return deleted
+        if pause:
+            time.sleep(pause)
+
+
+def purge_expired(batch_size, pause=0):
+    """
+    Delete expired OAuth2 tokens and grants, and revocations of expired signed tokens.
+
+    Args:
+        batch_size (int): The maximum number of rows deleted per transaction.
+        pause (float): Seconds to sleep between batches.
+
+    Returns:
+        list[PurgeResult]: The rows purged per model.
+    """
+    results = []
+    for name, model, query in _expired_queries():
+        started = time.perf_counter()
+        deleted = purge_model(model, query, batch_size, pause)
+        results.append(PurgeResult(name, deleted, time.perf_counter() - started))
+    return results
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from oauth2_provider.models import AccessToken
+
+from ..user.models import User
+from .signed_tokens import revoke_user_signed_tokens
+from .token_cache import invalidate_token
+
+
+@receiver([post_save, post_delete], sender=AccessToken)
+def invalidate_access_token(sender, instance, **kwargs):
+    # Covers logout, refresh token rotation and revocation, which delete the access token
+    invalidate_token(instance.token)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, created, **kwargs):
+    # Cached tokens carry the user, so role or status changes must reload it
+    if not created:
+        for token in AccessToken.objects.filter(user=instance).values_list("token", flat=True):
+            invalidate_token(token)
+
+
+@receiver(post_save, sender=User)
+def revoke_user_signed_tokens_on_access_change(sender, instance, created, **kwargs):
+    # Signed tokens carry the role and are trusted until they expire, so they
+    # must not outlive a role change or a deactivation
+    access = (instance.role, instance.is_active)
+    loaded_access = getattr(instance, "_loaded_access", None)
+    if not created and loaded_access is not None and loaded_access != access:
+        revoke_user_signed_tokens(instance)
+    instance._loaded_access = access
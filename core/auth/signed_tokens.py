@@ -0,0 +1,147 @@
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core import signing
+from django.utils.timezone import now
+from oauth2_provider.settings import oauth2_settings
+
+from .constants import SIGNED_TOKEN_MODE
+from .models import RevokedToken, UserTokenRevocation
+
+
+SIGNED_TOKEN_SALT = "core.auth.signed_token"
+
+
+def signed_tokens_enabled():
+    """
+    Whether login issues signed tokens, per the `AUTH_TOKEN_MODE` setting.
+    """
+    return settings.AUTH_TOKEN_MODE == SIGNED_TOKEN_MODE
+
+
+def issue_signed_token(user):
+    """
+    Create a self-contained access token for a user.
+
+    The token is a signed JSON payload carrying a token ID (`jti`), the user ID
+    (`uid`), the role and the issue and expiry timestamps (`iat`, `exp`), so
+    that it can be verified without a database lookup.
+
+    Args:
+        user (User): The authenticated user.
+
+    Returns:
+        tuple[str, dict]: The token and its claims.
+    """
+    issued_at = time.time()
+    claims = {
+        "jti": uuid.uuid4().hex,
+        "uid": user.pk,
+        "role": user.role,
+        "iat": issued_at,
+        "exp": int(issued_at) + oauth2_settings.ACCESS_TOKEN_EXPIRE_SECONDS,
+    }
+    return signing.dumps(claims, salt=SIGNED_TOKEN_SALT), claims
+
+
+def read_signed_token(token):
+    """
+    Return the claims of a valid, unexpired signed token, or None.
+
+    Revocation is not checked here; see `revocations.is_revoked()`.
+    """
+    try:
+        claims = signing.loads(token, salt=SIGNED_TOKEN_SALT)
+    except signing.BadSignature:
+        return None
+    if not isinstance(claims, dict) or claims.get("exp", 0) <= time.time():
+        return None
+    return claims
+
+
+def _issued_at(claims):
+    # Tokens issued before `iat` was added are dated from their expiry
+    return claims.get("iat", claims["exp"] - oauth2_settings.ACCESS_TOKEN_EXPIRE_SECONDS)
+
+
+class RevocationList:
+    """
+    The IDs of revoked, unexpired signed tokens, and the revocation cutoffs of
+    users, held in memory by each worker.
+
+    Both are reloaded from `RevokedToken` and `UserTokenRevocation` at most
+    every `SIGNED_TOKEN_REVOCATION_REFRESH` seconds, so a token revoked on
+    another worker is rejected here within that delay. They only hold
+    revocations made during the last token lifetime, so they stay small.
+    """
+
+    def __init__(self):
+        self._jtis = frozenset()
+        self._cutoffs = {}
+        self._refreshed_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def is_revoked(self, claims):
+        """
+        Whether the token was revoked, or issued before its user's revocation cutoff.
+        """
+        if time.monotonic() - self._refreshed_at >= settings.SIGNED_TOKEN_REVOCATION_REFRESH:
+            self.refresh()
+        cutoff = self._cutoffs.get(claims["uid"])
+        return claims["jti"] in self._jtis or (cutoff is not None and _issued_at(claims) < cutoff)
+
+    def refresh(self):
+        current_time = now()
+        with self._lock:
+            self._jtis = frozenset(
+                RevokedToken.objects.filter(expires__gt=current_time).values_list("jti", flat=True)
+            )
+            self._cutoffs = {
+                user_id: issued_before.timestamp()
+                for user_id, issued_before in UserTokenRevocation.objects.filter(
+                    expires__gt=current_time
+                ).values_list("user_id", "issued_before")
+            }
+            self._refreshed_at = time.monotonic()
+
+    def add(self, jti):
+        with self._lock:
+            self._jtis = self._jtis | {jti}
+
+    def add_cutoff(self, user_id, timestamp):
+        with self._lock:
+            self._cutoffs = {**self._cutoffs, user_id: timestamp}
+
+
+revocations = RevocationList()
+
+
+def revoke_signed_token(claims):
+    """
+    Revoke a signed token until it expires, on every worker.
+    """
+    RevokedToken.objects.get_or_create(
+        jti=claims["jti"],
+        defaults={"expires": datetime.fromtimestamp(claims["exp"], tz=timezone.utc)},
+    )
+    revocations.add(claims["jti"])
+
+
+def revoke_user_signed_tokens(user):
+    """
+    Revoke every signed token issued to a user so far, on every worker.
+
+    Tokens issued afterwards carry the user's current role and are accepted.
+    """
+    issued_before = now()
+    UserTokenRevocation.objects.update_or_create(
+        user=user,
+        defaults={
+            "issued_before": issued_before,
+            "expires": issued_before + timedelta(seconds=oauth2_settings.ACCESS_TOKEN_EXPIRE_SECONDS),
+        },
+    )
+    revocations.add_cutoff(user.pk, issued_before.timestamp())
@@ -2,15 +2,29 @@ from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIRequestFactory
 from rest_framework import status
-from oauth2_provider.models import Application, AccessToken, RefreshToken
+from oauth2_provider.models import Application, AccessToken, Grant, RefreshToken
 from django.utils.timezone import now
 from datetime import timedelta
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from django.core.cache import cache
+from django.core.management import call_command
+from io import StringIO
+from rest_framework.request import Request
 from django.contrib.auth.models import AnonymousUser
 
 from core.user.models import User, Roles
+from django.test import override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from core.auth.authentication import CachedOAuth2Authentication, SignedTokenAuthentication
+from core.auth.models import RevokedToken
+from core.auth.oauth2_tokens import issue_tokens
+from core.auth.purge import purge_expired
+from core.auth.throttling import CacheSlidingWindowCounter, LocalSlidingWindowCounter
+from core.auth.signed_tokens import read_signed_token, revocations
 from core.auth.permissions import RoleBasedPermission, AllowAllAuthenticatedUsers
+from core.auth.token_cache import get_cached_token
+from core.utils.cache import LRUCache
 from core.auth.serializers import (
     LoginSerializer, SignupSerializer, LogoutSerializer,
     ChangePasswordSerializer, PasswordResetSerializer
@@ -146,6 +160,27 @@ class TestLoginView(APITestCase):
         response = self.client.post(self.url, self.valid_data)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)  # Changed to 401
 
+    def test_login_issues_tokens_without_grant(self):
+        response = self.client.post(self.url, self.valid_data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        assert not Grant.objects.exists()
+        access_token = AccessToken.objects.get(token=response.data['access_token'])
+        assert access_token.refresh_token.token == response.data['refresh_token']
+
+    def test_issuance_writes_both_tokens_atomically(self):
+        # Savepoint, access token, refresh token, release
+        with self.assertNumQueries(4):
+            issue_tokens(self.user, self.application, 'read write')
+
+    @override_settings(LOGIN_REUSE_ACCESS_TOKEN=True)
+    def test_repeated_logins_reuse_valid_token(self):
+        first = self.client.post(self.url, self.valid_data).data
+        with self.assertNumQueries(1):
+            access_token, refresh_token = issue_tokens(self.user, self.application, 'read write')
+        assert access_token.token == first['access_token']
+        assert refresh_token.token == first['refresh_token']
+        assert AccessToken.objects.filter(user=self.user).count() == 1
+
 from rest_framework_simplejwt.tokens import RefreshToken as SimpleJWTRefreshToken
 
 class TestLogoutView(APITestCase):
@@ -191,6 +226,257 @@ class TestLogoutView(APITestCase):
         response = self.client.post(self.url, {'token': 'invalid_token'})
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+class TestCachedOAuth2Authentication(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory.create()
+        self.application = ApplicationFactory.create(self.user)
+        self.access_token = AccessToken.objects.create(
+            user=self.user,
+            token=f'cached_{self.user.pk}',
+            application=self.application,
+            expires=now() + timedelta(hours=1),
+            scope='read write'
+        )
+
+    def authenticate(self, token):
+        request = Request(APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+        return CachedOAuth2Authentication().authenticate(request)
+
+    def test_hot_tokens_skip_the_database(self):
+        user, access_token = self.authenticate(self.access_token.token)
+        assert user == self.user
+        with self.assertNumQueries(0):
+            user, access_token = self.authenticate(self.access_token.token)
+        assert access_token.pk == self.access_token.pk
+
+    def test_each_request_gets_its_own_instances(self):
+        self.authenticate(self.access_token.token)
+        user, access_token = self.authenticate(self.access_token.token)
+        user.first_name = 'Changed'
+        access_token.scope = 'changed'
+
+        other_user, other_access_token = self.authenticate(self.access_token.token)
+        assert other_user is not user and other_access_token is not access_token
+        assert other_user.first_name == self.user.first_name
+        assert other_access_token.scope == 'read write'
+        assert other_access_token.user is other_user
+
+    def test_deleted_tokens_are_invalidated(self):
+        self.authenticate(self.access_token.token)
+        RefreshToken.objects.create(
+            user=self.user, token=f'refresh_{self.user.pk}', application=self.application,
+            access_token=self.access_token,
+        ).revoke()
+        assert self.authenticate(self.access_token.token) is None
+
+    def test_entries_expire_with_the_token(self):
+        self.authenticate(self.access_token.token)
+        assert get_cached_token(self.access_token.token) is not None
+        with patch('django.utils.timezone.now', return_value=now() + timedelta(hours=2)):
+            assert get_cached_token(self.access_token.token) is None
+
+    def test_lru_evicts_least_recently_used(self):
+        lru = LRUCache(max_size=2)
+        lru.set('a', 1, 60)
+        lru.set('b', 2, 60)
+        lru.get('a')
+        lru.set('c', 3, 60)
+        assert lru.get('b') is None
+        assert lru.get('a') == 1 and lru.get('c') == 3
+
+
+@override_settings(AUTH_TOKEN_MODE='signed')
+class TestSignedTokenMode(APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create()
+        self.application = ApplicationFactory.create(self.user)
+        response = self.client.post(reverse('login'), {
+            'email': self.user.email, 'password': 'testpass123', 'client_id': self.application.client_id,
+        })
+        self.token = response.data['access_token']
+
+    def authenticate(self):
+        request = Request(APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {self.token}'))
+        return SignedTokenAuthentication().authenticate(request)
+
+    def test_login_issues_signed_token(self):
+        assert not AccessToken.objects.filter(user=self.user).exists()
+        claims = read_signed_token(self.token)
+        assert claims['uid'] == self.user.id
+        assert claims['role'] == self.user.role
+
+    def test_authentication_needs_no_queries(self):
+        revocations.refresh()
+        with self.assertNumQueries(0):
+            user, claims = self.authenticate()
+        assert user.pk == self.user.pk
+        assert user.role == self.user.role
+
+    def test_logout_revokes_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        response = self.client.post(reverse('logout_custom'), {'token': self.token})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert RevokedToken.objects.filter(jti=read_signed_token(self.token)['jti']).exists()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deactivated_users_are_rejected(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.is_active = False
+        user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_role_changes_revoke_earlier_tokens_only(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.first_name = 'Renamed'
+        user.save()
+        assert self.authenticate()[0].role == self.user.role
+
+        user.role = Roles.ADMIN
+        user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+        # Revoked on other workers once they refresh their revocation lists
+        revocations.refresh()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+        self.token = self.client.post(reverse('login'), {
+            'email': self.user.email, 'password': 'testpass123', 'client_id': self.application.client_id,
+        }).data['access_token']
+        assert self.authenticate()[0].role == Roles.ADMIN
+
+    def test_tampered_tokens_are_rejected(self):
+        assert read_signed_token(self.token[:-1] + ('A' if self.token[-1] != 'A' else 'B')) is None
+
+
+@override_settings(LOGIN_THROTTLE_IP_RATE=(100, 60), LOGIN_THROTTLE_EMAIL_RATE=(3, 60))
+class TestLoginThrottle(APITestCase):
+    def setUp(self):
+        cache.clear()
+        # Attempts straddling a window boundary would partly expire
+        clock = patch('core.auth.throttling.time.time', return_value=6000.0)
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.user = UserFactory.create()
+        self.application = ApplicationFactory.create(self.user)
+        self.data = {'email': self.user.email, 'password': 'wrongpass', 'client_id': self.application.client_id}
+
+    def test_rejects_attempts_before_authenticating(self):
+        for _ in range(3):
+            assert self.client.post(reverse('login'), self.data).status_code == status.HTTP_401_UNAUTHORIZED
+
+        with patch('core.auth.views.login.authenticate') as authenticate:
+            response = self.client.post(reverse('login'), {**self.data, 'email': self.user.email.upper()})
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert 'Retry-After' in response
+        authenticate.assert_not_called()
+
+    @override_settings(LOGIN_THROTTLE_IP_RATE=(2, 60))
+    def test_limits_attempts_per_ip(self):
+        for index in range(2):
+            self.client.post(reverse('login'), {**self.data, 'email': f'ip_{index}@example.com'})
+        response = self.client.post(reverse('login'), {**self.data, 'email': 'ip_other@example.com'})
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    @override_settings(LOGIN_THROTTLE_IP_RATE=(2, 60))
+    def test_forged_forwarded_for_does_not_reset_the_ip_limit(self):
+        for index in range(2):
+            self.client.post(
+                reverse('login'), {**self.data, 'email': f'xff_{index}@example.com'},
+                HTTP_X_FORWARDED_FOR=f'10.0.0.{index}',
+            )
+        response = self.client.post(
+            reverse('login'), {**self.data, 'email': 'xff_other@example.com'}, HTTP_X_FORWARDED_FOR='10.0.0.99'
+        )
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    @override_settings(LOGIN_THROTTLE_IP_RATE=(2, 60))
+    def test_non_object_body_is_throttled_by_ip(self):
+        for body in (['not', 'an', 'object'], 'scalar', ['again']):
+            response = self.client.post(reverse('login'), body, format='json')
+            assert response.status_code != status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    @override_settings(LOGIN_THROTTLE_BACKEND='local')
+    def test_password_reset_is_throttled(self):
+        email = {'email': 'not-an-email'}
+        responses = [self.client.post(reverse('password_reset'), email).status_code for _ in range(4)]
+        assert responses[-1] == status.HTTP_429_TOO_MANY_REQUESTS
+        assert status.HTTP_429_TOO_MANY_REQUESTS not in responses[:-1]
+
+    def test_window_slides_over_previous_counts(self):
+        for counter in (LocalSlidingWindowCounter(100), CacheSlidingWindowCounter()):
+            with patch('core.auth.throttling.time.time', return_value=6000.0):
+                assert counter.attempt('slide', 2, 60) == 0
+                assert counter.attempt('slide', 2, 60) == 0
+                assert counter.attempt('slide', 2, 60) == 60
+            # Halfway through the next window, half of the previous attempts still count
+            with patch('core.auth.throttling.time.time', return_value=6090.0):
+                assert counter.attempt('slide', 2, 60) == 0
+                assert counter.attempt('slide', 2, 60) > 0
+
+
+class TestPurgeExpiredTokens(TestCase):
+    def setUp(self):
+        self.user = UserFactory.create()
+        self.application = ApplicationFactory.create(self.user)
+
+    def access_token(self, token, expires_in):
+        return AccessToken.objects.create(
+            user=self.user, token=token, application=self.application,
+            expires=now() + timedelta(seconds=expires_in), scope='read',
+        )
+
+    def test_purges_only_expired_rows(self):
+        for index in range(3):
+            self.access_token(f'expired_{index}', -60)
+        refreshable = self.access_token('refreshable', -60)
+        RefreshToken.objects.create(
+            user=self.user, token='refresh', application=self.application, access_token=refreshable,
+        )
+        valid = self.access_token('valid', 3600)
+        Grant.objects.create(
+            user=self.user, application=self.application, code='code',
+            expires=now() - timedelta(seconds=60), redirect_uri='', scope='read',
+        )
+        RevokedToken.objects.create(jti='expired', expires=now() - timedelta(seconds=60))
+        RevokedToken.objects.create(jti='live', expires=now() + timedelta(seconds=60))
+
+        results = {result.name: result.deleted for result in purge_expired(batch_size=2)}
+
+        assert results == {
+            'refresh tokens': 0, 'access tokens': 3, 'grants': 1, 'revoked signed tokens': 1,
+            'user token revocations': 0,
+        }
+        assert set(AccessToken.objects.values_list('pk', flat=True)) == {refreshable.pk, valid.pk}
+        assert list(RevokedToken.objects.values_list('jti', flat=True)) == ['live']
+
+    def test_refresh_tokens_outlive_their_access_token_by_their_lifetime(self):
+        stale = self.access_token('stale', -2 * 86400)
+        RefreshToken.objects.create(user=self.user, token='stale', application=self.application, access_token=stale)
+        RefreshToken.objects.create(
+            user=self.user, token='revoked', application=self.application, revoked=now() - timedelta(seconds=1),
+        )
+
+        purge_expired(batch_size=10)
+
+        assert not RefreshToken.objects.exists()
+        assert not AccessToken.objects.exists()
+
+    def test_command_reports_throughput(self):
+        self.access_token('expired', -60)
+        out = StringIO()
+        call_command('purge_expired_tokens', batch_size=10, stdout=out)
+        assert 'Purged 1 access tokens' in out.getvalue()
+        assert 'rows/s' in out.getvalue()
+
+
 class TestChangePasswordView(APITestCase):
     def setUp(self):
         self.url = reverse('change_password')
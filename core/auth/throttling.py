@@ -0,0 +1,147 @@
+import threading
+import time
+from collections.abc import Mapping
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+from ..utils.cache import LRUCache
+
+
+class SlidingWindowCounter:
+    """
+    Counts attempts per key over a sliding window, approximated from two fixed windows.
+
+    The count at a given time is the count of the current window plus the count
+    of the previous window weighted by how much of it still overlaps the
+    sliding window. This needs two counters per key instead of a timestamp per
+    attempt, and does not let a burst through at every window boundary.
+    """
+
+    def attempt(self, key, limit, window):
+        """
+        Record an attempt for `key`, unless `limit` attempts were made in the last `window` seconds.
+
+        Args:
+            key (str): What the attempts are counted for, like an IP address.
+            limit (int): The attempts allowed per window.
+            window (int): The window length in seconds.
+
+        Returns:
+            float: 0 if the attempt is allowed, otherwise the seconds to wait
+            before the next attempt is allowed.
+        """
+        now = time.time()
+        index, offset = divmod(now, window)
+        current_key, previous_key = f"{key}:{int(index)}", f"{key}:{int(index) - 1}"
+        overlap = 1 - offset / window
+
+        current, previous = self.get_counts(current_key, previous_key)
+        if current + previous * overlap >= limit:
+            if current >= limit or not previous:
+                return window - offset
+            # The weight of the previous window decreases until the count drops below the limit
+            return max(window - offset - (limit - current) / previous * window, 1)
+
+        # Counters outlive their window while they are the previous window of another one
+        self.increment(current_key, 2 * window)
+        return 0
+
+    def get_counts(self, *keys):
+        raise NotImplementedError
+
+    def increment(self, key, timeout):
+        raise NotImplementedError
+
+
+class LocalSlidingWindowCounter(SlidingWindowCounter):
+    """
+    Counts attempts in memory, per worker process.
+
+    Limits are enforced by each worker separately, so the effective limit is
+    multiplied by the number of workers.
+    """
+
+    def __init__(self, max_size):
+        self._counts = LRUCache(max_size)
+        self._lock = threading.Lock()
+
+    def get_counts(self, *keys):
+        return [self._counts.get(key, 0) for key in keys]
+
+    def increment(self, key, timeout):
+        with self._lock:
+            self._counts.set(key, self._counts.get(key, 0) + 1, timeout)
+
+
+class CacheSlidingWindowCounter(SlidingWindowCounter):
+    """
+    Counts attempts in the shared cache, so limits hold across workers.
+    """
+
+    def get_counts(self, *keys):
+        counts = cache.get_many(keys)
+        return [counts.get(key, 0) for key in keys]
+
+    def increment(self, key, timeout):
+        if not cache.add(key, 1, timeout):
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Expired between add() and incr()
+                cache.set(key, 1, timeout)
+
+
+_local_counter = None
+
+
+def get_counter():
+    """
+    Return the counter of the `LOGIN_THROTTLE_BACKEND` setting, "local" or "cache".
+    """
+    global _local_counter
+    if settings.LOGIN_THROTTLE_BACKEND == "local":
+        if _local_counter is None:
+            _local_counter = LocalSlidingWindowCounter(settings.LOGIN_THROTTLE_LOCAL_SIZE)
+        return _local_counter
+    return CacheSlidingWindowCounter()
+
+
+class LoginThrottle(BaseThrottle):
+    """
+    Limits credential attempts per client IP and per email address.
+
+    Throttles run before the view, so rejected attempts never reach the
+    password hasher. Limits are `(attempts, seconds)` pairs read from the
+    `LOGIN_THROTTLE_IP_RATE` and `LOGIN_THROTTLE_EMAIL_RATE` settings.
+    """
+
+    scope = "login"
+
+    def allow_request(self, request, view):
+        counter = get_counter()
+        self.wait_seconds = counter.attempt(
+            f"throttle:{self.scope}:ip:{self.get_ident(request)}", *settings.LOGIN_THROTTLE_IP_RATE
+        )
+        if self.wait_seconds:
+            return False
+
+        # JSON arrays and scalars are only throttled by IP
+        email = request.data.get("email") if isinstance(request.data, Mapping) else None
+        if isinstance(email, str) and email.strip():
+            self.wait_seconds = counter.attempt(
+                f"throttle:{self.scope}:email:{email.strip().lower()}", *settings.LOGIN_THROTTLE_EMAIL_RATE
+            )
+        return not self.wait_seconds
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class PasswordResetThrottle(LoginThrottle):
+    """
+    Limits password reset requests, which send emails, like login attempts.
+    """
+
+    scope = "password_reset"
@@ -0,0 +1,108 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.timezone import now
+from oauth2_provider.models import get_access_token_model
+
+from ..user.models import User
+from ..utils.cache import LRUCache
+
+
+# Field values of the validated access tokens of this worker and of their users, keyed by token hash
+_local_tokens = LRUCache(settings.ACCESS_TOKEN_CACHE_SIZE)
+
+# Left deferred on cached users, and loaded from the database on first access
+UNCACHED_USER_FIELDS = {"password"}
+
+
+def _token_hash(token):
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _shared_key(token_hash):
+    return f"auth:token:{token_hash}"
+
+
+def get_cached_token(token):
+    """
+    Return the validated `AccessToken` for a bearer token string, if cached.
+
+    The in-process LRU is consulted first, then the shared cache. Local
+    entries live at most `ACCESS_TOKEN_CACHE_LOCAL_TIMEOUT` seconds, after
+    which the shared cache is read again, so an invalidation on one worker
+    reaches the others within that delay.
+
+    Only field values are cached, and each call builds new instances from
+    them, so nothing set on a request's token or user reaches other requests.
+
+    Args:
+        token (str): The bearer token.
+
+    Returns:
+        AccessToken | None: The token with its user, or None. The user's
+        password and the token's application are loaded on first access.
+    """
+    token_hash = _token_hash(token)
+    entry = _local_tokens.get(token_hash)
+    if entry is None:
+        entry = cache.get(_shared_key(token_hash))
+        if entry is None:
+            return None
+        _local_tokens.set(token_hash, entry, _local_timeout(entry["token"]["expires"]))
+
+    access_token = _from_values(get_access_token_model(), entry["token"])
+    if access_token.is_expired():
+        invalidate_token(token)
+        return None
+    access_token.user = _from_values(User, entry["user"])
+    return access_token
+
+
+def cache_token(access_token):
+    """
+    Cache the field values of a validated `AccessToken` and its user, at most until it expires.
+    """
+    timeout = min(settings.ACCESS_TOKEN_CACHE_TIMEOUT, _seconds_left(access_token.expires))
+    if timeout <= 0:
+        return
+    entry = {
+        "token": _values(access_token),
+        "user": _values(access_token.user, exclude=UNCACHED_USER_FIELDS),
+    }
+    token_hash = _token_hash(access_token.token)
+    cache.set(_shared_key(token_hash), entry, timeout)
+    _local_tokens.set(token_hash, entry, _local_timeout(access_token.expires))
+
+
+def invalidate_token(token):
+    """
+    Drop a bearer token from this worker's LRU and from the shared cache.
+    """
+    token_hash = _token_hash(token)
+    _local_tokens.delete(token_hash)
+    cache.delete(_shared_key(token_hash))
+
+
+def _values(instance, exclude=()):
+    deferred = instance.get_deferred_fields()
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if field.attname not in deferred and field.attname not in exclude
+    }
+
+
+def _from_values(model, values):
+    # from_db() expects the loaded values in model field order
+    field_names = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+    return model.from_db(DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names])
+
+
+def _seconds_left(expires):
+    return int((expires - now()).total_seconds())
+
+
+def _local_timeout(expires):
+    return min(settings.ACCESS_TOKEN_CACHE_LOCAL_TIMEOUT, _seconds_left(expires))
@@ -6,12 +6,11 @@ from rest_framework.response import Response
 from rest_framework import status
 from oauth2_provider.models import AccessToken, RefreshToken
 from rest_framework.decorators import api_view, permission_classes
-import requests
 
 from core.auth.permissions import AllowAllAuthenticatedUsers
+from core.auth.signed_tokens import read_signed_token, revoke_signed_token, signed_tokens_enabled
 from core.auth.serializers import LogoutSerializer
 from core.user.models import Roles, User
-from core.hardcodes import ae_url
 
 
 @extend_schema(
@@ -37,6 +36,19 @@ def logout(request):
     user: User = request.user
     print("LALLALALALALAALL")
 
+    claims = read_signed_token(token) if signed_tokens_enabled() else None
+    if claims is not None:
+        if claims["uid"] != user.id and not (
+            claims["role"] == Roles.STUDENT and user.role in [Roles.SUPERADMIN, Roles.ADMIN, Roles.MODERATOR]
+        ):
+            return Response(
+                {"error": "Token does not belong to the authenticated user."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # Rejected by every worker once their revocation lists refresh
+        revoke_signed_token(claims)
+        return Response({"message": "Logged out successfully."}, status=status.HTTP_200_OK)
+
     try:
         # Fetch the AccessToken object
         access_token = AccessToken.objects.get(token=token)
@@ -49,9 +61,7 @@ def logout(request):
                 access_token.delete()
 
                 # try:
-                #     url = f"{ae_url}auth/{access_token.user.id}"
-                #     response = requests.delete(url)
-                #     response.raise_for_status()
+                #     activity_engine.delete(f"auth/{access_token.user.id}")
                 #     print("Successfully logged out on external server.")
                 # except requests.exceptions.RequestException as e:
                 #     print(f"Error in DELETE request: {e}")
@@ -72,9 +82,7 @@ def logout(request):
         access_token.delete()
 
         # try:
-        #     url = f"{ae_url}auth/{user.id}"
-        #     response = requests.delete(url)
-        #     response.raise_for_status()
+        #     activity_engine.delete(f"auth/{user.id}")
         #     print("Successfully logged out on external server.")
         # except requests.exceptions.RequestException as e:
         #     print(f"Error in DELETE request: {e}")
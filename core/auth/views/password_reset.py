@@ -2,10 +2,11 @@ from drf_spectacular.utils import extend_schema
 from rest_framework.response import Response
 from rest_framework import status
 from allauth.account.forms import ResetPasswordForm
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import AllowAny
 
 from core.auth.serializers import PasswordResetSerializer
+from core.auth.throttling import PasswordResetThrottle
 
 
 @extend_schema(
@@ -14,12 +15,14 @@ from core.auth.serializers import PasswordResetSerializer
     responses={
         200: {"type": "object", "properties": {"message": {"type": "string"}}},
         400: {"type": "object", "properties": {"error": {"type": "string"}, "errors": {"type": "object"}}},
+        429: {"type": "object", "properties": {"detail": {"type": "string"}}},
     },
     summary="Password Reset",
     description="Send a password reset email to the specified email address if it exists in the system.",
 )
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@throttle_classes([PasswordResetThrottle])
 def password_reset(request):
     """
     Send a password reset email.
@@ -0,0 +1,92 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from ..user.memberships import forget_memberships, get_memberships
+from ..user.models import Roles
+from ..utils.cache import get_version, bump_version
+
+
+# Bumped when a course's visibility or institutions change, which can affect every user.
+ACCESS_VERSION_KEY = "course-access:version"
+
+# Roles that can access every course; their querysets are never restricted.
+UNRESTRICTED_ROLES = (Roles.SUPERADMIN, Roles.ADMIN)
+
+
+def _user_version_key(user_id):
+    return f"user:{user_id}:course-access:version"
+
+
+def bump_user_access(*user_ids):
+    """
+    Invalidate the accessible course sets and membership snapshots of the given users.
+    """
+    forget_memberships(*user_ids)
+    bump_version(*(_user_version_key(user_id) for user_id in user_ids if user_id is not None))
+
+
+def bump_course_access():
+    """
+    Invalidate the accessible course sets of all users.
+    """
+    bump_version(ACCESS_VERSION_KEY)
+
+
+def compute_accessible_course_ids(user):
+    """
+    Query the IDs of the courses a user can access through their role.
+
+    Args:
+        user (User): A user whose role is not in `UNRESTRICTED_ROLES`.
+
+    Returns:
+        list[int]: The sorted course IDs.
+    """
+    from .models import Course, VisibilityChoices
+
+    memberships = get_memberships(user)
+    if user.role == Roles.MODERATOR:
+        # Moderators manage the courses of their whole institution subtrees
+        condition = Q(institutions__in=memberships.subtree_institution_ids)
+        return sorted(set(Course.objects.filter(condition).values_list("id", flat=True)))
+
+    participating = {
+        Roles.INSTRUCTOR: memberships.instructor_course_ids,
+        Roles.STAFF: memberships.personnel_course_ids,
+        Roles.STUDENT: memberships.enrolled_course_ids,
+    }.get(user.role)
+    if participating is None:
+        return []
+
+    condition = Q(visibility=VisibilityChoices.PUBLIC) | Q(
+        institutions__in=memberships.institution_ids, visibility=VisibilityChoices.PRIVATE
+    )
+    return sorted(participating.union(Course.objects.filter(condition).values_list("id", flat=True)))
+
+
+def accessible_course_ids(user):
+    """
+    Return the IDs of the courses a user can access, from the cache when possible.
+
+    The set is keyed on a global version, bumped when course visibility or
+    institutions change, and on a per-user version, bumped when the user's
+    institutions, enrollments, instructor or personnel assignments change.
+
+    Args:
+        user (User): The user requesting access.
+
+    Returns:
+        list[int] | None: The course IDs, or None if the user can access every course.
+    """
+    if user.role in UNRESTRICTED_ROLES:
+        return None
+
+    key = "user:{}:courses:{}:{}:{}".format(
+        user.pk, user.role, get_version(ACCESS_VERSION_KEY), get_version(_user_version_key(user.pk))
+    )
+    course_ids = cache.get(key)
+    if course_ids is None:
+        course_ids = compute_accessible_course_ids(user)
+        cache.set(key, course_ids, settings.COURSE_ACCESS_CACHE_TIMEOUT)
+    return course_ids
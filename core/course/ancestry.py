@@ -0,0 +1,86 @@
+from ..auth.permissions import BatchPermissionsMixin
+
+
+def _follow(obj, path):
+    for name in path.split("__"):
+        obj = getattr(obj, name)
+    return obj
+
+
+def owning_courses(objects):
+    """
+    Resolve the course that owns each of many content objects of one model.
+
+    Objects with a `course_path` foreign key chain, such as sections, are
+    fetched again with the whole chain in one `select_related` query. Section
+    items, such as assessments, and their children, such as questions, are
+    looked up through their `SectionItemInfo` placement in one query; an item
+    placed in several sections belongs to the course of its first placement.
+
+    Args:
+        objects (Iterable[CourseContentPermissionsMixin]): Instances of one model.
+
+    Returns:
+        dict: The owning `Course` keyed by object pk, or None for items that
+            are not placed in any section.
+    """
+    from .models import SectionItemInfo
+
+    objects = list(objects)
+    if not objects:
+        return {}
+    model = type(objects[0])
+    ids = [obj.pk for obj in objects]
+
+    if model.course_path is not None:
+        rows = model._base_manager.filter(pk__in=ids).select_related(model.course_path)
+        return {row.pk: _follow(row, model.course_path) for row in rows}
+
+    item_ids = {obj.pk: getattr(obj, model.course_item_field) for obj in objects}
+    placements = (
+        SectionItemInfo.objects.filter(item_type=model.course_item_type, item_id__in=set(item_ids.values()))
+        .select_related("section__module__course")
+        .order_by("-id")
+    )
+    # Later placements are overwritten by earlier ones
+    courses = {placement.item_id: placement.section.module.course for placement in placements}
+    return {pk: courses.get(item_id) for pk, item_id in item_ids.items()}
+
+
+class CourseContentPermissionsMixin(BatchPermissionsMixin):
+    """
+    For models whose access is the access to the course that owns them.
+
+    Subclasses set either `course_path`, the foreign key chain to the course,
+    or `course_item_type` and `course_item_field`, the section item type and
+    the field holding its ID.
+    """
+
+    course_path = None
+    course_item_type = None
+    course_item_field = "pk"
+
+    @classmethod
+    def role_access_for(cls, role, user, objects):
+        """
+        Resolve the access of a user with `role` to many content objects, with
+        one query for their courses and the course rules for the rest.
+
+        Items that are not placed in any course are only accessible to admins.
+        """
+        from .models import Course
+        from ..user.models import Roles
+
+        courses = owning_courses(objects)
+        course_access = Course.role_access_for(role, user, {course for course in courses.values() if course})
+        unowned_access = {
+            Roles.SUPERADMIN: (True, True, True),
+            Roles.ADMIN: (True, True, False),
+        }.get(role, (False, False, False))
+        return {
+            pk: course_access[course.pk] if course else unowned_access
+            for pk, course in courses.items()
+        }
+
+    class Meta:
+        abstract = True
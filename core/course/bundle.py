@@ -0,0 +1,145 @@
+from django.db import transaction
+
+from .constants import BULK_CREATE_BATCH_SIZE, SEQUENCE_GAP
+from .counters import rebuild_counters
+from .models import Article, Course, Module, Section, SectionItemInfo, SectionItemType, Source, Video
+from ..assessment.bulk import bulk_create_questions
+from ..assessment.models import Assessment
+
+
+def _bulk_create(model, objects):
+    return model.objects.bulk_create(objects, batch_size=BULK_CREATE_BATCH_SIZE)
+
+
+def _create_videos(items):
+    """
+    Create the videos of a bundle, reusing existing segments and sources.
+
+    Returns:
+        list[int]: The video ID of each item, in order.
+    """
+    urls = {item["source"] for item in items}
+    Source.objects.bulk_create(
+        [Source(url=url) for url in urls], batch_size=BULK_CREATE_BATCH_SIZE, ignore_conflicts=True
+    )
+
+    existing = {
+        (source_id, start_time, end_time): pk
+        for pk, source_id, start_time, end_time in Video.objects.filter(source_id__in=urls).values_list(
+            "id", "source_id", "start_time", "end_time"
+        )
+    }
+    missing = [
+        item for item in items if (item["source"], item["start_time"], item["end_time"]) not in existing
+    ]
+    created = _bulk_create(Video, [
+        Video(
+            source_id=item["source"],
+            transcript=item.get("transcript"),
+            start_time=item["start_time"],
+            end_time=item["end_time"],
+        )
+        for item in missing
+    ])
+    existing.update(
+        ((video.source_id, video.start_time, video.end_time), video.id) for video in created
+    )
+    return [existing[(item["source"], item["start_time"], item["end_time"])] for item in items]
+
+
+def create_course_from_bundle(data):
+    """
+    Insert a course tree validated by `CourseBundleSerializer`.
+
+    Each model is inserted with `bulk_create`, level by level, and parents are
+    linked to their children in memory, so the number of queries depends on
+    the size of the bundle only through the batch size.
+
+    Args:
+        data (dict): The validated bundle.
+
+    Returns:
+        Course: The created course.
+    """
+    with transaction.atomic():
+        course = Course.objects.create(
+            name=data["name"],
+            description=data["description"],
+            visibility=data.get("visibility", Course._meta.get_field("visibility").default),
+        )
+        course.institutions.set(data.get("institutions", []))
+
+        modules_data = data.get("modules", [])
+        modules = _bulk_create(Module, [
+            Module(
+                course=course,
+                title=module["title"],
+                description=module["description"],
+                sequence=SEQUENCE_GAP * position,
+            )
+            for position, module in enumerate(modules_data, start=1)
+        ])
+
+        sections_data = [
+            (module, position, section)
+            for module, module_data in zip(modules, modules_data)
+            for position, section in enumerate(module_data.get("sections", []), start=1)
+        ]
+        sections = _bulk_create(Section, [
+            Section(
+                module=module,
+                title=section["title"],
+                description=section["description"],
+                sequence=SEQUENCE_GAP * position,
+            )
+            for module, position, section in sections_data
+        ])
+
+        items = [
+            (section, position, item)
+            for section, (_, _, section_data) in zip(sections, sections_data)
+            for position, item in enumerate(section_data.get("items", []), start=1)
+        ]
+        by_type = {item_type: [] for item_type in SectionItemType.values}
+        for _, _, item in items:
+            by_type[item["item_type"]].append(item)
+
+        assessments = _bulk_create(Assessment, [
+            Assessment(
+                title=item["title"],
+                question_visibility_limit=item["question_visibility_limit"],
+                time_limit=item["time_limit"],
+            )
+            for item in by_type[SectionItemType.ASSESSMENT]
+        ])
+        item_ids = {
+            SectionItemType.VIDEO: iter(_create_videos(by_type[SectionItemType.VIDEO])),
+            SectionItemType.ARTICLE: iter(
+                article.id
+                for article in _bulk_create(Article, [
+                    Article(content=item["content"]) for item in by_type[SectionItemType.ARTICLE]
+                ])
+            ),
+            SectionItemType.ASSESSMENT: iter(assessment.id for assessment in assessments),
+        }
+
+        _bulk_create(SectionItemInfo, [
+            SectionItemInfo(
+                section=section,
+                sequence=SEQUENCE_GAP * position,
+                item_type=item["item_type"],
+                item_id=next(item_ids[item["item_type"]]),
+            )
+            for section, position, item in items
+        ])
+
+        bulk_create_questions([
+            {**question, "assessment": assessment}
+            for assessment, item in zip(assessments, by_type[SectionItemType.ASSESSMENT])
+            for question in item.get("questions", [])
+        ])
+
+        # Bulk inserts skip the signals that maintain the counters
+        rebuild_counters([course.id])
+
+    return course
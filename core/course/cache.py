@@ -0,0 +1,129 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Course, Section, SectionItemInfo
+from .items import resolve_section_items
+from .outline import with_outline
+from .serializers import (
+    CourseDetailSerializer,
+    ModuleListSerializer,
+    ModuleDetailSerializer,
+    SectionListSerializer,
+    SectionDetailSerializer,
+)
+from ..utils.cache import get_version, bump_version
+
+
+def _version_key(course_id):
+    return f"course:{course_id}:version"
+
+
+def _tree_key(course_id, version):
+    return f"course:{course_id}:tree:{version}"
+
+
+def get_course_version(course_id):
+    """
+    Return the current content version of a course.
+    """
+    return get_version(_version_key(course_id))
+
+
+def get_course_versions(course_ids):
+    """
+    Return the current content versions of several courses, keyed by course ID.
+
+    Versions are read with one cache round trip; only missing ones are created.
+    """
+    keys = {course_id: _version_key(course_id) for course_id in course_ids}
+    versions = cache.get_many(keys.values())
+    return {
+        course_id: versions[key] if key in versions else get_version(key)
+        for course_id, key in keys.items()
+    }
+
+
+def bump_course_version(*course_ids):
+    """
+    Invalidate the cached trees of the given courses by moving them to a new version.
+    """
+    bump_version(*(_version_key(course_id) for course_id in course_ids if course_id is not None))
+
+
+def course_ids_for_section(section_id):
+    return set(
+        Section.objects.filter(id=section_id).values_list("module__course_id", flat=True)
+    )
+
+
+def course_ids_for_item(item_type, item_id):
+    """
+    Return the IDs of the courses whose sections reference the given item.
+    """
+    return set(
+        SectionItemInfo.objects.filter(item_type=item_type, item_id=item_id).values_list(
+            "section__module__course_id", flat=True
+        )
+    )
+
+
+def build_course_tree(course_id):
+    """
+    Materialize the serialized content of a course.
+
+    Returns:
+        dict: The course detail, and per-module and per-section list and detail
+        payloads with their children in sequence order.
+
+    Raises:
+        Course.DoesNotExist: If no course exists with the given ID.
+    """
+    course = with_outline(
+        Course.objects.filter(id=course_id).prefetch_related("institutions", "instructors")
+    ).get()
+
+    modules = {}
+    sections = {}
+    section_items = []
+    for module in course.modules.all():
+        module_sections = list(module.sections.all())
+        modules[module.id] = {
+            "list": ModuleListSerializer(module).data,
+            "detail": ModuleDetailSerializer(module).data,
+            "sections": [section.id for section in module_sections],
+        }
+        for section in module_sections:
+            items = list(section.section_item_info.all())
+            sections[section.id] = {
+                "list": SectionListSerializer(section).data,
+                "detail": SectionDetailSerializer(section).data,
+                "position": (module.sequence, section.sequence),
+                "items": [],
+            }
+            section_items.extend(items)
+
+    # Resolve every item of the course at once: one query per item type.
+    for item in resolve_section_items(section_items):
+        sections[item["section"]]["items"].append(item)
+
+    return {
+        "course": CourseDetailSerializer(course).data,
+        "modules": modules,
+        "module_order": [module.id for module in course.modules.all()],
+        "sections": sections,
+    }
+
+
+def get_course_tree(course_id):
+    """
+    Return the materialized course tree, building and caching it on a miss.
+
+    The tree is stored under the course's current content version, so any
+    content change makes the next read rebuild it.
+    """
+    key = _tree_key(course_id, get_course_version(course_id))
+    tree = cache.get(key)
+    if tree is None:
+        tree = build_course_tree(course_id)
+        cache.set(key, tree, timeout=settings.COURSE_TREE_CACHE_TIMEOUT)
+    return tree
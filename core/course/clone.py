@@ -0,0 +1,122 @@
+from django.db import transaction
+
+from .constants import BULK_CREATE_BATCH_SIZE
+from .models import Article, CourseInstructor, Module, Section, SectionItemInfo, SectionItemType
+from ..assessment.models import (
+    Assessment,
+    Question,
+    QuestionOption,
+    NATSolution,
+    DescriptiveSolution,
+    MCQSolution,
+    MSQSolution,
+)
+
+
+def _copy(obj, **changes):
+    """
+    Return an unsaved copy of `obj` with the given field values replaced.
+    """
+    values = {
+        field.attname: getattr(obj, field.attname)
+        for field in obj._meta.concrete_fields
+        if not field.primary_key
+    }
+    values.update(changes)
+    return type(obj)(**values)
+
+
+def _clone_all(originals, **remap):
+    """
+    Bulk insert copies of `originals`, remapping foreign keys in memory.
+
+    Args:
+        originals (list[Model]): The rows to copy, all of one model.
+        **remap (dict): For a foreign key attname such as `module_id`, the
+            mapping from original to copied IDs.
+
+    Returns:
+        dict: The ID of each copy, keyed by the ID of its original.
+    """
+    if not originals:
+        return {}
+    copies = type(originals[0]).objects.bulk_create(
+        [
+            _copy(obj, **{attname: ids[getattr(obj, attname)] for attname, ids in remap.items()})
+            for obj in originals
+        ],
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+    return {original.pk: copy.pk for original, copy in zip(originals, copies)}
+
+
+def clone_course(course, **changes):
+    """
+    Duplicate a course with its modules, sections, items, articles, assessments,
+    questions, options and solutions.
+
+    Every model is read with one query and written with one `bulk_create`,
+    and foreign keys and `SectionItemInfo.item_id`s are remapped in memory, so
+    the number of queries does not depend on the size of the course. Sources
+    and videos are immutable media segments (unique per source and time
+    range) and are shared with the original rather than copied.
+
+    Args:
+        course (Course): The course to clone.
+        **changes: Field values of the new course, e.g. `name`.
+
+    Returns:
+        Course: The new course.
+    """
+    with transaction.atomic():
+        modules = list(Module.objects.filter(course=course))
+        sections = list(Section.objects.filter(module__course=course))
+        items = list(SectionItemInfo.objects.filter(section__module__course=course))
+
+        def item_ids(item_type):
+            return [item.item_id for item in items if item.item_type == item_type]
+
+        articles = list(Article.objects.filter(id__in=item_ids(SectionItemType.ARTICLE)))
+        assessments = list(Assessment.objects.filter(id__in=item_ids(SectionItemType.ASSESSMENT)))
+        questions = list(Question.objects.filter(assessment__in=[assessment.id for assessment in assessments]))
+        question_ids = [question.id for question in questions]
+        options = list(QuestionOption.objects.filter(question__in=question_ids))
+
+        clone = _copy(course, **changes)
+        clone.save()
+        clone.institutions.set(course.institutions.all())
+        CourseInstructor.objects.bulk_create([
+            CourseInstructor(course=clone, instructor_id=instructor_id)
+            for instructor_id in CourseInstructor.objects.filter(course=course).values_list("instructor_id", flat=True)
+        ])
+
+        module_ids = _clone_all(modules, course_id={course.id: clone.id})
+        section_ids = _clone_all(sections, module_id=module_ids)
+        new_item_ids = {
+            SectionItemType.ARTICLE: _clone_all(articles),
+            SectionItemType.ASSESSMENT: _clone_all(assessments),
+        }
+        SectionItemInfo.objects.bulk_create(
+            [
+                _copy(
+                    item,
+                    section_id=section_ids[item.section_id],
+                    item_id=new_item_ids.get(item.item_type, {}).get(item.item_id, item.item_id),
+                )
+                for item in items
+            ],
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+        cloned_questions = _clone_all(questions, assessment_id=new_item_ids[SectionItemType.ASSESSMENT])
+        cloned_options = _clone_all(options, question_id=cloned_questions)
+        for model in (NATSolution, DescriptiveSolution):
+            _clone_all(list(model.objects.filter(question__in=question_ids)), question_id=cloned_questions)
+        for model in (MCQSolution, MSQSolution):
+            _clone_all(
+                list(model.objects.filter(question__in=question_ids)),
+                question_id=cloned_questions,
+                choice_id=cloned_options,
+            )
+
+    return clone
@@ -10,3 +10,15 @@ SECTION_TITLE_MAX_LEN = 255
 SECTION_DESCRIPTION_MAX_LEN = 1000
 
 VIDEO_TRANSCRIPT_MAX_LEN = 50000
+
+# Sparse ordering keys: siblings are spaced SEQUENCE_GAP apart so rows can be
+# inserted or moved between neighbours without renumbering the others.
+SEQUENCE_GAP = 1024
+# Keys are rebalanced before they grow past this, well below the column's limit.
+SEQUENCE_MAX = 2 ** 30 - 1
+SEQUENCE_UPDATE_BATCH_SIZE = 500
+
+BULK_CREATE_BATCH_SIZE = 1000
+
+# Rows fetched per round trip when streaming a course export.
+EXPORT_CHUNK_SIZE = 500
@@ -0,0 +1,140 @@
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import Course, Module, Section, SectionItemInfo, SectionItemType
+
+
+# Counter column for each section item type, on both Section and Course.
+ITEM_COUNT_FIELDS = {
+    SectionItemType.VIDEO: "video_count",
+    SectionItemType.ARTICLE: "article_count",
+    SectionItemType.ASSESSMENT: "assessment_count",
+}
+
+
+def increment(queryset, field, delta):
+    """
+    Atomically add `delta` to a counter column of every row in `queryset`.
+
+    Decrements never take a counter below zero.
+    """
+    if delta < 0:
+        queryset = queryset.filter(**{f"{field}__gte": -delta})
+    return queryset.update(**{field: F(field) + delta})
+
+
+def update_item_counts(section_id, item_type, delta):
+    """
+    Adjust the item counters of a section and of its course.
+    """
+    field = ITEM_COUNT_FIELDS.get(item_type)
+    if field is None:
+        return
+    increment(Section.objects.filter(id=section_id), field, delta)
+    increment(Course.objects.filter(modules__sections=section_id), field, delta)
+
+
+def _shift_item_counts(old_course_id, new_course_id, counts):
+    """
+    Move section item counts from one course to another.
+    """
+    if old_course_id == new_course_id:
+        return
+    for field, count in counts.items():
+        if count:
+            increment(Course.objects.filter(id=old_course_id), field, -count)
+            increment(Course.objects.filter(id=new_course_id), field, count)
+
+
+def move_item(old, new):
+    """
+    Move the count of a section item that changed section or type.
+
+    Args:
+        old (tuple): The stored `(section_id, item_type)` of the item.
+        new (tuple): Its saved `(section_id, item_type)`.
+    """
+    update_item_counts(*old, -1)
+    update_item_counts(*new, 1)
+
+
+def move_section(section, old_module_id):
+    """
+    Move the counts of a section moved to another module, and of its items
+    if the module belongs to another course.
+    """
+    increment(Module.objects.filter(id=old_module_id), "section_count", -1)
+    increment(Module.objects.filter(id=section.module_id), "section_count", 1)
+
+    course_ids = dict(
+        Module.objects.filter(id__in=[old_module_id, section.module_id]).values_list("id", "course_id")
+    )
+    # Counters of in-memory instances may be stale, so they are read again
+    counts = Section.objects.filter(id=section.id).values(*ITEM_COUNT_FIELDS.values()).first() or {}
+    _shift_item_counts(course_ids.get(old_module_id), course_ids.get(section.module_id), counts)
+
+
+def move_module(module, old_course_id):
+    """
+    Move the counts of a module, and of its section items, to its new course.
+    """
+    increment(Course.objects.filter(id=old_course_id), "module_count", -1)
+    increment(Course.objects.filter(id=module.course_id), "module_count", 1)
+
+    counts = Section.objects.filter(module=module.id).aggregate(
+        **{field: Coalesce(Sum(field), 0) for field in ITEM_COUNT_FIELDS.values()}
+    )
+    _shift_item_counts(old_course_id, module.course_id, counts)
+
+
+def _count(queryset, group_by):
+    """
+    Build a subquery counting the rows of `queryset` for the outer row, or 0.
+    """
+    counts = queryset.values(group_by).annotate(count=Count("pk")).values("count")
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def rebuild_counters(course_ids=None):
+    """
+    Recompute all denormalized counters from the source rows.
+
+    Each table is fixed with a single UPDATE using correlated subqueries.
+
+    Args:
+        course_ids (Iterable[int], optional): Restrict the rebuild to these courses.
+            Defaults to all courses.
+
+    Returns:
+        dict: The number of rows updated per model.
+    """
+    courses = Course.objects.all()
+    modules = Module.objects.all()
+    sections = Section.objects.all()
+    if course_ids is not None:
+        courses = courses.filter(id__in=course_ids)
+        modules = modules.filter(course_id__in=course_ids)
+        sections = sections.filter(module__course_id__in=course_ids)
+
+    items = SectionItemInfo.objects.order_by()
+    course_items = items.filter(section__module__course=OuterRef("pk"))
+    section_items = items.filter(section=OuterRef("pk"))
+
+    return {
+        "courses": courses.update(
+            module_count=_count(Module.objects.filter(course=OuterRef("pk")).order_by(), "course"),
+            **{
+                field: _count(course_items.filter(item_type=item_type), "section__module__course")
+                for item_type, field in ITEM_COUNT_FIELDS.items()
+            },
+        ),
+        "modules": modules.update(
+            section_count=_count(Section.objects.filter(module=OuterRef("pk")).order_by(), "module"),
+        ),
+        "sections": sections.update(
+            **{
+                field: _count(section_items.filter(item_type=item_type), "section")
+                for item_type, field in ITEM_COUNT_FIELDS.items()
+            },
+        ),
+    }
@@ -0,0 +1,104 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from .constants import EXPORT_CHUNK_SIZE
+from .models import Article, Module, Section, SectionItemInfo, SectionItemType, Video
+from ..assessment.models import (
+    Assessment,
+    Question,
+    QuestionOption,
+    NATSolution,
+    DescriptiveSolution,
+    MCQSolution,
+    MSQSolution,
+)
+
+
+def _rows(record_type, queryset):
+    """
+    Stream the rows of a queryset as records, one chunk of rows in memory at a time.
+    """
+    fields = [field.attname for field in queryset.model._meta.concrete_fields]
+    for row in queryset.values(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {"record": record_type, **row}
+
+
+def _read_from_snapshot():
+    """
+    Make the transaction just started read every query from one snapshot.
+
+    PostgreSQL otherwise takes a new snapshot per statement, so rows written
+    between two levels of the export could show up as orphans or be missing.
+    SQLite reads a transaction from one snapshot already.
+    """
+    connection = transaction.get_connection()
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+
+
+def export_course(course):
+    """
+    Yield one record per object of a course tree, parents before children.
+
+    Every level is read with a single streamed query, so memory use does not
+    depend on the size of the course or of individual rows such as transcripts.
+    The queries run in one read-only transaction, held open while the records
+    are consumed, so that all levels see the same state of the tree. Inside a
+    transaction of the caller they are part of that one instead.
+
+    Records carry a `record` type of `course`, `module`, `section`, `item`, `video`,
+    `article`, `assessment`, `question`, `option` or one of the solution types,
+    next to the object's own fields.
+
+    Args:
+        course (Course): The course to export.
+    """
+    starts_transaction = not transaction.get_connection().in_atomic_block
+    # Nothing is written, so no savepoint is needed when nested
+    with transaction.atomic(savepoint=False):
+        if starts_transaction:
+            _read_from_snapshot()
+        yield {
+            "record": "course",
+            **{field.attname: field.value_from_object(course) for field in course._meta.concrete_fields},
+            "institutions": list(course.institutions.values_list("id", flat=True)),
+        }
+
+        items = SectionItemInfo.objects.filter(section__module__course=course)
+
+        def item_ids(item_type):
+            return items.filter(item_type=item_type).values("item_id")
+
+        assessments = Assessment.objects.filter(id__in=item_ids(SectionItemType.ASSESSMENT))
+        questions = Question.objects.filter(assessment__in=assessments)
+
+        yield from _rows("module", Module.objects.filter(course=course).order_by("sequence"))
+        yield from _rows(
+            "section", Section.objects.filter(module__course=course).order_by("module__sequence", "sequence")
+        )
+        yield from _rows(
+            "item", items.order_by("section__module__sequence", "section__sequence", "sequence")
+        )
+        yield from _rows("video", Video.objects.filter(id__in=item_ids(SectionItemType.VIDEO)).order_by("id"))
+        yield from _rows("article", Article.objects.filter(id__in=item_ids(SectionItemType.ARTICLE)).order_by("id"))
+        yield from _rows("assessment", assessments.order_by("id"))
+        yield from _rows("question", questions.order_by("id"))
+        yield from _rows("option", QuestionOption.objects.filter(question__in=questions).order_by("id"))
+        for record_type, model in [
+            ("nat_solution", NATSolution),
+            ("descriptive_solution", DescriptiveSolution),
+            ("mcq_solution", MCQSolution),
+            ("msq_solution", MSQSolution),
+        ]:
+            yield from _rows(record_type, model.objects.filter(question__in=questions).order_by("id"))
+
+
+def export_course_ndjson(course):
+    """
+    Yield the records of `export_course` as newline-delimited JSON.
+    """
+    for record in export_course(course):
+        yield json.dumps(record, cls=DjangoJSONEncoder) + "\n"
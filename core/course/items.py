@@ -0,0 +1,56 @@
+from collections import defaultdict
+
+from .models import Video, Article, SectionItemType
+from .serializers import VideoSerializer, ArticleSerializer
+from ..assessment.models import Assessment
+from ..assessment.serializers import AssessmentSerializer
+
+
+# Queryset and serializer used to load each section item type.
+ITEM_LOADERS = {
+    SectionItemType.VIDEO: (Video.objects.select_related("source"), VideoSerializer),
+    SectionItemType.ARTICLE: (Article.objects.all(), ArticleSerializer),
+    SectionItemType.ASSESSMENT: (Assessment.objects.all(), AssessmentSerializer),
+}
+
+
+def resolve_section_items(section_items):
+    """
+    Load and serialize the objects referenced by a list of section items.
+
+    Item IDs are grouped by `item_type` and each type is fetched with a single
+    `in_bulk` call, so the cost is one query per item type instead of one per item.
+
+    Args:
+        section_items (Iterable[SectionItemInfo]): Section items in the order they should be returned.
+
+    Returns:
+        list: Serialized items annotated with their section, type and sequence.
+    """
+    section_items = list(section_items)
+
+    ids_by_type = defaultdict(list)
+    for item in section_items:
+        ids_by_type[item.item_type].append(item.item_id)
+
+    objects_by_type = {
+        item_type: ITEM_LOADERS[item_type][0].in_bulk(item_ids)
+        for item_type, item_ids in ids_by_type.items()
+        if item_type in ITEM_LOADERS
+    }
+
+    data = []
+    for item in section_items:
+        obj = objects_by_type.get(item.item_type, {}).get(item.item_id)
+        if item.item_type not in ITEM_LOADERS:
+            serializer_data = {"detail": f"Unsupported item_type: {item.item_type}"}
+        elif obj is None:
+            serializer_data = {"detail": f"No {item.item_type} found for item_id={item.item_id}."}
+        else:
+            serializer_data = ITEM_LOADERS[item.item_type][1](obj).data
+        serializer_data["section"] = item.section_id
+        serializer_data["item_type"] = item.item_type
+        serializer_data["sequence"] = item.sequence
+        data.append(serializer_data)
+
+    return data
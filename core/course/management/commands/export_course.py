@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.course.export import export_course_ndjson
+from core.course.models import Course
+
+
+class Command(BaseCommand):
+    help = "Stream a course with all its content as newline-delimited JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("course_id", type=int, help="ID of the course to export.")
+        parser.add_argument(
+            "--output", "-o",
+            help="File to write the export to. Defaults to standard output.",
+        )
+
+    def handle(self, *args, **options):
+        course = Course.objects.filter(id=options["course_id"]).first()
+        if course is None:
+            raise CommandError(f"Course {options['course_id']} does not exist.")
+
+        if options["output"] is None:
+            for line in export_course_ndjson(course):
+                self.stdout.write(line, ending="")
+            return
+
+        records = 0
+        with open(options["output"], "w") as output:
+            for line in export_course_ndjson(course):
+                output.write(line)
+                records += 1
+        self.stderr.write(self.style.SUCCESS(f"Exported {records} records to {options['output']}."))
@@ -0,0 +1,37 @@
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.course.serializers import CourseBundleSerializer
+
+
+class Command(BaseCommand):
+    help = "Import a course with its modules, sections, items and questions from a JSON bundle."
+
+    def add_arguments(self, parser):
+        parser.add_argument("bundle", help="Path to the JSON bundle, or '-' to read it from stdin.")
+
+    def handle(self, *args, **options):
+        try:
+            if options["bundle"] == "-":
+                data = json.load(sys.stdin)
+            else:
+                with open(options["bundle"]) as bundle:
+                    data = json.load(bundle)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read the bundle: {e}")
+
+        started = time.monotonic()
+        serializer = CourseBundleSerializer(data=data)
+        if not serializer.is_valid():
+            raise CommandError(f"Invalid bundle: {json.dumps(serializer.errors)}")
+        course = serializer.save()
+        course.refresh_from_db()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported course {course.id} with {course.module_count} modules, "
+            f"{course.video_count} videos, {course.article_count} articles and "
+            f"{course.assessment_count} assessments in {time.monotonic() - started:.2f}s."
+        ))
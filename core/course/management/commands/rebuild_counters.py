@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.course.cache import bump_course_version
+from core.course.counters import rebuild_counters
+from core.course.models import Course
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized module, section and item counters of courses."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course", type=int, nargs="+", dest="course_ids",
+            help="Only rebuild the counters of these course IDs.",
+        )
+
+    def handle(self, *args, **options):
+        course_ids = options["course_ids"]
+
+        with transaction.atomic():
+            updated = rebuild_counters(course_ids)
+
+        # Counters are part of the cached course tree
+        bump_course_version(*(course_ids or Course.objects.values_list("id", flat=True)))
+
+        self.stdout.write(self.style.SUCCESS(
+            "Rebuilt counters for {courses} courses, {modules} modules and {sections} sections.".format(**updated)
+        ))
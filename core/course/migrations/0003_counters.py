@@ -0,0 +1,87 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:51
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+    Course = apps.get_model('course', 'Course')
+    Module = apps.get_model('course', 'Module')
+    Section = apps.get_model('course', 'Section')
+    SectionItemInfo = apps.get_model('course', 'SectionItemInfo')
+
+    def count(queryset, group_by):
+        counts = queryset.order_by().values(group_by).annotate(count=Count('pk')).values('count')
+        return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+    item_fields = {'video': 'video_count', 'article': 'article_count', 'assessment': 'assessment_count'}
+    course_items = SectionItemInfo.objects.filter(section__module__course=OuterRef('pk'))
+    section_items = SectionItemInfo.objects.filter(section=OuterRef('pk'))
+
+    Course.objects.update(
+        module_count=count(Module.objects.filter(course=OuterRef('pk')), 'course'),
+        **{
+            field: count(course_items.filter(item_type=item_type), 'section__module__course')
+            for item_type, field in item_fields.items()
+        },
+    )
+    Module.objects.update(section_count=count(Section.objects.filter(module=OuterRef('pk')), 'module'))
+    Section.objects.update(**{
+        field: count(section_items.filter(item_type=item_type), 'section')
+        for item_type, field in item_fields.items()
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='CourseAssessmentCount',
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='article_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='assessment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='module_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='video_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='module',
+            name='section_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Denormalized number of sections in this module.'),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='article_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='assessment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='video_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
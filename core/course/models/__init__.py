@@ -5,5 +5,4 @@ from .section_item import SectionItemType, SectionItemInfo
 from .video import Video
 from .article import Article
 from .source import Source
-from .course_assessment_count import CourseAssessmentCount
 from .course_instance import CourseInstance, CoursePersonnel
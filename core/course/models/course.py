@@ -4,9 +4,11 @@ from django.core.exceptions import ValidationError
 from django.db.models import Q
 from typing import TYPE_CHECKING
 
-from ...auth.permissions import ModelPermissionsMixin
-from ...utils.models import TimestampMixin
-from ...user.models import Roles  # Only import Roles, not User
+from ...auth.permissions import BatchPermissionsMixin
+from ...utils.models import TimestampMixin, CounterFieldsMixin
+from ...user.memberships import get_memberships
+from ...user.models import Roles
+from ..access import accessible_course_ids
 from ..constants import COURSE_NAME_MAX_LEN, COURSE_DESCRIPTION_MAX_LEN
 
 if TYPE_CHECKING:
@@ -22,46 +24,13 @@ class VisibilityChoices(models.TextChoices):
 
 class CourseManager(models.Manager):
     def accessible_by(self, user: "User"):
-        if user.role in [Roles.SUPERADMIN, Roles.ADMIN]:
+        """
+        Return the courses the user can access, filtered by their cached accessible course IDs.
+        """
+        course_ids = accessible_course_ids(user)
+        if course_ids is None:
             return self.all()
-
-        elif user.role == Roles.MODERATOR:
-            return self.filter(
-                institution_id__in=user.institutions.values_list("id", flat=True)
-            )
-
-        elif user.role == Roles.INSTRUCTOR:
-            user_institutions = user.institutions.values_list("id", flat=True)
-            return self.filter(
-                Q(visibility=VisibilityChoices.PUBLIC)
-                | Q(
-                    institutions__id__in=user_institutions,
-                    visibility=VisibilityChoices.PRIVATE,
-                )
-                | Q(instructors=user)
-            )
-
-        elif user.role == Roles.STAFF:
-            user_institutions = user.institutions.values_list("id", flat=True)
-            return self.filter(
-                Q(visibility=VisibilityChoices.PUBLIC)
-                | Q(
-                    institutions__id__in=user_institutions,
-                    visibility=VisibilityChoices.PRIVATE,
-                )
-                | Q(id__in=user.personnel_courses.values_list('id', flat=True))
-            )
-
-        elif user.role == Roles.STUDENT:
-            user_institutions = user.institutions.values_list("id", flat=True)
-            return self.filter(
-                Q(visibility=VisibilityChoices.PUBLIC)
-                | Q(
-                    institutions__id__in=user_institutions,
-                    visibility=VisibilityChoices.PRIVATE,
-                )
-                | Q(id__in=user.courses.values_list('id', flat=True))
-            )
+        return self.filter(id__in=course_ids)
 
     def accessible_by_id(self, user: "User", course_id: int):
         """
@@ -70,7 +39,7 @@ class CourseManager(models.Manager):
         return self.accessible_by(user).filter(id=course_id).first()
 
 
-class Course(TimestampMixin, ModelPermissionsMixin, models.Model):
+class Course(CounterFieldsMixin, TimestampMixin, BatchPermissionsMixin, models.Model):
     name = models.CharField(max_length=COURSE_NAME_MAX_LEN)
     description = models.TextField(max_length=COURSE_DESCRIPTION_MAX_LEN)
     visibility = models.CharField(
@@ -85,57 +54,86 @@ class Course(TimestampMixin, ModelPermissionsMixin, models.Model):
     instructors = models.ManyToManyField(
         "user.User", through="CourseInstructor", related_name="instructor_courses"
     )
+    # Denormalized counters, maintained by signals and `rebuild_counters`
+    module_count = models.PositiveIntegerField(default=0, editable=False)
+    video_count = models.PositiveIntegerField(default=0, editable=False)
+    article_count = models.PositiveIntegerField(default=0, editable=False)
+    assessment_count = models.PositiveIntegerField(default=0, editable=False)
 
     objects = CourseManager()
 
+    counter_fields = ("module_count", "video_count", "article_count", "assessment_count")
+
     def __str__(self):
         return self.name
 
-    def student_has_access(self, user: "User"):
-        is_read_allowed = (
-                user.courses.filter(course=self).exists()  # Enrolled courses
-
-                or self.visibility == VisibilityChoices.PUBLIC
-                or (
-                        self.visibility == VisibilityChoices.PRIVATE
-                        and self.institutions.intersection(user.institutions).exists()
-                )
-
-        )
-        return (is_read_allowed, False, False)
-
-    def instructor_has_access(self, user: "User"):
-        is_course_instructor = self.instructors.filter(pk=user.pk).exists()
-        is_read_allowed = (
-                is_course_instructor
-                or self.visibility == VisibilityChoices.PUBLIC
-                or (
-                        self.visibility == VisibilityChoices.PRIVATE
-                        and self.institutions.intersection(user.institutions).exists()
-                )
-        )
-        return (is_read_allowed, is_course_instructor, False)
-
-    def staff_has_access(self, user: "User"):
-        is_course_staff = user.personnel_courses.filter(
-            pk=self.pk
-        ).exists()
-        is_read_allowed = (
-                is_course_staff
-                or self.visibility == VisibilityChoices.PUBLIC
-                or (
-                        self.visibility == VisibilityChoices.PRIVATE
-                        and self.institutions.intersection(user.institutions).exists()
-                )
-        )
-        return (is_read_allowed, False, False)
-
-    def moderator_has_access(self, user: "User"):
-        has_access = self.institutions.intersection(user.institutions).exists()
-        return (has_access, has_access, False)
-
-    def admin_has_access(self, user: "User"):
-        return (True, True, False)
+    def clone(self, **changes):
+        """
+        Duplicate this course with its whole content tree in one transaction.
+
+        Args:
+            **changes: Field values of the new course, e.g. `name`.
+
+        Returns:
+            Course: The new course.
+        """
+        from ..clone import clone_course
+
+        return clone_course(self, **changes)
+
+    @classmethod
+    def role_access_for(cls, role, user: "User", courses):
+        """
+        Resolve the access of a user with `role` to many courses in at most one
+        query, given the user's memberships.
+
+        Courses are readable when public, when private and shared with one of
+        the user's institutions, or when the user takes part in them: as an
+        enrolled student, an instructor or instance personnel. Instructors can
+        edit their own courses and moderators every course of their institution
+        subtrees.
+
+        Args:
+            role (Roles): The role whose rules apply.
+            user (User): The user requesting access.
+            courses (Iterable[Course]): The courses to check.
+
+        Returns:
+            dict: The (read, write, delete) access keyed by course ID.
+        """
+        ids = [course.pk for course in courses]
+        if not ids:
+            return {}
+        if role == Roles.SUPERADMIN:
+            return {pk: (True, True, True) for pk in ids}
+        if role == Roles.ADMIN:
+            return {pk: (True, True, False) for pk in ids}
+
+        def matching(condition, among):
+            if not among:
+                return set()
+            return set(cls._base_manager.filter(condition, id__in=among).values_list("id", flat=True))
+
+        memberships = get_memberships(user)
+        if role == Roles.MODERATOR:
+            shared = matching(Q(institutions__in=memberships.subtree_institution_ids), ids)
+            return {pk: (pk in shared, pk in shared, False) for pk in ids}
+
+        participating = {
+            Roles.STUDENT: memberships.enrolled_course_ids,
+            Roles.INSTRUCTOR: memberships.instructor_course_ids,
+            Roles.STAFF: memberships.personnel_course_ids,
+        }.get(role)
+        if participating is None:
+            return {pk: (False, False, False) for pk in ids}
+
+        readable = participating.union(matching(
+            Q(visibility=VisibilityChoices.PUBLIC)
+            | Q(visibility=VisibilityChoices.PRIVATE, institutions__in=memberships.institution_ids),
+            [pk for pk in ids if pk not in participating],
+        ))
+        instructing = participating if role == Roles.INSTRUCTOR else frozenset()
+        return {pk: (pk in readable, pk in instructing, False) for pk in ids}
 
 
 class CourseInstructor(models.Model):
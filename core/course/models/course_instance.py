@@ -2,10 +2,11 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from django.db.models import Q
 
-from ...auth.permissions import ModelPermissionsMixin
 from ...utils.models import TimestampMixin
 from . import VisibilityChoices
+from ...user.memberships import get_memberships
 from ...user.models import Roles, User
+from ..ancestry import CourseContentPermissionsMixin
 
 
 # Custom manager for CourseInstance model
@@ -28,49 +29,48 @@ class CourseInstanceManager(models.Manager):
             # Superadmins and admins have access to all course instances
             return self.all()
 
-        elif user.role == Roles.MODERATOR:
-            # Moderators can access course instances linked to their institutions
+        memberships = get_memberships(user)
+        if user.role == Roles.MODERATOR:
+            # Moderators can access course instances linked to their institution subtrees
             return self.filter(
-                course_institutions_id__in=user.institutions.values_list("id", flat=True)
-            )
+                course__institutions__in=memberships.subtree_institution_ids
+            ).distinct()
 
         elif user.role == Roles.INSTRUCTOR:
             # Instructors can access:
             # - Public courses
             # - Private courses in their institutions
             # - Courses where they are explicitly listed as instructors
-            user_institutions = user.institutions.values_list("id", flat=True)
             return self.filter(
-                Q(course_visibility=VisibilityChoices.PUBLIC)
+                Q(course__visibility=VisibilityChoices.PUBLIC)
                 | Q(
-                    course_institutions__id__in=user_institutions,
-                    course_visibility=VisibilityChoices.PRIVATE,
+                    course__institutions__in=memberships.institution_ids,
+                    course__visibility=VisibilityChoices.PRIVATE,
                 )
-                | Q(course_instructors__contains=user)
-            )
+                | Q(course_id__in=memberships.instructor_course_ids)
+            ).distinct()
 
         elif user.role == Roles.STAFF:
             # Staff members can access:
             # - Public courses
             # - Private courses in their institutions
             # - Courses they are assigned to as personnel
-            user_institutions = user.institutions.values_list("id", flat=True)
             return self.filter(
-                Q(course_visibility=VisibilityChoices.PUBLIC)
+                Q(course__visibility=VisibilityChoices.PUBLIC)
                 | Q(
-                    course_institutions__id__in=user_institutions,
-                    course_visibility=VisibilityChoices.PRIVATE,
+                    course__institutions__in=memberships.institution_ids,
+                    course__visibility=VisibilityChoices.PRIVATE,
                 )
-                | Q(personnel=user)
-            )
+                | Q(id__in=memberships.personnel_instance_ids)
+            ).distinct()
 
         elif user.role == Roles.STUDENT:
             # Students can only access courses they are enrolled in
-            return user.courses.all()
+            return self.filter(id__in=memberships.enrolled_instance_ids)
 
 
 # CourseInstance model
-class CourseInstance(TimestampMixin, ModelPermissionsMixin, models.Model):
+class CourseInstance(TimestampMixin, CourseContentPermissionsMixin, models.Model):
     """
     Represents a specific instance of a course, with start and end dates.
 
@@ -93,6 +93,8 @@ class CourseInstance(TimestampMixin, ModelPermissionsMixin, models.Model):
     # Assign the custom manager
     objects: CourseInstanceManager = CourseInstanceManager()
 
+    course_path = "course"
+
     class Meta:
         constraints = [
             # Ensure unique course instances for the same course with the same start and end dates
@@ -108,32 +110,6 @@ class CourseInstance(TimestampMixin, ModelPermissionsMixin, models.Model):
         """
         return f"{self.course} - {self.start_date} to {self.end_date}"
 
-    def __getattr__(self, name):
-        """
-        Dynamically delegate access methods to the related Course instance,
-        except for staff-specific access logic.
-
-        Args:
-            name (str): The name of the attribute being accessed.
-
-        Raises:
-            AttributeError: If the attribute is not found.
-
-        Returns:
-            Callable: The permission-checking method from the related course.
-        """
-        if name in {
-            "student_has_access",
-            "instructor_has_access",
-            "moderator_has_access",
-            "admin_has_access",
-            "superadmin_has_access",
-        }:
-            return getattr(self.course, name)
-        raise AttributeError(
-            f"'{type(self).__name__}' object has no attribute '{name}'"
-        )
-
     # def has_write_permission(self, user):
     #     """Check if user has write permission for this course instance"""
     #     if user.role in [Roles.SUPERADMIN, Roles.ADMIN]:
@@ -143,19 +119,27 @@ class CourseInstance(TimestampMixin, ModelPermissionsMixin, models.Model):
     #     #         id__in=self.course.course_institutions.values_list("id", flat=True)).exists()
     #     return False
 
-    def staff_has_access(self, user: User):
+    @classmethod
+    def role_access_for(cls, role, user: User, instances):
         """
-        Determines if a staff member has access to this course instance.
+        Resolve the access of a user with `role` to many course instances.
+
+        Instances share the access to their course, except that staff can only
+        write to the instances they are assigned to as personnel.
 
         Args:
+            role (Roles): The role whose rules apply.
             user (User): The user requesting access.
+            instances (Iterable[CourseInstance]): The course instances to check.
 
         Returns:
-            Tuple: A tuple of booleans indicating read, write, and delete permissions.
+            dict: The (read, write, delete) access keyed by course instance ID.
         """
-        course_access = self.course.staff_has_access(user)
-        is_instance_personnel = self.personnel.filter(pk=user.pk).exists()
-        return (course_access[0], is_instance_personnel, course_access[2])
+        access = super().role_access_for(role, user, instances)
+        if role == Roles.STAFF:
+            assigned = get_memberships(user).personnel_instance_ids
+            access = {pk: (read, pk in assigned, delete) for pk, (read, _, delete) in access.items()}
+        return access
 
 
 # Allowed roles for personnel
@@ -1,7 +1,8 @@
 from django.db import models
 
-from ...auth.permissions import ModelPermissionsMixin
-from ...utils.models import TimestampMixin
+from ...utils.models import TimestampMixin, CounterFieldsMixin
+from ..access import accessible_course_ids
+from ..ancestry import CourseContentPermissionsMixin
 from . import Course
 from ..constants import MODULE_TITLE_MAX_LEN, MODULE_DESCRIPTION_MAX_LEN
 
@@ -22,12 +23,15 @@ class ModuleManager(models.Manager):
         Returns:
             QuerySet: A queryset of modules accessible to the user.
         """
-        # Filter modules whose courses are accessible by the user
-        return self.filter(course__in=Course.objects.accessible_by(user))
+        # Filter modules by the cached IDs of the courses accessible by the user
+        course_ids = accessible_course_ids(user)
+        if course_ids is None:
+            return self.all()
+        return self.filter(course_id__in=course_ids)
 
 
 # Module model
-class Module(TimestampMixin, ModelPermissionsMixin, models.Model):
+class Module(CounterFieldsMixin, TimestampMixin, CourseContentPermissionsMixin, models.Model):
     """
     Represents a module within a course.
 
@@ -36,6 +40,7 @@ class Module(TimestampMixin, ModelPermissionsMixin, models.Model):
         title (str): The title of the module.
         description (str): A detailed description of the module.
         sequence (int): The order of the module within the course.
+        section_count (int): The number of sections in the module.
     """
 
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="modules")
@@ -44,10 +49,16 @@ class Module(TimestampMixin, ModelPermissionsMixin, models.Model):
     sequence = models.PositiveIntegerField(
         help_text="The order of this module in the course."
     )
+    section_count = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Denormalized number of sections in this module."
+    )
 
     # Assign the custom manager
     objects: ModuleManager = ModuleManager()
 
+    counter_fields = ("section_count",)
+    course_path = "course"
+
     class Meta:
         constraints = [
             # Ensure that each module within a course has a unique sequence number
@@ -62,26 +73,3 @@ class Module(TimestampMixin, ModelPermissionsMixin, models.Model):
         Returns a string representation of the module, including its sequence and title.
         """
         return f"Module {self.sequence}: {self.title}"
-
-    def __getattr__(self, name):
-        """
-        Delegate permission checks to the related course object.
-
-        If a permission-related attribute (e.g., `student_has_access`, `instructor_has_access`)
-        is not found on this object, it attempts to fetch it from the related course.
-
-        Args:
-            name (str): The name of the attribute being accessed.
-
-        Raises:
-            AttributeError: If the attribute does not end with `_has_access` or is not found on the course.
-
-        Returns:
-            Callable: The permission-checking method from the related course.
-        """
-        if name.endswith("_has_access"):
-            # Delegate permission checks to the related course
-            return getattr(self.course, name)
-        raise AttributeError(
-            f"'{type(self).__name__}' object has no attribute '{name}'"
-        )
@@ -1,7 +1,8 @@
 from django.db import models
 
-from ...auth.permissions import ModelPermissionsMixin
-from ...utils.models import TimestampMixin
+from ...utils.models import TimestampMixin, CounterFieldsMixin
+from ..access import accessible_course_ids
+from ..ancestry import CourseContentPermissionsMixin
 from . import Module
 from .. import constants as ct
 
@@ -14,7 +15,7 @@ class SectionManager(models.Manager):
 
     def accessible_by(self, user):
         """
-        Returns sections accessible by the given user, based on the user's access to the associated module.
+        Returns sections accessible by the given user, based on the user's access to the associated course.
 
         Args:
             user (User): The user requesting access to sections.
@@ -22,12 +23,15 @@ class SectionManager(models.Manager):
         Returns:
             QuerySet: A queryset of sections accessible by the user.
         """
-        # Filter sections whose modules are accessible by the user
-        return self.filter(module__in=Module.objects.accessible_by(user))
+        # Filter sections by the cached IDs of the courses accessible by the user
+        course_ids = accessible_course_ids(user)
+        if course_ids is None:
+            return self.all()
+        return self.filter(module__course_id__in=course_ids)
 
 
 # Section model
-class Section(TimestampMixin, ModelPermissionsMixin, models.Model):
+class Section(CounterFieldsMixin, TimestampMixin, CourseContentPermissionsMixin, models.Model):
     """
     Represents a section within a module.
 
@@ -36,6 +40,9 @@ class Section(TimestampMixin, ModelPermissionsMixin, models.Model):
         title (str): The title of the section.
         description (str): A detailed description of the section.
         sequence (int): The order of the section within the module.
+        video_count (int): The number of video items in the section.
+        article_count (int): The number of article items in the section.
+        assessment_count (int): The number of assessment items in the section.
     """
 
     module = models.ForeignKey(
@@ -46,10 +53,17 @@ class Section(TimestampMixin, ModelPermissionsMixin, models.Model):
     sequence = models.PositiveIntegerField(
         help_text="The order of this section within the module."
     )
+    # Denormalized item counters, maintained by signals and `rebuild_counters`
+    video_count = models.PositiveIntegerField(default=0, editable=False)
+    article_count = models.PositiveIntegerField(default=0, editable=False)
+    assessment_count = models.PositiveIntegerField(default=0, editable=False)
 
     # Assign the custom manager
     objects: SectionManager = SectionManager()
 
+    counter_fields = ("video_count", "article_count", "assessment_count")
+    course_path = "module__course"
+
     class Meta:
         constraints = [
             # Ensure that each section within a module has a unique sequence number
@@ -65,26 +79,3 @@ class Section(TimestampMixin, ModelPermissionsMixin, models.Model):
         """
         return f"Section {self.sequence}: {self.title} (Module {self.module.sequence})"
 
-    def __getattr__(self, name):
-        """
-        Delegate permission checks to the related module object.
-
-        If a permission-related attribute (e.g., `student_has_access`, `instructor_has_access`) is not
-        found on this object, it attempts to fetch it from the related module.
-
-        Args:
-            name (str): The name of the attribute being accessed.
-
-        Raises:
-            AttributeError: If the attribute does not end with `_has_access` or is not found on the module.
-
-        Returns:
-            Callable: The permission-checking method from the related module.
-        """
-        if name.endswith("_has_access"):
-            # Delegate permission checks to the related module
-            return getattr(self.module, name)
-        raise AttributeError(
-            f"'{type(self).__name__}' object has no attribute '{name}'"
-        )
-
@@ -0,0 +1,179 @@
+import itertools
+
+from django.db import transaction
+from django.db.models import Case, IntegerField, Value, When
+from django.utils.timezone import now
+from rest_framework.exceptions import ValidationError
+
+from .constants import SEQUENCE_GAP, SEQUENCE_MAX, SEQUENCE_UPDATE_BATCH_SIZE
+from .models import Course, Module, Section, SectionItemInfo
+from .signals import invalidate_course_cache
+
+
+# Parent foreign key of each ordered model; `sequence` is unique per parent.
+ORDERED_PARENTS = {
+    Module: "course",
+    Section: "module",
+    SectionItemInfo: "section",
+}
+
+
+def _course_id(parent):
+    if isinstance(parent, Course):
+        return parent.id
+    if isinstance(parent, Module):
+        return parent.course_id
+    return parent.module.course_id
+
+
+def _place_moved(keys, stable):
+    """
+    Assign keys to the rows that moved, leaving the `stable` ones untouched.
+
+    Moved rows get keys spread evenly between their stable neighbours, and
+    `SEQUENCE_GAP` apart after the last one.
+
+    Args:
+        keys (list): The current keys in the new order.
+        stable (set): Positions in `keys` whose rows keep their key.
+
+    Returns:
+        list: The new keys in the new order, or None if a run of moved rows does
+        not fit between its neighbours and the siblings must be rebalanced.
+    """
+    new_keys = list(keys)
+    position = 0
+    while position < len(keys):
+        if position in stable:
+            position += 1
+            continue
+        end = position
+        while end < len(keys) and end not in stable:
+            end += 1
+        low = new_keys[position - 1] if position else 0
+        run = end - position
+        if end == len(keys):
+            new_keys[position:end] = [low + SEQUENCE_GAP * step for step in range(1, run + 1)]
+        else:
+            high = keys[end]
+            if high - low <= run:
+                return None
+            new_keys[position:end] = [low + (high - low) * step // (run + 1) for step in range(1, run + 1)]
+        position = end
+    return new_keys
+
+
+def _stable_positions(keys):
+    """
+    Return the positions of a longest increasing run of `keys`, the rows that
+    can stay where they are.
+    """
+    tails, tail_positions, previous = [], [], [None] * len(keys)
+    for position, key in enumerate(keys):
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if tails[middle] < key:
+                low = middle + 1
+            else:
+                high = middle
+        previous[position] = tail_positions[low - 1] if low else None
+        if low == len(tails):
+            tails.append(key)
+            tail_positions.append(position)
+        else:
+            tails[low] = key
+            tail_positions[low] = position
+
+    stable = set()
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        stable.add(position)
+        position = previous[position]
+    return stable
+
+
+def _temporary_sequences(count, taken):
+    """
+    Return the `count` smallest positive sequences that are not in `taken`.
+    """
+    free = (sequence for sequence in itertools.count(1) if sequence not in taken)
+    return list(itertools.islice(free, count))
+
+
+def _update_sequences(queryset, sequences, **fields):
+    items = list(sequences.items())
+    for start in range(0, len(items), SEQUENCE_UPDATE_BATCH_SIZE):
+        batch = dict(items[start:start + SEQUENCE_UPDATE_BATCH_SIZE])
+        queryset.filter(id__in=batch).update(
+            sequence=Case(
+                *(When(id=pk, then=Value(sequence)) for pk, sequence in batch.items()),
+                output_field=IntegerField(),
+            ),
+            **fields,
+        )
+
+
+def _write_sequences(queryset, sequences, taken):
+    """
+    Move rows to new sequences without tripping the unique constraint midway.
+
+    The rows are first parked on free sequences, the smallest ones not in
+    `taken`, so the temporary values stay in range however large the current
+    ones are. They are then written to their targets. Each step is one `CASE`
+    UPDATE per batch. `.update()` skips `auto_now`, so moved rows that have an
+    `updated_at` get it set in the second step.
+
+    Args:
+        queryset (QuerySet): The siblings of the rows.
+        sequences (dict): The new sequence of each row to move, by ID.
+        taken (set): The current sequences of all siblings and the new ones.
+    """
+    has_updated_at = any(field.name == "updated_at" for field in queryset.model._meta.concrete_fields)
+    touch = {"updated_at": now()} if has_updated_at else {}
+    _update_sequences(queryset, dict(zip(sequences, _temporary_sequences(len(sequences), taken))))
+    _update_sequences(queryset, sequences, **touch)
+
+
+def apply_order(model, parent, order):
+    """
+    Apply a new order to all children of `parent` in one transaction.
+
+    Rows whose relative order is unchanged keep their sequence; the others are
+    given keys in the gaps between them. When a gap is too small or keys grow
+    too large, every sibling is rebalanced to multiples of `SEQUENCE_GAP`.
+    Either way the work is one locking SELECT and a bounded number of UPDATEs.
+
+    Args:
+        model (Model): Module, Section or SectionItemInfo.
+        parent (Model): The course, module or section whose children are reordered.
+        order (list[int]): IDs of all the children, in their new order.
+
+    Returns:
+        list[dict]: The `id` and `sequence` of each child, in the new order.
+
+    Raises:
+        ValidationError: If `order` is not a permutation of the children's IDs.
+    """
+    siblings = model.objects.filter(**{ORDERED_PARENTS[model]: parent})
+
+    with transaction.atomic():
+        current = dict(siblings.select_for_update().values_list("id", "sequence"))
+        if len(order) != len(set(order)) or set(order) != set(current):
+            raise ValidationError(
+                {"order": "Must list the IDs of all children exactly once."}
+            )
+
+        keys = [current[pk] for pk in order]
+        new_keys = _place_moved(keys, _stable_positions(keys))
+        if new_keys is None or max([*current.values(), *new_keys]) > SEQUENCE_MAX:
+            new_keys = [SEQUENCE_GAP * step for step in range(1, len(order) + 1)]
+
+        changed = {
+            pk: sequence for pk, sequence in zip(order, new_keys) if current[pk] != sequence
+        }
+        if changed:
+            _write_sequences(siblings, changed, {*current.values(), *new_keys})
+            invalidate_course_cache(_course_id(parent))
+
+    return [{"id": pk, "sequence": sequence} for pk, sequence in zip(order, new_keys)]
@@ -0,0 +1,72 @@
+from django.db.models import Prefetch
+
+from .models import Course, Module, Section, SectionItemInfo
+
+
+def with_outline(queryset=None):
+    """
+    Attach the prefetches needed to walk a course's full content tree.
+
+    Loading Course -> Module -> Section -> SectionItemInfo costs one query per
+    level regardless of course size, and every level is ordered by `sequence`.
+
+    Args:
+        queryset (QuerySet, optional): A course queryset to extend. Defaults to all courses.
+
+    Returns:
+        QuerySet: The course queryset with the outline prefetched.
+    """
+    if queryset is None:
+        queryset = Course.objects.all()
+
+    items = SectionItemInfo.objects.order_by("sequence")
+    sections = Section.objects.order_by("sequence").prefetch_related(
+        Prefetch("section_item_info", queryset=items)
+    )
+    modules = Module.objects.order_by("sequence").prefetch_related(
+        Prefetch("sections", queryset=sections)
+    )
+    return queryset.prefetch_related(Prefetch("modules", queryset=modules))
+
+
+def get_course_outline(course_id):
+    """
+    Fetch a single course with its outline prefetched.
+
+    Raises:
+        Course.DoesNotExist: If no course exists with the given ID.
+    """
+    return with_outline(Course.objects.filter(id=course_id)).get()
+
+
+def progress_modules(course):
+    """
+    Build the `modules` part of the activity-engine progress payload.
+
+    Args:
+        course (Course): A course loaded through `with_outline`.
+
+    Returns:
+        list: Modules, sections and items in sequence order.
+    """
+    return [
+        {
+            "moduleId": f"{module.id}",
+            "sequence": module.sequence,
+            "sections": [
+                {
+                    "sectionId": f"{section.id}",
+                    "sequence": section.sequence,
+                    "sectionItems": [
+                        {
+                            "sectionItemId": item.prefixed_item_id,
+                            "sequence": item.sequence,
+                        }
+                        for item in section.section_item_info.all()
+                    ],
+                }
+                for section in module.sections.all()
+            ],
+        }
+        for module in course.modules.all()
+    ]
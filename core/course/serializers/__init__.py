@@ -1,5 +1,8 @@
-from .course import CourseListSerializer, CourseDetailSerializer
+from .course import CourseListSerializer, CourseDetailSerializer, CourseCloneSerializer
 from .module import ModuleListSerializer, ModuleDetailSerializer
 from .section import SectionListSerializer, SectionDetailSerializer
 from .section_items import VideoSerializer, ArticleSerializer
 from .course_instance import CourseInstanceReadSerializer, CourseInstanceWriteSerializer
+from .outline import CourseOutlineSerializer
+from .ordering import ReorderSerializer, SequenceSerializer
+from .bundle import CourseBundleSerializer
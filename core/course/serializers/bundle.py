@@ -0,0 +1,96 @@
+from rest_framework import serializers
+
+from ..bundle import create_course_from_bundle
+from ..models import Course, Module, Section, SectionItemType, Video, Article
+from ...assessment.bulk import BulkQuestionSerializer
+from ...assessment.models import Assessment
+
+
+class BundleVideoSerializer(serializers.ModelSerializer):
+    # Sources are created on import when missing, so only the URL is validated here
+    source = serializers.URLField(max_length=200)
+
+    class Meta:
+        model = Video
+        fields = ["source", "transcript", "start_time", "end_time"]
+        validators = []
+
+
+class BundleArticleSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = ["content"]
+
+
+class BundleAssessmentSerializer(serializers.ModelSerializer):
+    questions = BulkQuestionSerializer(many=True, required=False)
+
+    class Meta:
+        model = Assessment
+        fields = ["title", "question_visibility_limit", "time_limit", "questions"]
+
+
+class BundleItemSerializer(serializers.Serializer):
+    """
+    A section item, validated by the serializer of its `item_type`.
+    """
+    item_type = serializers.ChoiceField(choices=SectionItemType.choices)
+
+    item_serializers = {
+        SectionItemType.VIDEO: BundleVideoSerializer,
+        SectionItemType.ARTICLE: BundleArticleSerializer,
+        SectionItemType.ASSESSMENT: BundleAssessmentSerializer,
+    }
+
+    def to_internal_value(self, data):
+        item_type = super().to_internal_value(data)["item_type"]
+        serializer = self.item_serializers[item_type](data=data)
+        serializer.is_valid(raise_exception=True)
+        return {"item_type": item_type, **serializer.validated_data}
+
+
+class BundleSectionSerializer(serializers.ModelSerializer):
+    items = BundleItemSerializer(many=True, required=False)
+
+    class Meta:
+        model = Section
+        fields = ["title", "description", "items"]
+
+
+class BundleModuleSerializer(serializers.ModelSerializer):
+    sections = BundleSectionSerializer(many=True, required=False)
+
+    class Meta:
+        model = Module
+        fields = ["title", "description", "sections"]
+
+
+class CourseBundleSerializer(serializers.ModelSerializer):
+    """
+    A whole course tree, validated up front and created in one transaction.
+
+    Modules, sections and items are ordered by their position in the bundle.
+    Items carry an `item_type` of `video`, `article` or `assessment` next to
+    the fields of that type; assessments may list their `questions` in the
+    format of the question API.
+    """
+    modules = BundleModuleSerializer(many=True, required=False)
+
+    class Meta:
+        model = Course
+        fields = ["name", "description", "visibility", "institutions", "modules"]
+
+    def validate_modules(self, modules):
+        segments = [
+            (item["source"], item["start_time"], item["end_time"])
+            for module in modules
+            for section in module.get("sections", [])
+            for item in section.get("items", [])
+            if item["item_type"] == SectionItemType.VIDEO
+        ]
+        if len(segments) != len(set(segments)):
+            raise serializers.ValidationError("Video segments must be unique within a bundle.")
+        return modules
+
+    def create(self, validated_data):
+        return create_course_from_bundle(validated_data)
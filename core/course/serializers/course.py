@@ -17,12 +17,19 @@ class CourseListSerializer(serializers.ModelSerializer):
 
 
 class CourseDetailSerializer(serializers.ModelSerializer):
-    module_count = serializers.SerializerMethodField()
     course_id = serializers.IntegerField(source='id', read_only=True)
 
     class Meta:
         model = Course
         fields = '__all__'
 
-    def get_module_count(self, obj):
-        return obj.modules.count()
+
+class CourseCloneSerializer(serializers.ModelSerializer):
+    """
+    Fields to change on a cloned course; anything omitted is copied.
+    """
+
+    class Meta:
+        model = Course
+        fields = ['name', 'description', 'visibility']
+        extra_kwargs = {field: {'required': False} for field in fields}
@@ -22,13 +22,7 @@ class ModuleDetailSerializer(serializers.ModelSerializer):
     """
     Detailed serializer for the Module model.
     """
-    section_count = serializers.SerializerMethodField()
-
-
 
     class Meta:
         model = Module
         fields = '__all__'
-
-    def get_section_count(self, obj):
-        return obj.sections.count()
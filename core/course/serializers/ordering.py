@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+
+class ReorderSerializer(serializers.Serializer):
+    """
+    The new order of a course's modules, a module's sections or a section's items.
+    """
+    order = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        help_text="IDs of all the children, in their new order.",
+    )
+
+
+class SequenceSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    sequence = serializers.IntegerField()
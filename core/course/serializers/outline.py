@@ -0,0 +1,38 @@
+from rest_framework import serializers
+
+from ..models import Course, Module, Section, SectionItemInfo
+
+
+class SectionItemOutlineSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SectionItemInfo
+        fields = ['id', 'sequence', 'item_type', 'item_id']
+
+
+class SectionOutlineSerializer(serializers.ModelSerializer):
+    items = SectionItemOutlineSerializer(source='section_item_info', many=True, read_only=True)
+
+    class Meta:
+        model = Section
+        fields = ['id', 'title', 'sequence', 'items']
+
+
+class ModuleOutlineSerializer(serializers.ModelSerializer):
+    sections = SectionOutlineSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Module
+        fields = ['id', 'title', 'sequence', 'sections']
+
+
+class CourseOutlineSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the full Course -> Module -> Section -> Item tree.
+    Expects a course loaded through `core.course.outline.with_outline`.
+    """
+    course_id = serializers.IntegerField(source='id', read_only=True)
+    modules = ModuleOutlineSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Course
+        fields = ['course_id', 'name', 'modules']
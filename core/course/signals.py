@@ -1,26 +1,198 @@
-from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 
 from ..assessment.models import Assessment
-from .models import CourseAssessmentCount, Course
-
-@receiver(post_save, sender=Assessment)
-def update_assessment_count_on_save(sender, instance, created, **kwargs):
-    if created:  # Only trigger when a new Assessment is created
-        course = instance.section.module.course
-        count_obj, _ = CourseAssessmentCount.objects.get_or_create(course=course)
-        count_obj.count += 1
-        count_obj.save()
-
-@receiver(post_delete, sender=Assessment)
-def update_assessment_count_on_delete(sender, instance, **kwargs):
-    course = instance.section.module.course
-    count_obj, _ = CourseAssessmentCount.objects.get_or_create(course=course)
-    if count_obj.count > 0:
-        count_obj.count -= 1
-        count_obj.save()
-
-@receiver(post_save, sender=Course)
-def create_course_assessment_count(sender, instance, created, **kwargs):
+from ..institution.models import Institution
+from ..user.models import User, UserInstitution, UserCourseInstance
+from .access import bump_course_access, bump_user_access
+from .cache import bump_course_version, course_ids_for_item, course_ids_for_section
+from .counters import increment, move_item, move_module, move_section, update_item_counts
+from .models import (
+    Course,
+    CourseInstance,
+    CourseInstructor,
+    CoursePersonnel,
+    Module,
+    Section,
+    SectionItemInfo,
+    SectionItemType,
+    Video,
+    Article,
+)
+
+# Fields whose change moves the counts of a row from one parent or type to another
+COUNTED_FIELDS = {
+    Module: ("course",),
+    Section: ("module",),
+    SectionItemInfo: ("section", "item_type"),
+}
+
+@receiver(pre_save, sender=Module)
+@receiver(pre_save, sender=Section)
+@receiver(pre_save, sender=SectionItemInfo)
+def remember_counted_fields(sender, instance, raw, update_fields, **kwargs):
+    # Compared with the saved values in post_save, to move counts on changes
+    fields = COUNTED_FIELDS[sender]
+    instance._stored_counted_fields = None
+    if instance._state.adding or raw or (update_fields is not None and not set(fields) & set(update_fields)):
+        return
+    instance._stored_counted_fields = sender.objects.filter(pk=instance.pk).values_list(*fields).first()
+
+def stored_counted_fields(instance):
+    return instance.__dict__.pop("_stored_counted_fields", None)
+
+@receiver(post_save, sender=Module)
+def update_module_count(sender, instance, created, **kwargs):
     if created:
-        CourseAssessmentCount.objects.get_or_create(course=instance)
+        increment(Course.objects.filter(id=instance.course_id), "module_count", 1)
+        return
+    stored = stored_counted_fields(instance)
+    if stored and stored != (instance.course_id,):
+        move_module(instance, stored[0])
+        invalidate_course_cache(stored[0])
+
+@receiver(post_delete, sender=Module)
+def decrement_module_count(sender, instance, **kwargs):
+    increment(Course.objects.filter(id=instance.course_id), "module_count", -1)
+
+@receiver(post_save, sender=Section)
+def update_section_count(sender, instance, created, **kwargs):
+    if created:
+        increment(Module.objects.filter(id=instance.module_id), "section_count", 1)
+        return
+    stored = stored_counted_fields(instance)
+    if stored and stored != (instance.module_id,):
+        move_section(instance, stored[0])
+        invalidate_course_cache(*Module.objects.filter(id=stored[0]).values_list("course_id", flat=True))
+
+@receiver(post_delete, sender=Section)
+def decrement_section_count(sender, instance, **kwargs):
+    increment(Module.objects.filter(id=instance.module_id), "section_count", -1)
+
+@receiver(post_save, sender=SectionItemInfo)
+def update_item_count(sender, instance, created, **kwargs):
+    if created:
+        update_item_counts(instance.section_id, instance.item_type, 1)
+        return
+    stored = stored_counted_fields(instance)
+    if stored and stored != (instance.section_id, instance.item_type):
+        move_item(stored, (instance.section_id, instance.item_type))
+        invalidate_course_cache(*course_ids_for_section(stored[0]))
+
+@receiver(post_delete, sender=SectionItemInfo)
+def decrement_item_count(sender, instance, **kwargs):
+    update_item_counts(instance.section_id, instance.item_type, -1)
+
+def bump_now_and_on_commit(bump, *args):
+    """
+    Call a version bump now and again on commit.
+
+    The immediate bump covers reads inside the current transaction; the one on
+    commit evicts any entry rebuilt from the pre-commit state in the meantime.
+    """
+    bump(*args)
+    transaction.on_commit(lambda: bump(*args))
+
+
+def invalidate_course_cache(*course_ids):
+    """
+    Bump the content version of the given courses now and again on commit.
+    """
+    bump_now_and_on_commit(bump_course_version, *course_ids)
+
+
+@receiver([post_save, post_delete], sender=Course)
+def invalidate_course(sender, instance, **kwargs):
+    invalidate_course_cache(instance.pk)
+
+@receiver([post_save, post_delete], sender=Module)
+@receiver([post_save, post_delete], sender=CourseInstructor)
+def invalidate_course_child(sender, instance, **kwargs):
+    invalidate_course_cache(instance.course_id)
+
+@receiver([post_save, post_delete], sender=Section)
+def invalidate_section(sender, instance, **kwargs):
+    if Section.module.is_cached(instance):
+        invalidate_course_cache(instance.module.course_id)
+    else:
+        invalidate_course_cache(*Module.objects.filter(id=instance.module_id).values_list("course_id", flat=True))
+
+@receiver([post_save, post_delete], sender=SectionItemInfo)
+def invalidate_section_item(sender, instance, **kwargs):
+    invalidate_course_cache(*course_ids_for_section(instance.section_id))
+
+@receiver([post_save, post_delete], sender=Video)
+@receiver([post_save, post_delete], sender=Article)
+@receiver([post_save, post_delete], sender=Assessment)
+def invalidate_item(sender, instance, **kwargs):
+    item_type = {
+        Video: SectionItemType.VIDEO,
+        Article: SectionItemType.ARTICLE,
+        Assessment: SectionItemType.ASSESSMENT,
+    }[sender]
+    invalidate_course_cache(*course_ids_for_item(item_type, instance.pk))
+
+# Course field of each many-to-many relation that course trees depend on
+COURSE_RELATION_FIELDS = {
+    Course.institutions.through: "institutions",
+    Course.instructors.through: "instructors",
+}
+
+@receiver(m2m_changed, sender=Course.institutions.through)
+@receiver(m2m_changed, sender=Course.instructors.through)
+def invalidate_course_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == "pre_clear":
+        # pk_set is None on clear, so the courses are collected before the rows are gone
+        instance._cleared_course_ids = list(
+            Course.objects.filter(**{COURSE_RELATION_FIELDS[sender]: instance}).values_list("id", flat=True)
+        )
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_course_cache(instance.pk)
+    elif action == "post_clear":
+        invalidate_course_cache(*instance.__dict__.pop("_cleared_course_ids", []))
+    elif pk_set:
+        invalidate_course_cache(*pk_set)
+
+
+@receiver([post_save, post_delete], sender=UserInstitution)
+@receiver([post_save, post_delete], sender=UserCourseInstance)
+def invalidate_member_access(sender, instance, **kwargs):
+    bump_now_and_on_commit(bump_user_access, instance.user_id)
+
+@receiver([post_save, post_delete], sender=CourseInstructor)
+def invalidate_instructor_access(sender, instance, **kwargs):
+    bump_now_and_on_commit(bump_user_access, instance.instructor_id)
+
+@receiver([post_save, post_delete], sender=CoursePersonnel)
+def invalidate_personnel_access(sender, instance, **kwargs):
+    bump_now_and_on_commit(bump_user_access, instance.personnel_id)
+
+@receiver(m2m_changed, sender=User.institutions.through)
+@receiver(m2m_changed, sender=User.courses.through)
+@receiver(m2m_changed, sender=Course.instructors.through)
+@receiver(m2m_changed, sender=CourseInstance.personnel.through)
+def invalidate_relation_access(sender, instance, action, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    # The user is the instance on its own side of the relation, and in pk_set on the other
+    if isinstance(instance, User):
+        bump_now_and_on_commit(bump_user_access, instance.pk)
+    elif pk_set:
+        bump_now_and_on_commit(bump_user_access, *pk_set)
+    else:
+        # Cleared from the other side, so the affected users are unknown
+        bump_now_and_on_commit(bump_course_access)
+
+@receiver([post_save, post_delete], sender=Course)
+@receiver([post_save, post_delete], sender=Institution)
+def invalidate_all_access(sender, instance, **kwargs):
+    # Visibility changes, new public courses and institution moves affect every user
+    bump_now_and_on_commit(bump_course_access)
+
+@receiver(m2m_changed, sender=Course.institutions.through)
+def invalidate_institution_access(sender, action, **kwargs):
+    if action.startswith("post_"):
+        bump_now_and_on_commit(bump_course_access)
@@ -1,3 +1,4 @@
+from .bundle import make_bundle
 from .course import CourseFactory, UserFactory
 from .course_instance import CourseInstanceFactory
 from .module import ModuleFactory
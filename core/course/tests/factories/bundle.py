@@ -0,0 +1,61 @@
+# core/course/tests/factories/bundle.py
+
+
+def make_bundle(institution, modules=2, sections=2, name="Imported Course"):
+    """
+    Build a course bundle, as accepted by the import endpoint, with a video,
+    an article and a three-question assessment in every section.
+    """
+    def items(module, section):
+        return [
+            {
+                "item_type": "video",
+                "source": "https://example.com/lecture.mp4",
+                "start_time": (module * 100 + section) * 10,
+                "end_time": (module * 100 + section) * 10 + 5,
+            },
+            {"item_type": "article", "content": f"Notes {module}.{section}"},
+            {
+                "item_type": "assessment",
+                "title": f"Quiz {module}.{section}",
+                "question_visibility_limit": 2,
+                "time_limit": 600,
+                "questions": [
+                    {
+                        "text": "2 + 2?", "type": "MCQ", "marks": 1,
+                        "options": [{"option_text": "3"}, {"option_text": "4"}],
+                        "solution_option_index": 1,
+                    },
+                    {
+                        "text": "Even numbers?", "type": "MSQ", "marks": 2,
+                        "options": [{"option_text": "1"}, {"option_text": "2"}, {"option_text": "4"}],
+                        "solution_options_indices": [1, 2],
+                    },
+                    {
+                        "text": "Pi to two places?", "type": "NAT", "marks": 1,
+                        "nat_solution": {
+                            "value": 3.14, "tolerance_max": 3.15, "tolerance_min": 3.13,
+                            "decimal_precision": 2, "solution_explanation": "Pi",
+                        },
+                    },
+                ],
+            },
+        ]
+
+    return {
+        "name": name,
+        "description": "Imported in one request",
+        "visibility": "public",
+        "institutions": [institution.id],
+        "modules": [
+            {
+                "title": f"Module {module}",
+                "description": "Module",
+                "sections": [
+                    {"title": f"Section {section}", "description": "Section", "items": items(module, section)}
+                    for section in range(sections)
+                ],
+            }
+            for module in range(modules)
+        ],
+    }
@@ -1,8 +1,12 @@
 # core/course/tests/permissions/test_course_permissions.py
 
 from django.test import TestCase
+from core.auth.permissions import RoleBasedPermission
+from core.course.models import Course, CourseInstructor, CoursePersonnel
+from core.course.tests.factories import CourseInstanceFactory
 from core.course.tests.factories.user import UserFactory
 from core.course.tests.factories.course import CourseFactory
+from core.user.models import UserInstitution
 
 
 class TestCoursePermissions(TestCase):
@@ -23,4 +27,58 @@ class TestCoursePermissions(TestCase):
                     access = course.instructor_has_access(user)
                 elif role == 'admin':
                     access = course.admin_has_access(user)
-                assert access == expected_access
\ No newline at end of file
+                assert access == expected_access
+
+class TestBatchCoursePermissions(TestCase):
+    def setUp(self):
+        from core.institution.tests.factories import InstitutionFactory
+
+        self.institution = InstitutionFactory()
+        self.public = CourseFactory(visibility='public')
+        self.private = CourseFactory(visibility='private', institutions=[self.institution])
+        self.unlisted = CourseFactory(visibility='unlisted')
+        self.courses = Course.objects.filter(id__in=[self.public.id, self.private.id, self.unlisted.id])
+
+    def test_student_access(self):
+        student = UserFactory(email='batch.student@example.com', role='student')
+        UserInstitution.objects.create(user=student, institution=self.institution)
+
+        # The courses, the memberships, then the public and institution courses
+        with self.assertNumQueries(4):
+            access = RoleBasedPermission().permissions_for(student, self.courses)
+
+        assert access == {
+            self.public.id: (True, False, False),
+            self.private.id: (True, False, False),
+            self.unlisted.id: (False, False, False),
+        }
+
+    def test_instructor_and_moderator_access(self):
+        instructor = UserFactory(email='batch.instructor@example.com', role='instructor')
+        CourseInstructor.objects.create(course=self.unlisted, instructor=instructor)
+        moderator = UserFactory(email='batch.moderator@example.com', role='moderator')
+        UserInstitution.objects.create(user=moderator, institution=self.institution)
+        courses = list(self.courses)
+
+        with self.assertNumQueries(3):
+            access = RoleBasedPermission().permissions_for(instructor, courses)
+        assert access[self.unlisted.id] == (True, True, False)
+        assert access[self.private.id] == (False, False, False)
+
+        with self.assertNumQueries(3):
+            access = RoleBasedPermission().permissions_for(moderator, courses)
+        assert access[self.private.id] == (True, True, False)
+        assert access[self.public.id] == (False, False, False)
+
+    def test_staff_read_instance_courses(self):
+        staff = UserFactory(email='batch.staff@example.com', role='staff')
+        instance = CourseInstanceFactory(course=self.unlisted)
+        CoursePersonnel.objects.create(course=instance, personnel=staff)
+
+        assert self.unlisted.staff_has_access(staff) == (True, False, False)
+
+    def test_object_permission_matches_batch(self):
+        student = UserFactory(email='batch.single@example.com', role='student')
+        batch = RoleBasedPermission().permissions_for(student, self.courses)
+        for course in self.courses:
+            assert RoleBasedPermission().get_access(student, course) == batch[course.id]
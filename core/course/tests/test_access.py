@@ -0,0 +1,76 @@
+# tests/test_access.py
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.course.access import accessible_course_ids
+from core.course.models import Course, CourseInstructor, Module, Section
+from core.course.tests.factories import (
+    CourseFactory,
+    CourseInstanceFactory,
+    ModuleFactory,
+    SectionFactory,
+    UserFactory,
+)
+from core.institution.tests.factories import InstitutionFactory
+from core.user.models import UserCourseInstance, UserInstitution
+
+
+class TestAccessibleCourseIds(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.institution = InstitutionFactory()
+        self.public_course = CourseFactory(visibility='public')
+        self.private_course = CourseFactory(visibility='private')
+        self.institution_course = CourseFactory(visibility='private', institutions=[self.institution])
+        self.student = UserFactory(email='access.student@example.com', role='student')
+        self.instructor = UserFactory(email='access.instructor@example.com', role='instructor')
+
+    def test_student_access(self):
+        assert accessible_course_ids(self.student) == [self.public_course.id]
+
+        UserInstitution.objects.create(user=self.student, institution=self.institution)
+        assert accessible_course_ids(self.student) == [self.public_course.id, self.institution_course.id]
+
+        instance = CourseInstanceFactory(course=self.private_course)
+        UserCourseInstance.objects.create(user=self.student, course=instance)
+        assert self.private_course.id in accessible_course_ids(self.student)
+
+    def test_instructor_access(self):
+        CourseInstructor.objects.create(course=self.private_course, instructor=self.instructor)
+        assert accessible_course_ids(self.instructor) == [self.public_course.id, self.private_course.id]
+
+    def test_admins_are_unrestricted(self):
+        admin = UserFactory(email='access.admin@example.com', role='admin')
+        assert accessible_course_ids(admin) is None
+        assert Course.objects.accessible_by(admin).count() == 3
+
+    def test_ids_are_cached_until_access_changes(self):
+        accessible_course_ids(self.student)
+        with self.assertNumQueries(0):
+            accessible_course_ids(self.student)
+
+        self.private_course.visibility = 'public'
+        self.private_course.save()
+
+        assert self.private_course.id in accessible_course_ids(self.student)
+
+    def test_managers_filter_by_cached_ids(self):
+        module = ModuleFactory(course=self.public_course, sequence=1)
+        section = SectionFactory(module=module, sequence=1)
+        hidden_module = ModuleFactory(course=self.private_course, sequence=1)
+        SectionFactory(module=hidden_module, sequence=1)
+        accessible_course_ids(self.student)
+
+        with self.assertNumQueries(3):
+            assert list(Course.objects.accessible_by(self.student)) == [self.public_course]
+            assert list(Module.objects.accessible_by(self.student)) == [module]
+            assert list(Section.objects.accessible_by(self.student)) == [section]
+
+    def test_moderator_access_covers_institution_subtree(self):
+        department = InstitutionFactory(parent=self.institution)
+        department_course = CourseFactory(visibility='private', institutions=[department])
+        moderator = UserFactory(email='access.moderator@example.com', role='moderator')
+        UserInstitution.objects.create(user=moderator, institution=self.institution)
+
+        assert accessible_course_ids(moderator) == [self.institution_course.id, department_course.id]
+        assert department_course.moderator_has_access(moderator) == (True, True, False)
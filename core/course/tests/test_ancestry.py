@@ -0,0 +1,58 @@
+# tests/test_ancestry.py
+from django.test import TestCase
+
+from core.assessment.models import Assessment, Question
+from core.auth.permissions import RoleBasedPermission
+from core.course.ancestry import owning_courses
+from core.course.models import Course, Section
+from core.course.serializers import CourseBundleSerializer
+from core.course.tests.factories import CourseInstanceFactory, UserFactory, make_bundle
+from core.institution.tests.factories import InstitutionFactory
+from core.user.memberships import get_memberships, membership_scope
+
+
+class TestOwningCourses(TestCase):
+    def setUp(self):
+        serializer = CourseBundleSerializer(data=make_bundle(InstitutionFactory()))
+        serializer.is_valid(raise_exception=True)
+        self.course = Course.objects.get(id=serializer.save().id)
+        self.student = UserFactory(email='ancestry.student@example.com', role='student')
+
+    def test_resolves_deep_objects_in_one_query(self):
+        sections = list(Section.objects.filter(module__course=self.course))
+        questions = list(Question.objects.all())
+
+        with self.assertNumQueries(1):
+            assert set(owning_courses(sections).values()) == {self.course}
+        with self.assertNumQueries(1):
+            courses = owning_courses(questions)
+        assert len(courses) == 12
+        assert set(courses.values()) == {self.course}
+
+    def test_unplaced_items_have_no_course(self):
+        assessment = Assessment.objects.create(title='Draft', question_visibility_limit=1, time_limit=60)
+        assert owning_courses([assessment]) == {assessment.pk: None}
+        assert RoleBasedPermission().get_access(self.student, assessment) == (False, False, False)
+
+    def test_permission_checks_cost_constant_queries(self):
+        section = Section.objects.filter(module__course=self.course).first()
+        questions = Question.objects.all()
+        with membership_scope():
+            get_memberships(self.student)
+            # The section and its course, then the course rules
+            with self.assertNumQueries(2):
+                assert RoleBasedPermission().get_access(self.student, section) == (True, False, False)
+
+            with self.assertNumQueries(3):
+                access = RoleBasedPermission().permissions_for(self.student, questions)
+        assert set(access.values()) == {(True, False, False)}
+
+    def test_instances_follow_course_access(self):
+        instance = CourseInstanceFactory(course=self.course)
+        instructor = UserFactory(email='ancestry.instructor@example.com', role='instructor')
+        self.course.instructors.add(instructor)
+
+        assert instance.instructor_has_access(instructor) == (True, True, False)
+        assert instance.staff_has_access(UserFactory(email='ancestry.staff@example.com', role='staff')) == (
+            True, False, False
+        )
@@ -0,0 +1,124 @@
+# tests/test_cache.py
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from core.course.cache import get_course_tree, get_course_version
+from core.course.models import Article, SectionItemInfo, SectionItemType
+from core.course.tests.factories import CourseFactory, ModuleFactory, SectionFactory, UserFactory
+from core.institution.tests.factories import InstitutionFactory
+
+
+class TestCourseTreeCache(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = CourseFactory()
+        self.module = ModuleFactory(course=self.course, sequence=1)
+        self.section = SectionFactory(module=self.module, sequence=1)
+        self.article = Article.objects.create(content="Original content")
+        SectionItemInfo.objects.create(
+            section=self.section, sequence=1, item_type=SectionItemType.ARTICLE, item_id=self.article.id
+        )
+
+    def test_tree_is_served_from_cache(self):
+        get_course_tree(self.course.id)
+        with self.assertNumQueries(0):
+            tree = get_course_tree(self.course.id)
+        assert tree["module_order"] == [self.module.id]
+        assert tree["sections"][self.section.id]["items"][0]["content"] == "Original content"
+
+    def test_content_changes_bump_version(self):
+        changes = [
+            lambda: self.course.save(),
+            lambda: self.module.save(),
+            lambda: self.section.save(),
+            lambda: self.article.save(),
+            lambda: SectionFactory(module=self.module, sequence=2),
+        ]
+        for change in changes:
+            version = get_course_version(self.course.id)
+            change()
+            assert get_course_version(self.course.id) > version
+
+    def test_relation_cleared_from_the_other_side_bumps_version(self):
+        institution = InstitutionFactory()
+        other_course = CourseFactory()
+        institution.courses.add(self.course, other_course)
+        versions = [get_course_version(course.id) for course in (self.course, other_course)]
+
+        institution.courses.clear()
+
+        assert get_course_version(self.course.id) > versions[0]
+        assert get_course_version(other_course.id) > versions[1]
+        assert not hasattr(institution, '_cleared_course_ids')
+
+    def test_item_change_is_visible_after_invalidation(self):
+        get_course_tree(self.course.id)
+        self.article.content = "Updated content"
+        self.article.save()
+        tree = get_course_tree(self.course.id)
+        assert tree["sections"][self.section.id]["items"][0]["content"] == "Updated content"
+
+    def test_delete_invalidates_tree(self):
+        get_course_tree(self.course.id)
+        self.section.delete()
+        assert get_course_tree(self.course.id)["modules"][self.module.id]["sections"] == []
+
+    def test_file_based_cache(self):
+        with tempfile.TemporaryDirectory() as location:
+            caches = {'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': location,
+            }}
+            with override_settings(CACHES=caches):
+                get_course_tree(self.course.id)
+                self.module.title = "Renamed module"
+                self.module.save()
+                tree = get_course_tree(self.course.id)
+                assert tree["modules"][self.module.id]["detail"]["title"] == "Renamed module"
+
+
+class TestCachedCourseViews(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory(email='superadmin@example.com', role='superadmin')
+        self.client.force_authenticate(user=self.user)
+        self.course = CourseFactory()
+        self.modules = [ModuleFactory(course=self.course, sequence=seq) for seq in [2, 1]]
+        self.section = SectionFactory(module=self.modules[0], sequence=1)
+
+    def test_module_list_by_course(self):
+        response = self.client.get('/api/modules/', {'course_id': self.course.id})
+        assert response.status_code == status.HTTP_200_OK
+        assert [m['module_id'] for m in response.data['results']] == [self.modules[1].id, self.modules[0].id]
+
+    def test_module_list_by_non_canonical_course_id_sees_updates(self):
+        params = {'course_id': f'0{self.course.id}'}
+        assert len(self.client.get('/api/modules/', params).data['results']) == 2
+        ModuleFactory(course=self.course, sequence=3)
+        assert len(self.client.get('/api/modules/', params).data['results']) == 3
+
+    def test_module_list_of_inaccessible_course(self):
+        student = UserFactory(email='student@example.com', role='student')
+        private_course = CourseFactory(visibility='private')
+        ModuleFactory(course=private_course, sequence=1)
+        self.client.force_authenticate(user=student)
+        response = self.client.get('/api/modules/', {'course_id': private_course.id})
+        assert response.data['results'] == []
+
+    def test_section_list_by_module(self):
+        response = self.client.get('/api/sections/', {'module_id': self.modules[0].id})
+        assert [s['id'] for s in response.data['results']] == [self.section.id]
+
+    def test_detail_views_reflect_updates(self):
+        assert self.client.get(f'/api/courses/{self.course.id}/').data['module_count'] == 2
+        ModuleFactory(course=self.course, sequence=3)
+        assert self.client.get(f'/api/courses/{self.course.id}/').data['module_count'] == 3
+
+        url = f'/api/sections/{self.section.id}/'
+        assert self.client.get(url).data['title'] == self.section.title
+        self.client.patch(url, {'title': 'New title'})
+        assert self.client.get(url).data['title'] == 'New title'
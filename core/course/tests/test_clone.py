@@ -0,0 +1,81 @@
+# tests/test_clone.py
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from core.assessment.models import MCQSolution, MSQSolution, Question, QuestionOption
+from core.course.models import Article, Course, Module, SectionItemInfo, SectionItemType, Video
+from core.course.serializers import CourseBundleSerializer
+from core.course.tests.factories import UserFactory, make_bundle
+from core.institution.tests.factories import InstitutionFactory
+
+
+class TestCourseClone(APITestCase):
+    def setUp(self):
+        self.institution = InstitutionFactory()
+        self.course = self.import_course(modules=2, sections=2)
+
+    def import_course(self, **size):
+        serializer = CourseBundleSerializer(data=make_bundle(self.institution, **size))
+        serializer.is_valid(raise_exception=True)
+        return Course.objects.get(id=serializer.save().id)
+
+    def test_clone_copies_tree(self):
+        clone = self.course.clone(name="Next semester")
+
+        assert clone.id != self.course.id
+        assert clone.name == "Next semester"
+        assert clone.description == self.course.description
+        assert list(clone.institutions.all()) == [self.institution]
+        assert clone.module_count == 2
+
+        original_items = SectionItemInfo.objects.filter(section__module__course=self.course)
+        cloned_items = SectionItemInfo.objects.filter(section__module__course=clone)
+        assert cloned_items.count() == original_items.count() == 12
+        assert list(Module.objects.filter(course=clone).values_list('title', 'sequence')) == list(
+            Module.objects.filter(course=self.course).values_list('title', 'sequence')
+        )
+
+        # Videos are shared, other items are copied
+        cloned_videos = set(cloned_items.filter(item_type=SectionItemType.VIDEO).values_list('item_id', flat=True))
+        assert cloned_videos == set(original_items.filter(item_type=SectionItemType.VIDEO).values_list('item_id', flat=True))
+        assert Video.objects.count() == 4
+        assert Article.objects.count() == 8
+        cloned_articles = set(cloned_items.filter(item_type=SectionItemType.ARTICLE).values_list('item_id', flat=True))
+        assert cloned_articles.isdisjoint(original_items.filter(item_type=SectionItemType.ARTICLE).values_list('item_id', flat=True))
+
+    def test_clone_remaps_questions_and_solutions(self):
+        clone = self.course.clone()
+        assessment_ids = SectionItemInfo.objects.filter(
+            section__module__course=clone, item_type=SectionItemType.ASSESSMENT
+        ).values_list('item_id', flat=True)
+        questions = Question.objects.filter(assessment_id__in=assessment_ids)
+
+        assert questions.count() == 12
+        assert QuestionOption.objects.filter(question__in=questions).count() == 20
+        for solution in MCQSolution.objects.filter(question__in=questions):
+            assert solution.choice.question_id == solution.question_id
+            assert solution.choice.option_text == '4'
+        assert MSQSolution.objects.filter(question__in=questions, choice__question__in=questions).count() == 8
+
+    def test_query_count_does_not_grow_with_course(self):
+        large = self.import_course(modules=3, sections=4, name="Large")
+        with CaptureQueriesContext(connection) as small_queries:
+            self.course.clone()
+        with CaptureQueriesContext(connection) as large_queries:
+            large.clone()
+        assert len(large_queries) == len(small_queries)
+
+    def test_clone_endpoint(self):
+        self.client.force_authenticate(user=UserFactory(email='clone.admin@example.com', role='admin'))
+        response = self.client.post(f'/api/courses/{self.course.id}/clone/', {'name': 'Copy'}, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['name'] == 'Copy'
+        assert Course.objects.count() == 2
+
+    def test_students_cannot_clone(self):
+        self.client.force_authenticate(user=UserFactory(email='clone.student@example.com', role='student'))
+        response = self.client.post(f'/api/courses/{self.course.id}/clone/', {}, format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
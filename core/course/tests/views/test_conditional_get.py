@@ -0,0 +1,123 @@
+# tests/views/test_conditional_get.py
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+from rest_framework import status
+from core.course.models import Article, SectionItemInfo, SectionItemType
+from core.course.tests.factories import CourseFactory, ModuleFactory, SectionFactory, UserFactory
+
+
+class TestConditionalGet(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory(email='superadmin@example.com', role='superadmin')
+        self.client.force_authenticate(user=self.user)
+        self.course = CourseFactory()
+        self.module = ModuleFactory(course=self.course, sequence=1)
+        self.section = SectionFactory(module=self.module, sequence=1)
+        self.article = Article.objects.create(content="Test content")
+        SectionItemInfo.objects.create(
+            section=self.section, sequence=1, item_type=SectionItemType.ARTICLE, item_id=self.article.id
+        )
+
+    def assert_not_modified(self, url, params=None):
+        response = self.client.get(url, params)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response['ETag']
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert not response.content
+        return etag
+
+    def assert_modified(self, url, params, etag):
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        return response
+
+    def test_endpoints_answer_not_modified(self):
+        self.assert_not_modified('/api/courses/')
+        self.assert_not_modified(f'/api/courses/{self.course.id}/')
+        self.assert_not_modified(f'/api/courses/{self.course.id}/outline/')
+        self.assert_not_modified('/api/modules/', {'course_id': self.course.id})
+        self.assert_not_modified(f'/api/modules/{self.module.id}/')
+        self.assert_not_modified(f'/api/sections/{self.section.id}/')
+        self.assert_not_modified('/api/items/', {'section_id': self.section.id})
+
+    def test_child_change_invalidates_parent_etag(self):
+        url = f'/api/modules/{self.module.id}/'
+        etag = self.assert_not_modified(url)
+        SectionFactory(module=self.module, sequence=2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['section_count'] == 2
+
+    def test_item_change_invalidates_items_etag(self):
+        etag = self.assert_not_modified('/api/items/', {'section_id': self.section.id})
+        Article.objects.update(content="Bulk edit")  # No signals: version unchanged
+        Article.objects.get().save()
+        response = self.client.get('/api/items/', {'section_id': self.section.id}, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_if_modified_since(self):
+        url = f'/api/items/articles/{self.article.id}/'
+        response = self.client.get(url)
+        last_modified = response['Last-Modified']
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_course_content_is_validated_by_etag_only(self):
+        # Content versions are not times, and timestamps miss deletes and counters
+        for url, params in [
+            (f'/api/courses/{self.course.id}/', None),
+            ('/api/modules/', {'course_id': self.course.id}),
+            (f'/api/sections/{self.section.id}/', None),
+            ('/api/courses/', None),
+        ]:
+            response = self.client.get(url, params)
+            assert 'Last-Modified' not in response
+            response = self.client.get(url, params, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+            assert response.status_code == status.HTTP_200_OK
+
+    def test_counter_change_invalidates_section_etag(self):
+        url = f'/api/sections/{self.section.id}/'
+        etag = self.assert_not_modified(url)
+        article = Article.objects.create(content="Second")
+        SectionItemInfo.objects.create(
+            section=self.section, sequence=2, item_type=SectionItemType.ARTICLE, item_id=article.id
+        )
+        response = self.assert_modified(url, None, etag)
+        assert response.data['item_counts']['articles'] == 2
+
+    def test_child_edit_invalidates_course_etag(self):
+        url = f'/api/courses/{self.course.id}/'
+        etag = self.assert_not_modified(url)
+        self.section.title = "Renamed"
+        self.section.save()
+        self.assert_modified(url, None, etag)
+
+    def test_delete_invalidates_list_etags(self):
+        second = ModuleFactory(course=self.course, sequence=2)
+        params = {'course_id': self.course.id}
+        etags = [self.assert_not_modified(url, params) for url in ('/api/modules/', '/api/sections/')]
+        second.delete()
+        response = self.assert_modified('/api/modules/', params, etags[0])
+        assert [module['module_id'] for module in response.data['results']] == [self.module.id]
+
+        self.section.delete()
+        self.assert_modified('/api/sections/', params, etags[1])
+
+    def test_reorder_invalidates_list_etag(self):
+        second = ModuleFactory(course=self.course, sequence=2)
+        params = {'course_id': self.course.id}
+        etag = self.assert_not_modified('/api/modules/', params)
+        self.client.post(f'/api/courses/{self.course.id}/reorder/', {'order': [second.id, self.module.id]})
+        response = self.assert_modified('/api/modules/', params, etag)
+        assert [module['module_id'] for module in response.data['results']] == [second.id, self.module.id]
+
+    def test_not_modified_skips_serialization(self):
+        url = f'/api/courses/{self.course.id}/'
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(2):
+            # Access check and course IDs of the validators only
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
@@ -0,0 +1,55 @@
+# tests/views/test_course_export.py
+import json
+from collections import Counter
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from rest_framework import status
+from core.course.models import Course
+from core.course.tests.factories import UserFactory, make_bundle
+from core.institution.tests.factories import InstitutionFactory
+
+
+class TestCourseExport(APITestCase):
+    def setUp(self):
+        self.user = UserFactory(email='export.admin@example.com', role='admin')
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post('/api/courses/import/', make_bundle(InstitutionFactory()), format='json')
+        self.course = Course.objects.get(id=response.data['id'])
+        self.url = f'/api/courses/{self.course.id}/export/'
+
+    def read_records(self, response):
+        return [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+
+    def test_export_streams_one_record_per_object(self):
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        records = self.read_records(response)
+        assert records[0]['record'] == 'course'
+        assert records[0]['id'] == self.course.id
+        assert Counter(record['record'] for record in records) == {
+            'course': 1, 'module': 2, 'section': 4, 'item': 12,
+            'video': 4, 'article': 4, 'assessment': 4, 'question': 12, 'option': 20,
+            'mcq_solution': 4, 'msq_solution': 8, 'nat_solution': 4,
+        }
+
+    def test_export_query_count_is_constant(self):
+        response = self.client.get(self.url)
+        # Institutions, then one streamed query per record type
+        with self.assertNumQueries(13):
+            self.read_records(response)
+
+    def test_students_cannot_export(self):
+        student = UserFactory(email='export.student@example.com', role='student')
+        self.client.force_authenticate(user=student)
+        response = self.client.get(self.url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_export_command(self):
+        out = StringIO()
+        call_command('export_course', self.course.id, stdout=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert len(records) == 79
@@ -0,0 +1,74 @@
+# tests/views/test_course_import.py
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from core.assessment.models import MCQSolution, MSQSolution, NATSolution, Question, QuestionOption
+from core.course.models import Course, SectionItemInfo, Source, Video
+from core.course.tests.factories import UserFactory, make_bundle
+from core.institution.tests.factories import InstitutionFactory
+
+
+class TestCourseImport(APITestCase):
+    def setUp(self):
+        self.user = UserFactory(email='import.admin@example.com', role='admin')
+        self.client.force_authenticate(user=self.user)
+        self.institution = InstitutionFactory()
+        self.url = '/api/courses/import/'
+
+    def test_import_creates_whole_tree(self):
+        response = self.client.post(self.url, make_bundle(self.institution), format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        course = Course.objects.get(id=response.data['id'])
+        assert response.data['module_count'] == 2
+        assert (course.video_count, course.article_count, course.assessment_count) == (4, 4, 4)
+
+        items = SectionItemInfo.objects.filter(section__module__course=course)
+        assert items.count() == 12
+        assert Source.objects.count() == 1
+        assert Video.objects.count() == 4
+
+        questions = Question.objects.filter(assessment__title='Quiz 1.1')
+        mcq = questions.get(type='MCQ')
+        assert MCQSolution.objects.get(question=mcq).choice.option_text == '4'
+        msq = questions.get(type='MSQ')
+        assert sorted(MSQSolution.objects.filter(question=msq).values_list('choice__option_text', flat=True)) == ['2', '4']
+        assert NATSolution.objects.filter(question__assessment__title='Quiz 1.1').count() == 1
+        assert QuestionOption.objects.count() == 4 * 5
+
+    def test_query_count_does_not_grow_with_bundle(self):
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, make_bundle(self.institution, modules=1, sections=1, name="Small"), format='json')
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(self.url, make_bundle(self.institution, modules=3, sections=4, name="Large"), format='json')
+        assert len(large) == len(small)
+
+    def test_invalid_bundle_writes_nothing(self):
+        bundle = make_bundle(self.institution)
+        bundle['modules'][1]['sections'][0]['items'][2]['questions'][0]['solution_option_index'] = 5
+
+        response = self.client.post(self.url, bundle, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'modules' in response.data
+        assert not Course.objects.exists()
+
+    def test_students_cannot_import(self):
+        student = UserFactory(email='import.student@example.com', role='student')
+        self.client.force_authenticate(user=student)
+        response = self.client.post(self.url, make_bundle(self.institution), format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_import_command(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.json') as bundle:
+            json.dump(make_bundle(self.institution), bundle)
+            bundle.flush()
+            call_command('import_course', bundle.name, stdout=StringIO())
+
+        assert Course.objects.get(name='Imported Course').module_count == 2
@@ -0,0 +1,49 @@
+# tests/views/test_course_outline.py
+from rest_framework.test import APITestCase
+from rest_framework import status
+from core.course.models import Article, SectionItemInfo, SectionItemType
+from core.course.outline import get_course_outline, progress_modules
+from core.course.tests.factories import CourseFactory, ModuleFactory, SectionFactory, UserFactory
+
+
+class TestCourseOutline(APITestCase):
+    def setUp(self):
+        self.user = UserFactory(role='admin')
+        self.client.force_authenticate(user=self.user)
+        self.course = CourseFactory()
+        # Create modules and sections out of order to check sequence ordering
+        for module_sequence in [2, 1, 3]:
+            module = ModuleFactory(course=self.course, sequence=module_sequence)
+            for section_sequence in [2, 1]:
+                section = SectionFactory(module=module, sequence=section_sequence)
+                for item_sequence in [3, 1, 2]:
+                    article = Article.objects.create(content="Test content")
+                    SectionItemInfo.objects.create(
+                        section=section,
+                        sequence=item_sequence,
+                        item_type=SectionItemType.ARTICLE,
+                        item_id=article.id,
+                    )
+        self.url = f'/api/courses/{self.course.id}/outline/'
+
+    def test_outline_is_ordered_by_sequence(self):
+        response = self.client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        modules = response.data['modules']
+        assert [m['sequence'] for m in modules] == [1, 2, 3]
+        for module in modules:
+            assert [s['sequence'] for s in module['sections']] == [1, 2]
+            for section in module['sections']:
+                assert [i['sequence'] for i in section['items']] == [1, 2, 3]
+
+    def test_outline_query_count_is_constant(self):
+        # Course, modules, sections and items: one query per level
+        with self.assertNumQueries(4):
+            course = get_course_outline(self.course.id)
+            payload = progress_modules(course)
+        assert len(payload) == 3
+        assert payload[0]['sections'][0]['sectionItems'][0]['sectionItemId'].startswith('ar')
+
+    def test_outline_of_missing_course(self):
+        response = self.client.get('/api/courses/0/outline/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,127 @@
+# tests/views/test_reorder.py
+import re
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from core.course.cache import get_course_version
+from core.course.constants import SEQUENCE_GAP
+from core.course.models import Module, Section, SectionItemInfo, SectionItemType
+from core.course.ordering import apply_order
+from core.course.tests.factories import CourseFactory, ModuleFactory, SectionFactory, UserFactory
+
+
+class TestReorder(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory(email='reorder.superadmin@example.com', role='superadmin')
+        self.client.force_authenticate(user=self.user)
+        self.course = CourseFactory()
+        self.modules = [ModuleFactory(course=self.course, sequence=sequence) for sequence in [1, 2, 3, 4]]
+
+    def sequences(self, model, **parent):
+        return list(model.objects.filter(**parent).order_by('sequence').values_list('id', flat=True))
+
+    def test_reorder_modules(self):
+        order = [self.modules[3].id, self.modules[0].id, self.modules[2].id, self.modules[1].id]
+        version = get_course_version(self.course.id)
+
+        response = self.client.post(f'/api/courses/{self.course.id}/reorder/', {'order': order})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row['id'] for row in response.data] == order
+        assert self.sequences(Module, course=self.course) == order
+        assert get_course_version(self.course.id) != version
+
+    def test_reorder_changes_list_etags(self):
+        module = self.modules[0]
+        sections = [SectionFactory(module=module, sequence=sequence) for sequence in [1, 2]]
+        lists = [
+            (f'/api/courses/{self.course.id}/reorder/', '/api/modules/', {'course_id': self.course.id},
+             [module.id for module in reversed(self.modules)]),
+            (f'/api/modules/{module.id}/reorder/', '/api/sections/', {'module_id': module.id},
+             [section.id for section in reversed(sections)]),
+        ]
+        for reorder_url, list_url, params, order in lists:
+            etag = self.client.get(list_url, params)['ETag']
+            self.client.post(reorder_url, {'order': order})
+
+            response = self.client.get(list_url, params, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == status.HTTP_200_OK
+            assert [row.get('id', row.get('module_id')) for row in response.data['results']] == order
+
+        assert Module.objects.get(id=self.modules[3].id).updated_at > self.modules[3].updated_at
+
+    def test_reorder_sections_and_items(self):
+        module = self.modules[0]
+        sections = [SectionFactory(module=module, sequence=sequence) for sequence in [1, 2, 3]]
+        items = [
+            SectionItemInfo.objects.create(
+                section=sections[0], sequence=sequence, item_type=SectionItemType.ARTICLE, item_id=sequence
+            )
+            for sequence in [1, 2]
+        ]
+
+        section_order = [sections[2].id, sections[1].id, sections[0].id]
+        response = self.client.post(f'/api/modules/{module.id}/reorder/', {'order': section_order})
+        assert response.status_code == status.HTTP_200_OK
+        assert self.sequences(Section, module=module) == section_order
+
+        item_order = [items[1].id, items[0].id]
+        response = self.client.post(f'/api/sections/{sections[0].id}/reorder/', {'order': item_order})
+        assert response.status_code == status.HTTP_200_OK
+        assert self.sequences(SectionItemInfo, section=sections[0]) == item_order
+
+    def test_order_must_list_every_child(self):
+        response = self.client.post(
+            f'/api/courses/{self.course.id}/reorder/', {'order': [self.modules[0].id, self.modules[1].id]}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_students_cannot_reorder(self):
+        student = UserFactory(email='reorder.student@example.com', role='student')
+        self.client.force_authenticate(user=student)
+        response = self.client.post(
+            f'/api/courses/{self.course.id}/reorder/', {'order': [module.id for module in self.modules]}
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_only_moved_rows_are_renumbered(self):
+        Module.objects.filter(id=self.modules[0].id).update(sequence=SEQUENCE_GAP)
+        Module.objects.filter(id=self.modules[1].id).update(sequence=2 * SEQUENCE_GAP)
+        Module.objects.filter(id=self.modules[2].id).update(sequence=3 * SEQUENCE_GAP)
+        Module.objects.filter(id=self.modules[3].id).update(sequence=4 * SEQUENCE_GAP)
+
+        # Move the last module between the first two
+        order = [self.modules[0].id, self.modules[3].id, self.modules[1].id, self.modules[2].id]
+        sequences = {row['id']: row['sequence'] for row in apply_order(Module, self.course, order)}
+
+        assert sequences[self.modules[0].id] == SEQUENCE_GAP
+        assert sequences[self.modules[1].id] == 2 * SEQUENCE_GAP
+        assert SEQUENCE_GAP < sequences[self.modules[3].id] < 2 * SEQUENCE_GAP
+        assert self.sequences(Module, course=self.course) == order
+
+    def test_rebalances_when_gaps_run_out(self):
+        # Consecutive keys leave no room to move a module between others
+        order = [self.modules[0].id, self.modules[3].id, self.modules[1].id, self.modules[2].id]
+
+        with self.assertNumQueries(5):
+            # Savepoint, locking select, park, rewrite, release
+            sequences = apply_order(Module, self.course, order)
+
+        assert [row['sequence'] for row in sequences] == [SEQUENCE_GAP * step for step in range(1, 5)]
+        assert self.sequences(Module, course=self.course) == order
+
+    def test_large_sequences_are_not_shifted_out_of_range(self):
+        # The largest value a PostgreSQL integer column holds
+        Module.objects.filter(id=self.modules[3].id).update(sequence=2 ** 31 - 1)
+        order = [module.id for module in reversed(self.modules)]
+
+        with CaptureQueriesContext(connection) as queries:
+            apply_order(Module, self.course, order)
+
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+        assert max(int(number) for sql in updates for number in re.findall(r'\b\d+\b', sql)) < 2 ** 31
+        assert self.sequences(Module, course=self.course) == order
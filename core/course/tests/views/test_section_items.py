@@ -0,0 +1,59 @@
+# tests/views/test_section_items.py
+from rest_framework.test import APITestCase
+from rest_framework import status
+from core.assessment.models import Assessment
+from core.course.models import Article, Video, SectionItemInfo, SectionItemType
+from core.course.tests.factories import ModuleFactory, SectionFactory, SourceFactory, UserFactory
+
+
+class TestSectionItemViewSet(APITestCase):
+    def setUp(self):
+        self.user = UserFactory(role='admin')
+        self.client.force_authenticate(user=self.user)
+        self.module = ModuleFactory()
+        self.sections = [SectionFactory(module=self.module, sequence=seq) for seq in [1, 2]]
+        for section in self.sections:
+            for sequence in range(1, 10, 3):
+                self._add_item(section, sequence, SectionItemType.ASSESSMENT, Assessment.objects.create(
+                    title="Quiz", question_visibility_limit=1, time_limit=60
+                ))
+                self._add_item(section, sequence + 1, SectionItemType.VIDEO, Video.objects.create(
+                    source=SourceFactory(), start_time=0, end_time=sequence
+                ))
+                self._add_item(section, sequence + 2, SectionItemType.ARTICLE, Article.objects.create(
+                    content="Test content"
+                ))
+        self.url = '/api/items/'
+
+    def _add_item(self, section, sequence, item_type, instance):
+        SectionItemInfo.objects.create(
+            section=section, sequence=sequence, item_type=item_type, item_id=instance.id
+        )
+
+    def test_items_are_ordered_by_sequence(self):
+        response = self.client.get(self.url, {'section_id': self.sections[0].id})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['sequence'] for item in response.data] == list(range(1, 10))
+        assert response.data[1]['item_type'] == SectionItemType.VIDEO
+        assert response.data[1]['source'].startswith('https://')
+
+    def test_multiple_sections_in_one_request(self):
+        section_ids = ','.join(str(section.id) for section in self.sections)
+        response = self.client.get(self.url, {'section_id': section_ids})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['section'] for item in response.data] == [self.sections[0].id] * 9 + [self.sections[1].id] * 9
+
+    def test_query_count_is_independent_of_item_count(self):
+        # The first request builds the course tree with one in_bulk query per item type
+        self.client.get(self.url, {'section_id': self.sections[0].id})
+        # Later requests only look up the sections' courses
+        with self.assertNumQueries(1):
+            self.client.get(self.url, {'section_id': self.sections[0].id})
+
+    def test_missing_section_id(self):
+        response = self.client.get(self.url)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_section_without_items(self):
+        response = self.client.get(self.url, {'section_id': 0})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
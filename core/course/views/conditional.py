@@ -0,0 +1,30 @@
+from ..cache import get_course_versions
+from ...utils.views import ConditionalGetMixin
+
+
+class CourseContentConditionalMixin(ConditionalGetMixin):
+    """
+    Conditional GET for views serving course content, validated by course content versions.
+
+    Responses built from the course tree depend on rows whose changes leave
+    `updated_at` alone: counters, reorders, deleted children, items and
+    relations. The signals bump the content version of a course on all of
+    them, so the ETag is computed from the versions of the courses a response
+    covers. Versions are counters rather than times, so no Last-Modified is
+    sent and `If-Modified-Since` alone never yields a 304.
+
+    Attributes:
+        course_id_field (str): The lookup from the view's rows to their course ID.
+    """
+
+    course_id_field = "course_id"
+
+    def get_validators(self):
+        course_ids = (
+            self.get_validator_queryset().order_by().values_list(self.course_id_field, flat=True).distinct()
+        )
+        versions = get_course_versions(course_ids)
+        if not versions and self.is_detail_request():
+            # Missing or inaccessible object: let the view answer 404
+            return None
+        return self.make_etag(sorted(versions.items())), None
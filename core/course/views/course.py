@@ -7,11 +7,28 @@ from ..models import Course
 from ...utils.helpers import get_user
 
 
-from rest_framework import viewsets
+from django.http import StreamingHttpResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-from ..serializers import CourseListSerializer, CourseDetailSerializer
-from ..models import Course
+from ..serializers import (
+    CourseListSerializer,
+    CourseDetailSerializer,
+    CourseOutlineSerializer,
+    CourseBundleSerializer,
+    CourseCloneSerializer,
+    ReorderSerializer,
+    SequenceSerializer,
+)
+from ..models import Course, Module
+from ..export import export_course_ndjson
+from ..ordering import apply_order
+from ..outline import with_outline
+from ..cache import get_course_tree
+from ...auth.permissions import RoleBasedPermission, WriteAccessPermission
 from ...utils.helpers import get_user
+from .conditional import CourseContentConditionalMixin
 
 
 @extend_schema_view(
@@ -54,23 +71,149 @@ from ...utils.helpers import get_user
         description="Delete an existing course.",
         responses={"204": "Course deleted successfully."},
     ),
+    outline=extend_schema(
+        tags=["Course"],
+        summary="Retrieve a Course Outline",
+        description=(
+            "Retrieve the full module, section and item tree of a course, "
+            "ordered by sequence at every level."
+        ),
+        responses=CourseOutlineSerializer,
+    ),
+    reorder=extend_schema(
+        tags=["Course"],
+        summary="Reorder Modules",
+        description=(
+            "Apply a new order to all modules of the course in one transaction. "
+            "Only moved rows are renumbered, within the gaps of the sparse sequence numbers."
+        ),
+        request=ReorderSerializer,
+        responses=SequenceSerializer(many=True),
+    ),
+    import_bundle=extend_schema(
+        tags=["Course"],
+        summary="Import a Course Bundle",
+        description=(
+            "Create a course with its modules, sections, items and assessment questions from "
+            "a single JSON bundle. The whole tree is validated before anything is written, then "
+            "inserted level by level in one transaction."
+        ),
+        request=CourseBundleSerializer,
+        responses={201: CourseDetailSerializer},
+    ),
+    export=extend_schema(
+        tags=["Course"],
+        summary="Export a Course",
+        description=(
+            "Stream the whole course tree as newline-delimited JSON, one record per course, "
+            "module, section, item, video, article, assessment, question, option and solution. "
+            "All records are read from one snapshot, in a read-only transaction held open until "
+            "the stream ends. The format is a flat dump of the stored rows, and is not accepted "
+            "by the import endpoint, which takes a nested JSON bundle. "
+            "Requires write access to the course."
+        ),
+        responses={(200, "application/x-ndjson"): str},
+    ),
+    clone=extend_schema(
+        tags=["Course"],
+        summary="Clone a Course",
+        description=(
+            "Duplicate a course with its modules, sections, items, assessments, questions and "
+            "solutions in one transaction. Fields given in the body replace those of the copy. "
+            "Videos and their sources are shared with the original."
+        ),
+        request=CourseCloneSerializer,
+        responses={201: CourseDetailSerializer},
+    ),
 )
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(CourseContentConditionalMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
+    conditional_actions = ("list", "retrieve", "outline")
+    course_id_field = "id"
 
     def get_queryset(self):
-        if self.action == 'retrieve':
+        if self.action in ['retrieve', 'outline']:
             # For single course retrieval, use the new method
             course = Course.objects.accessible_by_id(
                 get_user(self.request.user), 
                 self.kwargs.get('pk')
             )
-            return Course.objects.filter(id=course.id) if course else Course.objects.none()
+            queryset = Course.objects.filter(id=course.id) if course else Course.objects.none()
+            return with_outline(queryset) if self.action == 'outline' else queryset
         
         # For list and other actions, use the existing method
         return Course.objects.accessible_by(get_user(self.request.user))
 
     def get_serializer_class(self):
+        if self.action == "import_bundle":
+            return CourseBundleSerializer
+        if self.action == "clone":
+            return CourseCloneSerializer
+        if self.action == "outline":
+            return CourseOutlineSerializer
         if self.action in ["list", "retrieve"]:
             return CourseDetailSerializer if self.action == "retrieve" else CourseListSerializer
-        return CourseDetailSerializer
\ No newline at end of file
+        return CourseDetailSerializer
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve the course detail from the cached course tree once access is checked.
+        """
+        course = self.get_object()
+        return Response(get_course_tree(course.id)["course"])
+
+    @action(detail=True, methods=["get"])
+    def outline(self, request, *args, **kwargs):
+        """
+        Return the course tree loaded in a constant number of queries.
+        """
+        serializer = self.get_serializer(self.get_object())
+        return Response(serializer.data)
+
+    @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated, RoleBasedPermission])
+    def reorder(self, request, *args, **kwargs):
+        """
+        Reorder the modules of this course given the full list of their IDs.
+        """
+        parent = self.get_object()
+        serializer = ReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        sequences = apply_order(Module, parent, serializer.validated_data["order"])
+        return Response(SequenceSerializer(sequences, many=True).data)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        permission_classes=[IsAuthenticated, RoleBasedPermission],
+    )
+    def import_bundle(self, request, *args, **kwargs):
+        """
+        Create a whole course tree from a bundle in one transaction.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        course = serializer.save()
+        course.refresh_from_db()
+        return Response(CourseDetailSerializer(course).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["get"], permission_classes=[IsAuthenticated, WriteAccessPermission])
+    def export(self, request, *args, **kwargs):
+        """
+        Stream the course tree as NDJSON without loading it into memory.
+        """
+        course = self.get_object()
+        response = StreamingHttpResponse(export_course_ndjson(course), content_type="application/x-ndjson")
+        response["Content-Disposition"] = f'attachment; filename="course-{course.id}.ndjson"'
+        return response
+
+    @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated, WriteAccessPermission])
+    def clone(self, request, *args, **kwargs):
+        """
+        Duplicate the course tree in a constant number of queries.
+        """
+        course = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        clone = course.clone(**serializer.validated_data)
+        return Response(CourseDetailSerializer(clone).data, status=status.HTTP_201_CREATED)
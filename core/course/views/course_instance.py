@@ -3,6 +3,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiPara
 from ..models import CourseInstance
 from ..serializers.course_instance import CourseInstanceReadSerializer, CourseInstanceWriteSerializer
 from ...utils.helpers import get_user
+from ...utils.views import ConditionalGetMixin
 from rest_framework.permissions import IsAuthenticated
 from django.core.exceptions import PermissionDenied
 
@@ -54,7 +55,8 @@ from django.core.exceptions import PermissionDenied
         responses={"204": "Course instance deleted successfully."},
     ),
 )
-class CourseInstanceViewSet(viewsets.ModelViewSet):
+class CourseInstanceViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    last_modified_fields = ("updated_at", "course__updated_at")
 
     def get_serializer_class(self):
         # TODO: Look into this when implementing update and delete methods.
@@ -1,8 +1,13 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-from ..serializers import ModuleListSerializer, ModuleDetailSerializer
-from ..models import Module
+from ..serializers import ModuleListSerializer, ModuleDetailSerializer, ReorderSerializer, SequenceSerializer
+from ..models import Course, Module, Section
+from ..cache import get_course_tree
+from ..ordering import apply_order
 from ...utils.helpers import get_user
+from .conditional import CourseContentConditionalMixin
 
 
 @extend_schema_view(
@@ -53,8 +58,18 @@ from ...utils.helpers import get_user
         description="Delete an existing module.",
         responses={"204": "Module deleted successfully."},
     ),
+    reorder=extend_schema(
+        tags=["Module"],
+        summary="Reorder Sections",
+        description=(
+            "Apply a new order to all sections of the module in one transaction. "
+            "Only moved rows are renumbered, within the gaps of the sparse sequence numbers."
+        ),
+        request=ReorderSerializer,
+        responses=SequenceSerializer(many=True),
+    ),
 )
-class ModuleViewSet(viewsets.ModelViewSet):
+class ModuleViewSet(CourseContentConditionalMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing modules. Provides actions to list, retrieve, create, update, and delete modules.
     """
@@ -77,3 +92,44 @@ class ModuleViewSet(viewsets.ModelViewSet):
         if self.action in ["list", "retrieve"]:
             return ModuleDetailSerializer if self.action == "retrieve" else ModuleListSerializer
         return ModuleDetailSerializer
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve the modules of a single course from the cached course tree.
+        """
+        course_id = request.query_params.get("course_id")
+        if course_id is None:
+            return super().list(request, *args, **kwargs)
+
+        data = []
+        course = Course.objects.accessible_by_id(get_user(request.user), course_id)
+        if course:
+            # The canonical ID, as the tree is cached and invalidated under it
+            tree = get_course_tree(course.id)
+            data = [tree["modules"][module_id]["list"] for module_id in tree["module_order"]]
+
+        page = self.paginate_queryset(data)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve the module detail from the cached course tree once access is checked.
+        """
+        module = self.get_object()
+        cached = get_course_tree(module.course_id)["modules"].get(module.id)
+        if cached is None:
+            return super().retrieve(request, *args, **kwargs)
+        return Response(cached["detail"])
+
+    @action(detail=True, methods=["post"])
+    def reorder(self, request, *args, **kwargs):
+        """
+        Reorder the sections of this module given the full list of their IDs.
+        """
+        parent = self.get_object()
+        serializer = ReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        sequences = apply_order(Section, parent, serializer.validated_data["order"])
+        return Response(SequenceSerializer(sequences, many=True).data)
@@ -1,8 +1,13 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-from ..serializers import SectionListSerializer, SectionDetailSerializer
-from ..models import Section
+from ..serializers import SectionListSerializer, SectionDetailSerializer, ReorderSerializer, SequenceSerializer
+from ..models import Course, Module, Section, SectionItemInfo
+from ..cache import get_course_tree
+from ..ordering import apply_order
 from ...utils.helpers import get_user
+from .conditional import CourseContentConditionalMixin
 
 
 @extend_schema_view(
@@ -62,18 +67,29 @@ from ...utils.helpers import get_user
         description="Delete an existing section.",
         responses={"204": "Section deleted successfully."},
     ),
+    reorder=extend_schema(
+        tags=["Section"],
+        summary="Reorder Items",
+        description=(
+            "Apply a new order to all items of the section in one transaction. "
+            "Only moved rows are renumbered, within the gaps of the sparse sequence numbers."
+        ),
+        request=ReorderSerializer,
+        responses=SequenceSerializer(many=True),
+    ),
 )
-class SectionViewSet(viewsets.ModelViewSet):
+class SectionViewSet(CourseContentConditionalMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing sections. Provides actions to list, retrieve, create, update, and delete sections.
     """
+    course_id_field = "module__course_id"
 
     def get_queryset(self):
         """
         Retrieve the list of sections accessible by the current user.
         Optionally filter by `course_id` or `module_id`.
         """
-        queryset = Section.objects.accessible_by(get_user(self.request.user))
+        queryset = Section.objects.accessible_by(get_user(self.request.user)).select_related('module')
 
         course_id = self.request.query_params.get('course_id')
         if course_id is not None:
@@ -92,3 +108,56 @@ class SectionViewSet(viewsets.ModelViewSet):
         if self.action in ['list', 'retrieve']:
             return SectionDetailSerializer if self.action == 'retrieve' else SectionListSerializer
         return SectionDetailSerializer
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve the sections of a single course or module from the cached course tree.
+        """
+        user = get_user(request.user)
+        course_id = request.query_params.get('course_id')
+        module_id = request.query_params.get('module_id')
+
+        if course_id is not None:
+            course = Course.objects.accessible_by_id(user, course_id)
+            tree = get_course_tree(course.id) if course else None
+            module_ids = tree["module_order"] if tree else []
+        elif module_id is not None:
+            course_id = Module.objects.accessible_by(user).filter(
+                id=module_id
+            ).values_list('course_id', flat=True).first()
+            tree = get_course_tree(course_id) if course_id else None
+            module_ids = [int(module_id)] if tree and int(module_id) in tree["modules"] else []
+        else:
+            return super().list(request, *args, **kwargs)
+
+        data = [
+            tree["sections"][section_id]["list"]
+            for module_id in module_ids
+            for section_id in tree["modules"][module_id]["sections"]
+        ]
+
+        page = self.paginate_queryset(data)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve the section detail from the cached course tree once access is checked.
+        """
+        section = self.get_object()
+        cached = get_course_tree(section.module.course_id)["sections"].get(section.id)
+        if cached is None:
+            return super().retrieve(request, *args, **kwargs)
+        return Response(cached["detail"])
+
+    @action(detail=True, methods=["post"])
+    def reorder(self, request, *args, **kwargs):
+        """
+        Reorder the items of this section given the full list of their IDs.
+        """
+        parent = self.get_object()
+        serializer = ReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        sequences = apply_order(SectionItemInfo, parent, serializer.validated_data["order"])
+        return Response(SequenceSerializer(sequences, many=True).data)
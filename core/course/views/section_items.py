@@ -7,6 +7,8 @@ from rest_framework.response import Response
 from rest_framework.exceptions import NotFound, MethodNotAllowed
 from ..models import SectionItemInfo
 from ..serializers import VideoSerializer, ArticleSerializer
+from ..cache import get_course_tree, get_course_version
+from ...utils.views import ConditionalGetMixin
 
 from drf_spectacular.utils import extend_schema, OpenApiParameter, extend_schema_view
 
@@ -18,63 +20,88 @@ from ...assessment.serializers import AssessmentSerializer
 
     get=extend_schema(
         tags=['Item'],
-        description="Retrieve all section items for a given section ID in ascending order of their sequence.",
+        description=(
+            "Retrieve all section items for one or more section IDs in ascending order of their sequence. "
+            "Pass several IDs as a comma-separated list or by repeating `section_id` to load a whole "
+            "module's items in one request."
+        ),
         parameters=[
             OpenApiParameter(
                 name="section_id",
-                description="ID of the section whose items are to be fetched.",
+                description="ID(s) of the section(s) whose items are to be fetched.",
                 required=True,
-                type=int,
+                type=str,
             )
         ],
         responses={200: "List of Section Items"},
     )
 )
-class SectionItemViewSet(generics.ListAPIView):
+class SectionItemViewSet(ConditionalGetMixin, generics.ListAPIView):
     """
     API endpoint to list section items based on section ID in ascending order of sequence.
     """
     serializer_class = None  # Will dynamically set based on item type.
 
+    def get_section_ids(self):
+        """
+        Parse `section_id`, given as a comma-separated list or repeated.
+        """
+        return [
+            section_id.strip()
+            for value in self.request.query_params.getlist("section_id")
+            for section_id in value.split(",")
+            if section_id.strip()
+        ]
+
+    def get_section_courses(self):
+        """
+        Return `(section_id, course_id)` pairs for the requested sections.
+        """
+        if not hasattr(self, "_section_courses"):
+            self._section_courses = list(
+                Section.objects.filter(id__in=self.get_section_ids()).values_list(
+                    "id", "module__course_id"
+                )
+            )
+        return self._section_courses
+
+    def get_validators(self):
+        # Items carry no timestamps; the content version of their courses covers them.
+        section_ids = self.get_section_ids()
+        if not section_ids or not all(section_id.isdigit() for section_id in section_ids):
+            return None
+        versions = sorted(
+            (section_id, get_course_version(course_id))
+            for section_id, course_id in self.get_section_courses()
+        )
+        return self.make_etag(versions), None
+
     def get(self, request, *args, **kwargs):
-        section_id = request.query_params.get("section_id")
-        if not section_id:
+        section_ids = self.get_section_ids()
+        if not section_ids:
             return Response(
                 {"detail": "section_id query parameter is required."}, status=400
             )
+        if not all(section_id.isdigit() for section_id in section_ids):
+            return Response(
+                {"detail": "section_id must be a comma-separated list of integers."}, status=400
+            )
 
-        # Fetch the section items
-        section_items = SectionItemInfo.objects.filter(section_id=section_id).order_by(
-            "sequence"
-        )
+        # Serve the items of each section from the cached tree of its course
+        sections = []
+        for section_id, course_id in self.get_section_courses():
+            cached = get_course_tree(course_id)["sections"].get(section_id)
+            if cached is not None:
+                sections.append(cached)
+
+        data = [
+            item
+            for section in sorted(sections, key=lambda section: section["position"])
+            for item in section["items"]
+        ]
 
-        if not section_items.exists():
-            raise NotFound(f"No items found for section_id={section_id}.")
-
-        # Prepare the response data
-        data = []
-
-        for item in section_items:
-            if item.item_type == SectionItemType.VIDEO:
-                video = Video.objects.get(id=item.item_id)
-                serializer_data = VideoSerializer(video).data
-                serializer_data["item_type"] = SectionItemType.VIDEO
-                serializer_data["sequence"] = item.sequence
-            elif item.item_type == SectionItemType.ARTICLE:
-                print(item)
-                article = Article.objects.get(id=item.item_id)
-                serializer_data = ArticleSerializer(article).data
-                serializer_data["item_type"] = SectionItemType.ARTICLE
-                serializer_data["sequence"] = item.sequence
-            elif item.item_type == SectionItemType.ASSESSMENT:
-                assessment = Assessment.objects.get(id=item.item_id)
-                serializer_data = AssessmentSerializer(assessment).data
-                serializer_data["item_type"] = SectionItemType.ASSESSMENT
-                serializer_data["sequence"] = item.sequence
-            else:
-                serializer_data = {"detail": f"Unsupported item_type: {item.item_type}"}
-
-            data.append(serializer_data)
+        if not data:
+            raise NotFound(f"No items found for section_id={','.join(section_ids)}.")
 
         return Response(data, status=200)
 
@@ -109,7 +136,8 @@ class SectionItemViewSet(generics.ListAPIView):
         responses={204: None},
     ),
 )
-class VideoViewSet(viewsets.ModelViewSet):
+class VideoViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    conditional_actions = ("retrieve",)
     queryset = Video.objects.all()
     serializer_class = VideoSerializer
 
@@ -164,7 +192,8 @@ class VideoViewSet(viewsets.ModelViewSet):
         responses={204: None},
     ),
 )
-class ArticleViewSet(viewsets.ModelViewSet):
+class ArticleViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    conditional_actions = ("retrieve",)
     queryset = Article.objects.all()
     serializer_class = ArticleSerializer
 
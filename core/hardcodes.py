@@ -1 +0,0 @@
-ae_url = "https://cal-activity-engine.el.r.appspot.com/"
\ No newline at end of file
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_closure(apps, schema_editor):
+    Institution = apps.get_model('institution', 'Institution')
+    InstitutionClosure = apps.get_model('institution', 'InstitutionClosure')
+
+    parents = dict(Institution.objects.values_list('id', 'parent_id'))
+    links = []
+    for institution_id in parents:
+        ancestor_id, depth, seen = institution_id, 0, set()
+        while ancestor_id is not None and ancestor_id not in seen:
+            links.append(InstitutionClosure(ancestor_id=ancestor_id, descendant_id=institution_id, depth=depth))
+            seen.add(ancestor_id)
+            ancestor_id, depth = parents[ancestor_id], depth + 1
+    InstitutionClosure.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('institution', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstitutionClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='institution.institution')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='institution.institution')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['descendant', 'ancestor'], name='institution_closure_desc_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='institutionclosure',
+            constraint=models.UniqueConstraint(fields=('ancestor', 'descendant'), name='unique_institution_closure'),
+        ),
+        migrations.RunPython(populate_closure, migrations.RunPython.noop),
+    ]
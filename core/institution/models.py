@@ -1,12 +1,46 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
 
-from ..auth.permissions import ModelPermissionsMixin
+from ..auth.permissions import BatchPermissionsMixin
 from ..utils.models import TimestampMixin
-from ..user.models import User
+from ..user.memberships import get_memberships
+from ..user.models import Roles, User
 from . import constants as ct
 
 
-class Institution(TimestampMixin, ModelPermissionsMixin, models.Model):
+class InstitutionQuerySet(models.QuerySet):
+    def descendants(self, include_self=True):
+        """
+        Return every institution in the subtrees of the institutions of this queryset.
+
+        Args:
+            include_self (bool): Whether to include the subtree roots themselves.
+
+        Returns:
+            QuerySet: The institutions, filtered through the closure table in one query.
+        """
+        links = InstitutionClosure.objects.filter(ancestor__in=self.values("pk"))
+        if not include_self:
+            links = links.filter(depth__gt=0)
+        return self.model.objects.filter(pk__in=links.values("descendant_id"))
+
+    def ancestors(self, include_self=True):
+        """
+        Return every institution on the paths from the institutions of this queryset to their roots.
+
+        Args:
+            include_self (bool): Whether to include the institutions themselves.
+
+        Returns:
+            QuerySet: The institutions, filtered through the closure table in one query.
+        """
+        links = InstitutionClosure.objects.filter(descendant__in=self.values("pk"))
+        if not include_self:
+            links = links.filter(depth__gt=0)
+        return self.model.objects.filter(pk__in=links.values("ancestor_id"))
+
+
+class Institution(TimestampMixin, BatchPermissionsMixin, models.Model):
     name = models.CharField(max_length=ct.INSTITUTION_NAME_MAX_LEN, unique=True)
     description = models.TextField(
         null=True, blank=True, max_length=ct.INSTITUTION_DESCRIPTION_MAX_LEN
@@ -20,24 +54,112 @@ class Institution(TimestampMixin, ModelPermissionsMixin, models.Model):
     )
     is_active = models.BooleanField(default=False)
 
+    objects = InstitutionQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
-    def _has_access(self, user: User):
-        return user.institutions.filter(pk=self.pk).exists()
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "parent_id" in instance.__dict__:
+            # Remember the parent the row was loaded with, to detect moves on save
+            instance._loaded_parent_id = instance.parent_id
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Save the institution and keep the closure table in sync when it is
+        created or moved to another parent.
+
+        Raises:
+            ValidationError: If the new parent is the institution itself or one of its descendants.
+        """
+        adding = self._state.adding
+        moved = (
+            not adding
+            and hasattr(self, "_loaded_parent_id")
+            and self.parent_id != self._loaded_parent_id
+        )
+        if moved and self.parent_id is not None and InstitutionClosure.objects.filter(
+            ancestor_id=self.pk, descendant_id=self.parent_id
+        ).exists():
+            raise ValidationError("An institution cannot be moved under itself or one of its descendants.")
 
-    def student_has_access(self, user: User):
-        return (self._has_access(user), False, False)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                InstitutionClosure.objects.create(ancestor_id=self.pk, descendant_id=self.pk, depth=0)
+            elif moved:
+                self._detach_subtree()
+            if adding or moved:
+                self._attach_subtree()
+        self._loaded_parent_id = self.parent_id
 
-    def instructor_has_access(self, user: User):
-        return (self._has_access(user), False, False)
+    def _subtree_links(self):
+        return list(InstitutionClosure.objects.filter(ancestor_id=self.pk).values_list("descendant_id", "depth"))
 
-    def staff_has_access(self, user: User):
-        return (self._has_access(user), False, False)
+    def _detach_subtree(self):
+        """
+        Remove the links between this subtree and the ancestors of this institution.
+        """
+        subtree = [pk for pk, _ in self._subtree_links()]
+        InstitutionClosure.objects.filter(descendant_id__in=subtree).exclude(ancestor_id__in=subtree).delete()
 
-    def moderator_has_access(self, user: User):
-        has_access = self._has_access(user)
-        return (has_access, has_access, False)
+    def _attach_subtree(self):
+        """
+        Link this subtree to the current parent and all of its ancestors.
+        """
+        if self.parent_id is None:
+            return
+        ancestors = InstitutionClosure.objects.filter(descendant_id=self.parent_id).values_list("ancestor_id", "depth")
+        subtree = self._subtree_links()
+        InstitutionClosure.objects.bulk_create([
+            InstitutionClosure(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=up + down + 1)
+            for ancestor_id, up in ancestors
+            for descendant_id, down in subtree
+        ])
 
-    def admin_has_access(self, user: User):
-        return (True, True, False)
+    @classmethod
+    def role_access_for(cls, role, user: User, institutions):
+        """
+        Resolve the access of a user with `role` to many institutions from the user's memberships.
+
+        Members can read their institutions. Moderators can read and edit
+        their institutions and every institution below them.
+        """
+        ids = [institution.pk for institution in institutions]
+        if role == Roles.SUPERADMIN:
+            return {pk: (True, True, True) for pk in ids}
+        if role == Roles.ADMIN:
+            return {pk: (True, True, False) for pk in ids}
+
+        memberships = get_memberships(user)
+        if role == Roles.MODERATOR:
+            managed = memberships.subtree_institution_ids
+            return {pk: (pk in managed, pk in managed, False) for pk in ids}
+
+        return {pk: (pk in memberships.institution_ids, False, False) for pk in ids}
+
+
+class InstitutionClosure(models.Model):
+    """
+    One row for every pair of an institution and one of its descendants,
+    including itself at depth 0, so that whole subtrees and ancestor paths
+    can be read with one indexed query.
+    """
+
+    ancestor = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name="descendant_links")
+    descendant = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name="ancestor_links")
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["ancestor", "descendant"], name="unique_institution_closure")
+        ]
+        indexes = [
+            models.Index(fields=["descendant", "ancestor"], name="institution_closure_desc_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
@@ -6,3 +6,12 @@ class InstitutionSerializer(serializers.ModelSerializer):
         model = Institution
         # fields = '__all__'
         exclude = ('created_at', 'updated_at')
+
+    def validate_parent(self, parent):
+        if parent and self.instance and Institution.objects.filter(
+            pk=self.instance.pk
+        ).descendants().filter(pk=parent.pk).exists():
+            raise serializers.ValidationError(
+                "An institution cannot be moved under itself or one of its descendants."
+            )
+        return parent
@@ -0,0 +1,10 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .models import Institution
+
+
+@receiver(pre_delete, sender=Institution)
+def detach_deleted_subtree(sender, instance, **kwargs):
+    # Children become roots (SET_NULL), so their subtrees lose the deleted institution's ancestors
+    instance._detach_subtree()
@@ -1,6 +1,7 @@
 # tests/test_models.py
+from django.core.exceptions import ValidationError
 from django.test import TestCase
-from core.institution.models import Institution
+from core.institution.models import Institution, InstitutionClosure
 from core.institution.tests.factories import InstitutionFactory, UserFactory
 
 class TestInstitution(TestCase):
@@ -23,4 +24,49 @@ class TestInstitution(TestCase):
             with self.subTest(role=role):
                 user = UserFactory(role=role, email=f'{role}@test.com')  # Unique email
                 access = getattr(self.institution, f'{role}_has_access')(user)
-                self.assertEqual(access, expected_access)
\ No newline at end of file
+                self.assertEqual(access, expected_access)
+
+class TestInstitutionHierarchy(TestCase):
+    def setUp(self):
+        self.university = InstitutionFactory()
+        self.college = InstitutionFactory(parent=self.university)
+        self.department = InstitutionFactory(parent=self.college)
+        self.other = InstitutionFactory()
+
+    def subtree(self, institution, **kwargs):
+        return set(Institution.objects.filter(pk=institution.pk).descendants(**kwargs))
+
+    def test_descendants_and_ancestors(self):
+        assert self.subtree(self.university) == {self.university, self.college, self.department}
+        assert self.subtree(self.university, include_self=False) == {self.college, self.department}
+        assert set(Institution.objects.filter(pk=self.department.pk).ancestors()) == {
+            self.university, self.college, self.department
+        }
+
+    def test_subtree_is_one_query(self):
+        with self.assertNumQueries(1):
+            list(Institution.objects.filter(pk=self.university.pk).descendants())
+
+    def test_move_subtree(self):
+        self.college.parent = self.other
+        self.college.save()
+
+        assert self.subtree(self.university) == {self.university}
+        assert self.subtree(self.other) == {self.other, self.college, self.department}
+        assert InstitutionClosure.objects.get(ancestor=self.other, descendant=self.department).depth == 2
+
+    def test_cannot_move_under_descendant(self):
+        self.university.parent = self.department
+        with self.assertRaises(ValidationError):
+            self.university.save()
+
+    def test_delete_makes_children_roots(self):
+        self.college.delete()
+        assert self.subtree(self.university) == {self.university}
+        assert set(Institution.objects.filter(pk=self.department.pk).ancestors()) == {self.department}
+
+    def test_moderator_manages_subtree(self):
+        moderator = UserFactory(role='moderator', email='hierarchy.moderator@test.com', institutions=[self.university])
+        assert self.department.moderator_has_access(moderator) == (True, True, False)
+        assert self.other.moderator_has_access(moderator) == (False, False, False)
+        assert self.department.student_has_access(moderator) == (False, False, False)
@@ -68,6 +68,7 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # Add before CommonMiddleware
     'django.middleware.common.CommonMiddleware',
     'allauth.account.middleware.AccountMiddleware',
+    'core.user.memberships.MembershipScopeMiddleware',
 ]
 
 AUTHENTICATION_BACKENDS = [
@@ -196,7 +197,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'oauth2_provider.contrib.rest_framework.OAuth2Authentication',
+        'core.auth.authentication.SignedTokenAuthentication',
+        'core.auth.authentication.CachedOAuth2Authentication',
     ],
 
     # 'DEFAULT_PERMISSION_CLASSES': [
@@ -216,8 +218,80 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
     'PAGE_SIZE': 100,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+
+    # Reverse proxies in front of the app. Throttles key on the client address
+    # they appended to X-Forwarded-For, or on REMOTE_ADDR when there are none,
+    # never on addresses the client supplied itself.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 0)),
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# The local-memory backend is per process; use a shared backend (file, Redis,
+# Memcached) in deployments with several workers so invalidations reach all of them.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Seconds a materialized course tree stays cached for a given content version.
+COURSE_TREE_CACHE_TIMEOUT = 60 * 60
+
+# Seconds a user's set of accessible course IDs stays cached for given access versions.
+COURSE_ACCESS_CACHE_TIMEOUT = 60 * 60
+
+# Validated access tokens: entries per worker, seconds in the shared cache (capped at
+# the token's expiry) and seconds a worker trusts its own copy before re-reading the
+# shared cache, which bounds how long a token revoked on another worker stays usable.
+ACCESS_TOKEN_CACHE_SIZE = 10000
+ACCESS_TOKEN_CACHE_TIMEOUT = 5 * 60
+ACCESS_TOKEN_CACHE_LOCAL_TIMEOUT = 10
+
+# "oauth2" issues database-backed OAuth2 tokens on login; "signed" issues
+# self-contained signed tokens that are authenticated without a database lookup.
+AUTH_TOKEN_MODE = os.environ.get('AUTH_TOKEN_MODE', 'oauth2')
+
+# Return the user's still valid OAuth2 token pair on login instead of issuing a new one,
+# if it has at least LOGIN_TOKEN_REUSE_MIN_SECONDS left.
+LOGIN_REUSE_ACCESS_TOKEN = False
+LOGIN_TOKEN_REUSE_MIN_SECONDS = 5 * 60
+
+# Sliding-window limits of login and password reset attempts, as (attempts, seconds),
+# counted in the shared cache ("cache") or in each worker's memory ("local").
+LOGIN_THROTTLE_BACKEND = 'cache'
+LOGIN_THROTTLE_IP_RATE = (100, 60)
+LOGIN_THROTTLE_EMAIL_RATE = (10, 5 * 60)
+LOGIN_THROTTLE_LOCAL_SIZE = 100000
+
+# Activity engine base URL, and its client's connect and read timeouts in seconds, retries
+# of idempotent calls, pooled connections per process, and circuit breaker, which opens
+# after ACTIVITY_ENGINE_BREAKER_THRESHOLD consecutive failures for ACTIVITY_ENGINE_BREAKER_RESET seconds.
+ACTIVITY_ENGINE_URL = os.environ.get('ACTIVITY_ENGINE_URL', 'https://cal-activity-engine.el.r.appspot.com/')
+ACTIVITY_ENGINE_CONNECT_TIMEOUT = 3
+ACTIVITY_ENGINE_READ_TIMEOUT = 10
+ACTIVITY_ENGINE_RETRIES = 2
+ACTIVITY_ENGINE_POOL_SIZE = 10
+ACTIVITY_ENGINE_BREAKER_THRESHOLD = 5
+ACTIVITY_ENGINE_BREAKER_RESET = 30
+
+# Delivery of queued activity-engine progress initializations by dispatch_progress_outbox:
+# enrollments claimed per batch, students per call, and attempts before giving up,
+# waiting PROGRESS_OUTBOX_RETRY_DELAY seconds after the first failure and doubling up
+# to PROGRESS_OUTBOX_MAX_RETRY_DELAY.
+PROGRESS_OUTBOX_BATCH_SIZE = 1000
+PROGRESS_OUTBOX_MAX_STUDENTS = 500
+PROGRESS_OUTBOX_MAX_ATTEMPTS = 10
+PROGRESS_OUTBOX_RETRY_DELAY = 30
+PROGRESS_OUTBOX_MAX_RETRY_DELAY = 60 * 60
+
+# Maximum rows deleted per transaction by the purge_expired_tokens command.
+TOKEN_PURGE_BATCH_SIZE = 1000
+
+# Seconds a worker keeps its in-memory list of revoked signed tokens before reloading it.
+SIGNED_TOKEN_REVOCATION_REFRESH = 5
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Core API',
     'DESCRIPTION': 'API for Core',
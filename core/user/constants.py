@@ -1,3 +1,6 @@
 USER_FNAME_MAX_LEN = 255
 USER_LNAME_MAX_LEN = 255
 USER_EMAIL_MAX_LEN = 255
+
+# Students accepted by one bulk enrollment request
+BULK_ENROLLMENT_MAX_USERS = 5000
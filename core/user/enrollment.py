@@ -0,0 +1,53 @@
+from django.db import IntegrityError, transaction
+
+from core.course.access import bump_user_access
+from core.course.signals import bump_now_and_on_commit
+from .models import UserCourseInstance
+from .progress import enqueue_progress_initialization
+
+
+def _enrolled_ids(course_instance, user_ids):
+    return set(
+        UserCourseInstance.objects.filter(course=course_instance, user_id__in=user_ids)
+        .values_list("user_id", flat=True)
+    )
+
+
+def bulk_enroll(course_instance, user_ids):
+    """
+    Enroll many students in a course instance in a constant number of queries.
+
+    Students already enrolled are skipped. If one is enrolled concurrently,
+    between the read and the insert, the insert fails on the unique constraint
+    and is retried without them, so the counts only include the rows created
+    here. The new enrollments are queued for progress initialization, which the
+    outbox worker sends as a few coalesced calls sharing one course outline.
+
+    Args:
+        course_instance (CourseInstance): The course instance to enroll in.
+        user_ids (list[int]): The IDs of validated students, without duplicates.
+
+    Returns:
+        tuple[int, int]: The number of students enrolled and of those already enrolled.
+    """
+    with transaction.atomic():
+        enrolled = _enrolled_ids(course_instance, user_ids)
+        while True:
+            new_ids = [user_id for user_id in user_ids if user_id not in enrolled]
+            try:
+                with transaction.atomic():
+                    enrollments = UserCourseInstance.objects.bulk_create(
+                        [UserCourseInstance(user_id=user_id, course=course_instance) for user_id in new_ids]
+                    )
+                break
+            except IntegrityError:
+                # Only a concurrent enrollment is retried, as it shows up on a new read
+                concurrently_enrolled = _enrolled_ids(course_instance, user_ids)
+                if concurrently_enrolled == enrolled:
+                    raise
+                enrolled = concurrently_enrolled
+        enqueue_progress_initialization(enrollments)
+        # bulk_create() sends no post_save signal
+        if new_ids:
+            bump_now_and_on_commit(bump_user_access, *new_ids)
+    return len(new_ids), len(enrolled)
@@ -0,0 +1,73 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from core.course.models import CourseInstance
+from core.user.enrollment import bulk_enroll
+from core.user.models import Roles, User
+from core.user.progress import dispatch_pending
+from core.utils.activity_engine import activity_engine
+from core.utils.activity_engine_standin import StandInActivityEngine
+
+
+class Command(BaseCommand):
+    help = (
+        "Enroll a cohort of temporary students in a course instance and deliver their "
+        "progress initialization to a local activity-engine stand-in, reporting throughput "
+        "and failures. Test data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("course_instance", type=int, help="ID of the course instance to enroll in.")
+        parser.add_argument("--students", type=int, default=2000, help="Size of the cohort.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Enrollments claimed per outbox batch.")
+        parser.add_argument(
+            "--latency", type=float, nargs="+", default=[0], metavar="SECONDS",
+            help="Delay of every stand-in response, or the bounds of a random delay.",
+        )
+        parser.add_argument("--error-rate", type=float, default=0, help="Fraction of calls the stand-in fails.")
+
+    def handle(self, *args, **options):
+        try:
+            course_instance = CourseInstance.objects.get(pk=options["course_instance"])
+        except CourseInstance.DoesNotExist:
+            raise CommandError(f"Course instance {options['course_instance']} does not exist.")
+
+        latency = options["latency"]
+        engine = StandInActivityEngine(
+            latency=tuple(latency[:2]) if len(latency) > 1 else latency[0], error_rate=options["error_rate"]
+        )
+        activity_engine.metrics.reset()
+        activity_engine.breaker.record_success()
+
+        with engine, override_settings(ACTIVITY_ENGINE_URL=engine.url), transaction.atomic():
+            students = User.objects.bulk_create([
+                User(email=f"benchmark.enrollment.{index}@example.com", role=Roles.STUDENT, password="!")
+                for index in range(options["students"])
+            ])
+
+            started = time.perf_counter()
+            enrolled, _ = bulk_enroll(course_instance, [student.id for student in students])
+            enroll_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            result = dispatch_pending(options["batch_size"])
+            dispatch_seconds = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Enrolled {enrolled} students in {enroll_seconds:.2f}s ({enrolled / enroll_seconds:,.0f}/s)."
+        ))
+        self.stdout.write(self.style.SUCCESS(
+            f"Dispatched in {dispatch_seconds:.2f}s: sent {result.sent}, retrying {result.retried}, "
+            f"gave up on {result.failed}."
+        ))
+        for endpoint, stats in activity_engine.metrics.snapshot().items():
+            mean = stats["latency_sum"] / stats["calls"] if stats["calls"] else 0
+            self.stdout.write(
+                f"{endpoint}: {stats['calls']} calls, {stats['failures']} failed, "
+                f"{stats['rejected']} rejected by the open circuit, {mean * 1000:.0f}ms mean latency"
+            )
@@ -0,0 +1,35 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.user.progress import dispatch_pending
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the queued course progress initializations of new enrollments to the "
+        "activity engine, retrying failed calls with exponential backoff."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.PROGRESS_OUTBOX_BATCH_SIZE,
+            help="Maximum enrollments claimed at a time.",
+        )
+        parser.add_argument(
+            "--every", type=float,
+            help="Keep running and poll the outbox every this many seconds, instead of once.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            result = dispatch_pending(options["batch_size"])
+            if result or not options["every"]:
+                self.stdout.write(self.style.SUCCESS(
+                    f"Sent {result.sent}, retrying {result.retried} and gave up on {result.failed} "
+                    f"progress initializations."
+                ))
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
@@ -0,0 +1,137 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.db.models import CharField, Value
+
+
+# Snapshots of the current request, keyed by user ID; None outside a request scope
+_scope: ContextVar = ContextVar("membership_scope", default=None)
+
+
+@dataclass(frozen=True)
+class Memberships:
+    """
+    The institutions and courses a user belongs to, as ID sets.
+
+    Attributes:
+        institution_ids (frozenset): The user's institutions.
+        subtree_institution_ids (frozenset): The user's institutions and all their descendants.
+        enrolled_instance_ids (frozenset): The course instances the user is enrolled in.
+        enrolled_course_ids (frozenset): The courses of those instances.
+        instructor_course_ids (frozenset): The courses the user teaches.
+        personnel_instance_ids (frozenset): The course instances the user is assigned to as personnel.
+        personnel_course_ids (frozenset): The courses of those instances.
+    """
+
+    institution_ids: frozenset
+    subtree_institution_ids: frozenset
+    enrolled_instance_ids: frozenset
+    enrolled_course_ids: frozenset
+    instructor_course_ids: frozenset
+    personnel_instance_ids: frozenset
+    personnel_course_ids: frozenset
+
+
+def load_memberships(user):
+    """
+    Query the memberships of a user with two queries: one for the institution
+    subtrees and one for enrollments, instructor and personnel assignments.
+
+    Args:
+        user (User): The user whose memberships to load.
+
+    Returns:
+        Memberships: The user's memberships.
+    """
+    from ..course.models import CourseInstructor, CoursePersonnel
+    from ..institution.models import InstitutionClosure
+    from .models import UserCourseInstance
+
+    links = list(InstitutionClosure.objects.filter(ancestor__users=user).values_list(
+        "ancestor_id", "descendant_id"
+    ))
+
+    def tagged(queryset, tag, instance_field, course_field):
+        return queryset.values_list(
+            Value(tag, output_field=CharField()), instance_field, course_field
+        )
+
+    rows = (
+        tagged(UserCourseInstance.objects.filter(user=user), "enrolled", "course_id", "course__course_id")
+        .union(
+            tagged(CourseInstructor.objects.filter(instructor=user), "instructor", "id", "course_id"),
+            tagged(CoursePersonnel.objects.filter(personnel=user), "personnel", "course_id", "course__course_id"),
+            all=True,
+        )
+    )
+    instances, courses = {}, {}
+    for tag, instance_id, course_id in rows:
+        instances.setdefault(tag, set()).add(instance_id)
+        courses.setdefault(tag, set()).add(course_id)
+
+    return Memberships(
+        institution_ids=frozenset(ancestor_id for ancestor_id, _ in links),
+        subtree_institution_ids=frozenset(descendant_id for _, descendant_id in links),
+        enrolled_instance_ids=frozenset(instances.get("enrolled", ())),
+        enrolled_course_ids=frozenset(courses.get("enrolled", ())),
+        instructor_course_ids=frozenset(courses.get("instructor", ())),
+        personnel_instance_ids=frozenset(instances.get("personnel", ())),
+        personnel_course_ids=frozenset(courses.get("personnel", ())),
+    )
+
+
+def get_memberships(user):
+    """
+    Return the memberships of a user, loaded at most once per request scope.
+
+    Outside a scope, such as in management commands, they are loaded on every call.
+
+    Args:
+        user (User): The user whose memberships to return.
+
+    Returns:
+        Memberships: The user's memberships.
+    """
+    snapshots = _scope.get()
+    if snapshots is None:
+        return load_memberships(user)
+    if user.pk not in snapshots:
+        snapshots[user.pk] = load_memberships(user)
+    return snapshots[user.pk]
+
+
+def forget_memberships(*user_ids):
+    """
+    Drop the snapshots of the given users from the current scope, after their
+    memberships change.
+    """
+    snapshots = _scope.get()
+    if snapshots is not None:
+        for user_id in user_ids:
+            snapshots.pop(user_id, None)
+
+
+@contextmanager
+def membership_scope():
+    """
+    Share membership snapshots between the permission checks within the block.
+    """
+    token = _scope.set({})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class MembershipScopeMiddleware:
+    """
+    Open a membership scope for each request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with membership_scope():
+            return self.get_response(request)
@@ -1,2 +1,3 @@
 from .user import User, Roles
 from .user_bindings import UserCourseInstance, UserInstitution
+from .progress_outbox import ProgressInitialization
@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils import timezone
+
+from .user_bindings import UserCourseInstance
+
+
+class ProgressInitialization(models.Model):
+    """
+    An enrollment whose course progress still has to be initialized in the
+    activity engine.
+
+    Rows are written in the same transaction as the enrollment and deleted
+    once the activity engine accepted them, so the enrollment never waits on
+    the activity engine and no initialization is lost if it is down. After
+    `PROGRESS_OUTBOX_MAX_ATTEMPTS` failures, `failed_at` is set and the row is
+    no longer retried.
+    """
+
+    enrollment = models.OneToOneField(
+        UserCourseInstance, on_delete=models.CASCADE, related_name='progress_initialization'
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    failed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=models.Q(failed_at__isnull=True),
+                name='progress_init_pending_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Progress initialization of enrollment {self.enrollment_id}"
@@ -6,8 +6,9 @@ from django.contrib.auth.models import (
 from django.db import models
 
 from ... import institution
-from ...auth.permissions import ModelPermissionsMixin
+from ...auth.permissions import BatchPermissionsMixin
 from ...utils.models import TimestampMixin
+from ..memberships import get_memberships
 from .. import constants as ct
 
 
@@ -42,7 +43,7 @@ class UserManager(BaseUserManager):
         return self.create_user(email, password, **extra_fields)
 
 
-class User(AbstractBaseUser, PermissionsMixin, TimestampMixin, ModelPermissionsMixin):
+class User(AbstractBaseUser, PermissionsMixin, TimestampMixin, BatchPermissionsMixin):
     """Custom User model."""
 
     first_name = models.CharField(max_length=ct.USER_FNAME_MAX_LEN)
@@ -64,22 +65,43 @@ class User(AbstractBaseUser, PermissionsMixin, TimestampMixin, ModelPermissionsM
 
     USERNAME_FIELD = "email"
 
+    class Meta:
+        indexes = [
+            # Keyset pagination of the user list
+            models.Index(fields=["created_at", "id"], name="user_created_at_id_idx"),
+        ]
+
     def __str__(self):
         return f"{self.first_name} {self.last_name} <{self.email}>"
 
-    def student_has_access(self, user):
-        return (self == user, False, False)
-
-    def instructor_has_access(self, user):
-        has_access = self == user
-        return (has_access, has_access, False)
-
-    def staff_has_access(self, user):
-        return (self == user, False, False)
-
-    def moderator_has_access(self, user):
-        has_access = self.institutions.intersection(user.institutions).exists()
-        return (has_access, has_access, False)
-
-    def admin_has_access(self, user):
-        return (True, True, False)
\ No newline at end of file
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "role" in instance.__dict__ and "is_active" in instance.__dict__:
+            # Remember the access the row was loaded with, to revoke signed tokens when it changes
+            instance._loaded_access = (instance.role, instance.is_active)
+        return instance
+
+    @classmethod
+    def role_access_for(cls, role, user, users):
+        """
+        Resolve the access of a user with `role` to many users in at most one query.
+
+        Users can read their own account and instructors can also edit it.
+        Moderators manage the users of their institution subtrees.
+        """
+        ids = [other.pk for other in users]
+        if role == Roles.SUPERADMIN:
+            return {pk: (True, True, True) for pk in ids}
+        if role == Roles.ADMIN:
+            return {pk: (True, True, False) for pk in ids}
+        if role == Roles.MODERATOR:
+            shared = set(
+                cls._base_manager.filter(
+                    id__in=ids, institutions__in=get_memberships(user).subtree_institution_ids
+                ).values_list("id", flat=True)
+            )
+            return {pk: (pk in shared, pk in shared, False) for pk in ids}
+
+        can_edit_self = role == Roles.INSTRUCTOR
+        return {pk: (pk == user.pk, can_edit_self and pk == user.pk, False) for pk in ids}
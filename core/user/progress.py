@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+
+from core.course.outline import get_course_outline, progress_modules
+from core.utils.activity_engine import activity_engine
+from .models import ProgressInitialization
+
+
+INITIALIZE_PROGRESS_PATH = "v1/course-progress/initialize-progress"
+
+# Seconds a claimed row stays hidden from other workers while it is being sent
+CLAIM_SECONDS = 5 * 60
+
+
+@dataclass
+class DispatchResult:
+    """
+    The progress initializations handled by a dispatch.
+    """
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    def __bool__(self):
+        return bool(self.sent or self.retried or self.failed)
+
+    def __iadd__(self, other):
+        self.sent += other.sent
+        self.retried += other.retried
+        self.failed += other.failed
+        return self
+
+
+def enqueue_progress_initialization(enrollments):
+    """
+    Queue the activity-engine progress initialization of new enrollments.
+
+    Call it in the transaction that creates the enrollments, so that both are
+    committed or rolled back together. Enrollments already queued are skipped.
+
+    Args:
+        enrollments (Iterable[UserCourseInstance]): Saved enrollments.
+    """
+    ProgressInitialization.objects.bulk_create(
+        [ProgressInitialization(enrollment=enrollment) for enrollment in enrollments],
+        ignore_conflicts=True,
+    )
+
+
+def retry_delay(attempts):
+    """
+    Return the seconds to wait after a number of failed attempts, doubling each time.
+    """
+    delay = settings.PROGRESS_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return min(delay, settings.PROGRESS_OUTBOX_MAX_RETRY_DELAY)
+
+
+def claim_batch(batch_size):
+    """
+    Return up to `batch_size` due rows, hidden from other workers for `CLAIM_SECONDS`.
+
+    Claiming and sending are separate transactions, so no lock is held while
+    the activity engine is called. A worker that dies mid-batch leaves its
+    rows to be picked up again once the claim expires.
+    """
+    with transaction.atomic():
+        rows = list(
+            ProgressInitialization.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(failed_at__isnull=True, next_attempt_at__lte=now())
+            .select_related("enrollment__course")
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        ProgressInitialization.objects.filter(pk__in=[row.pk for row in rows]).update(
+            next_attempt_at=now() + timedelta(seconds=CLAIM_SECONDS)
+        )
+    return rows
+
+
+def _payloads(rows):
+    """
+    Yield the rows of each initialize-progress call with its payload.
+
+    Enrollments in the same course instance share one call of at most
+    `PROGRESS_OUTBOX_MAX_STUDENTS` students, and each course outline is
+    loaded once.
+    """
+    by_instance = {}
+    for row in rows:
+        by_instance.setdefault(row.enrollment.course, []).append(row)
+
+    outlines = {}
+    chunk_size = settings.PROGRESS_OUTBOX_MAX_STUDENTS
+    for course_instance, instance_rows in by_instance.items():
+        if course_instance.course_id not in outlines:
+            outlines[course_instance.course_id] = progress_modules(get_course_outline(course_instance.course_id))
+
+        for start in range(0, len(instance_rows), chunk_size):
+            chunk = instance_rows[start:start + chunk_size]
+            yield chunk, {
+                "courseInstanceId": str(course_instance.id),
+                "studentIds": [str(row.enrollment.user_id) for row in chunk],
+                "modules": outlines[course_instance.course_id],
+            }
+
+
+def dispatch_batch(batch_size):
+    """
+    Claim a batch of due progress initializations and send them to the activity engine.
+
+    Sent rows are deleted. Failed rows are retried with exponential backoff,
+    until `PROGRESS_OUTBOX_MAX_ATTEMPTS` is reached.
+
+    Args:
+        batch_size (int): The maximum number of rows claimed.
+
+    Returns:
+        DispatchResult: What happened to the claimed rows.
+    """
+    result = DispatchResult()
+    for chunk, payload in _payloads(claim_batch(batch_size)):
+        try:
+            activity_engine.post(INITIALIZE_PROGRESS_PATH, json=payload)
+        except requests.exceptions.RequestException as e:
+            failed_at = now()
+            for row in chunk:
+                row.attempts += 1
+                row.last_error = str(e)
+                if row.attempts >= settings.PROGRESS_OUTBOX_MAX_ATTEMPTS:
+                    row.failed_at = failed_at
+                    result.failed += 1
+                else:
+                    row.next_attempt_at = failed_at + timedelta(seconds=retry_delay(row.attempts))
+                    result.retried += 1
+            ProgressInitialization.objects.bulk_update(
+                chunk, ["attempts", "last_error", "failed_at", "next_attempt_at"]
+            )
+        else:
+            ProgressInitialization.objects.filter(pk__in=[row.pk for row in chunk]).delete()
+            result.sent += len(chunk)
+    return result
+
+
+def dispatch_pending(batch_size):
+    """
+    Send every due progress initialization, batch by batch.
+
+    Returns:
+        DispatchResult: What happened to the rows that were due.
+    """
+    total = DispatchResult()
+    while True:
+        result = dispatch_batch(batch_size)
+        if not result:
+            return total
+        total += result
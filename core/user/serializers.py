@@ -1,5 +1,8 @@
 from rest_framework import serializers
-from .models import User, UserInstitution, UserCourseInstance
+
+from core.course.models import CourseInstance
+from .constants import BULK_ENROLLMENT_MAX_USERS
+from .models import Roles, User, UserInstitution, UserCourseInstance
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,4 +17,25 @@ class UserInstitutionSerializer(serializers.ModelSerializer):
 class UserCoursesSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserCourseInstance
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+class BulkEnrollmentSerializer(serializers.Serializer):
+    course = serializers.PrimaryKeyRelatedField(queryset=CourseInstance.objects.all())
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=BULK_ENROLLMENT_MAX_USERS
+    )
+
+    def validate_user_ids(self, user_ids):
+        """
+        Check in one query that every user exists and is a student.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        roles = dict(User.objects.filter(pk__in=user_ids).values_list("id", "role"))
+
+        missing = [user_id for user_id in user_ids if user_id not in roles]
+        if missing:
+            raise serializers.ValidationError(f"Users not found: {missing}")
+        not_students = [user_id for user_id in user_ids if roles[user_id] != Roles.STUDENT]
+        if not_students:
+            raise serializers.ValidationError(f"Only students can be enrolled; these users are not: {not_students}")
+        return user_ids
@@ -0,0 +1,41 @@
+# tests/models/test_memberships.py
+from django.test import TestCase
+from core.course.models import CourseInstructor
+from core.course.tests.factories import CourseFactory, CourseInstanceFactory
+from core.institution.tests.factories import InstitutionFactory
+from core.user.memberships import get_memberships, load_memberships, membership_scope
+from core.user.models import UserCourseInstance
+from core.user.tests.factories import UserFactory
+
+
+class TestMemberships(TestCase):
+    def setUp(self):
+        self.university = InstitutionFactory()
+        self.college = InstitutionFactory(parent=self.university)
+        self.user = UserFactory(email='memberships@example.com', role='instructor', institutions=[self.university])
+        self.course = CourseFactory()
+        self.instance = CourseInstanceFactory(course=self.course)
+
+    def test_loads_memberships_in_two_queries(self):
+        UserCourseInstance.objects.create(user=self.user, course=self.instance)
+        CourseInstructor.objects.create(course=self.course, instructor=self.user)
+
+        with self.assertNumQueries(2):
+            memberships = load_memberships(self.user)
+
+        assert memberships.institution_ids == {self.university.id}
+        assert memberships.subtree_institution_ids == {self.university.id, self.college.id}
+        assert memberships.enrolled_instance_ids == {self.instance.id}
+        assert memberships.enrolled_course_ids == {self.course.id}
+        assert memberships.instructor_course_ids == {self.course.id}
+        assert memberships.personnel_course_ids == frozenset()
+
+    def test_snapshot_is_shared_within_a_scope(self):
+        with membership_scope():
+            get_memberships(self.user)
+            with self.assertNumQueries(0):
+                assert self.university.instructor_has_access(self.user) == (True, False, False)
+                get_memberships(self.user)
+
+            CourseInstructor.objects.create(course=self.course, instructor=self.user)
+            assert get_memberships(self.user).instructor_course_ids == {self.course.id}
@@ -0,0 +1,70 @@
+# tests/test_progress.py
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+
+from core.course.tests.factories import CourseInstanceFactory, ModuleFactory, SectionFactory
+from core.user.models import ProgressInitialization, Roles, UserCourseInstance
+from core.user.progress import INITIALIZE_PROGRESS_PATH, dispatch_pending, enqueue_progress_initialization
+from core.user.tests.factories import UserFactory
+
+
+@override_settings(PROGRESS_OUTBOX_MAX_ATTEMPTS=2, PROGRESS_OUTBOX_RETRY_DELAY=60)
+class TestProgressOutbox(TestCase):
+    @pytest.fixture(autouse=True)
+    def use_standin(self, activity_engine_standin):
+        self.engine = activity_engine_standin
+
+    def setUp(self):
+        self.course_instance = CourseInstanceFactory()
+        self.module = ModuleFactory(course=self.course_instance.course, sequence=1)
+        SectionFactory(module=self.module, sequence=1)
+        self.students = [UserFactory(role=Roles.STUDENT) for _ in range(3)]
+        enqueue_progress_initialization([
+            UserCourseInstance.objects.create(user=student, course=self.course_instance)
+            for student in self.students
+        ])
+
+    def test_enrollments_of_an_instance_share_one_call(self):
+        result = dispatch_pending(batch_size=10)
+
+        assert (result.sent, result.retried, result.failed) == (3, 0, 0)
+        assert not ProgressInitialization.objects.exists()
+        [call] = self.engine.calls
+        assert (call.path, call.status) == (INITIALIZE_PROGRESS_PATH, 200)
+        payload = call.payload
+        assert payload['courseInstanceId'] == str(self.course_instance.id)
+        assert payload['studentIds'] == [str(student.id) for student in self.students]
+        assert payload['modules'][0]['moduleId'] == str(self.module.id)
+        assert len(payload['modules'][0]['sections']) == 1
+
+    @override_settings(PROGRESS_OUTBOX_MAX_STUDENTS=2)
+    def test_calls_are_chunked_and_batched(self):
+        assert dispatch_pending(batch_size=2).sent == 3
+        assert [len(call.payload['studentIds']) for call in self.engine.calls] == [2, 1]
+
+    def test_failures_back_off_then_give_up(self):
+        self.engine.error_rate = 1
+
+        result = dispatch_pending(batch_size=10)
+        assert (result.sent, result.retried, result.failed) == (0, 3, 0)
+        for row in ProgressInitialization.objects.all():
+            assert row.attempts == 1
+            assert row.next_attempt_at > now()
+            assert '503' in row.last_error
+
+        # Not due yet
+        assert not dispatch_pending(batch_size=10)
+
+        ProgressInitialization.objects.update(next_attempt_at=now())
+        assert dispatch_pending(batch_size=10).failed == 3
+        assert not ProgressInitialization.objects.filter(failed_at__isnull=True).exists()
+
+    def test_command_drains_outbox(self):
+        out = StringIO()
+        call_command('dispatch_progress_outbox', stdout=out)
+        assert 'Sent 3' in out.getvalue()
+        assert len(self.engine.calls_to(INITIALIZE_PROGRESS_PATH)) == 1
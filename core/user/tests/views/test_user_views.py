@@ -2,7 +2,12 @@
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
-from core.user.models import User, Roles
+from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from core.course.tests.factories import CourseInstanceFactory
+from core.user import enrollment
+from core.user.models import ProgressInitialization, User, Roles, UserCourseInstance
 from core.user.tests.factories import UserFactory
 
 class TestUserViewSet(APITestCase):
@@ -18,6 +23,42 @@ class TestUserViewSet(APITestCase):
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 3  # Should include the admin user too
 
+    def test_keyset_pagination_walks_all_users(self):
+        """Test following cursor links visits every user once, in (created_at, id) order"""
+        for index in range(4):
+            UserFactory(email=f'keyset{index}@example.com')
+        expected = list(User.objects.order_by('created_at', 'id').values_list('id', flat=True))
+
+        seen = []
+        response = self.client.get(self.list_url, {'cursor': '', 'limit': 2})
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data['count'] == len(expected)
+            seen += [user['id'] for user in response.data['results']]
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+        assert seen == expected
+
+    def test_pagination_without_count(self):
+        """Test count=false omits the total and skips the COUNT query"""
+        for index in range(2):
+            UserFactory(email=f'nocount{index}@example.com')
+
+        response = self.client.get(self.list_url, {'cursor': '', 'limit': 2, 'count': 'false'})
+        assert 'count' not in response.data
+        assert response.data['next'] is not None
+
+        response = self.client.get(self.list_url, {'limit': 2, 'offset': 2, 'count': 'false'})
+        assert 'count' not in response.data
+        assert response.data['next'] is None
+        assert len(response.data['results']) == 1
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor is rejected"""
+        response = self.client.get(self.list_url, {'cursor': 'not-a-cursor'})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_create_user(self):
         """Test creating new user"""
         data = {
@@ -29,4 +70,96 @@ class TestUserViewSet(APITestCase):
         }
         response = self.client.post(self.list_url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        assert User.objects.filter(email='new@example.com').exists()
\ No newline at end of file
+        assert User.objects.filter(email='new@example.com').exists()
+
+class TestUserCoursesViewSet(APITestCase):
+    def setUp(self):
+        self.admin_user = UserFactory(role=Roles.ADMIN)
+        self.client.force_authenticate(user=self.admin_user)
+        self.list_url = reverse('usercourseinstance-list')
+
+    def test_enrollment_queues_progress_initialization(self):
+        """Test enrolling a student queues the activity-engine call instead of making it"""
+        course_instance = CourseInstanceFactory()
+        student = UserFactory(role=Roles.STUDENT)
+
+        with patch('requests.Session.request') as request:
+            response = self.client.post(self.list_url, {'user': student.id, 'course': course_instance.id})
+        assert response.status_code == status.HTTP_201_CREATED
+        request.assert_not_called()
+
+        queued = ProgressInitialization.objects.get()
+        assert queued.enrollment_id == response.data['id']
+        assert queued.attempts == 0
+
+
+class TestBulkEnrollment(APITestCase):
+    def setUp(self):
+        self.admin_user = UserFactory(role=Roles.ADMIN)
+        self.client.force_authenticate(user=self.admin_user)
+        self.url = reverse('usercourseinstance-bulk')
+        self.course_instance = CourseInstanceFactory()
+
+    def create_students(self, count, prefix):
+        return [
+            user.id for user in User.objects.bulk_create([
+                User(email=f'{prefix}.{index}@example.com', role=Roles.STUDENT) for index in range(count)
+            ])
+        ]
+
+    def enroll(self, user_ids):
+        return self.client.post(self.url, {'course': self.course_instance.id, 'user_ids': user_ids})
+
+    def test_enrolls_and_skips_duplicates(self):
+        user_ids = self.create_students(20, 'bulk')
+        UserCourseInstance.objects.create(user_id=user_ids[0], course=self.course_instance)
+
+        response = self.enroll(user_ids + user_ids[:5])
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {'enrolled': 19, 'already_enrolled': 1}
+        assert UserCourseInstance.objects.filter(course=self.course_instance).count() == 20
+        assert ProgressInitialization.objects.count() == 19
+
+    def test_concurrent_enrollment_is_not_counted(self):
+        user_ids = self.create_students(3, 'race')
+        read_enrolled_ids = enrollment._enrolled_ids
+
+        def enroll_first_after_read(course_instance, ids):
+            # Another request enrolls the first student right after the first read
+            enrolled = read_enrolled_ids(course_instance, ids)
+            if not enrolled:
+                UserCourseInstance.objects.create(user_id=user_ids[0], course=course_instance)
+            return enrolled
+
+        with patch.object(enrollment, '_enrolled_ids', side_effect=enroll_first_after_read), \
+                patch.object(enrollment, 'bump_now_and_on_commit') as bump:
+            response = self.enroll(user_ids)
+
+        assert response.data == {'enrolled': 2, 'already_enrolled': 1}
+        assert bump.call_args.args[1:] == tuple(user_ids[1:])
+        assert ProgressInitialization.objects.count() == 2
+
+    def test_query_count_does_not_grow_with_cohort(self):
+        # Under SQLite's limit of 999 parameters, which splits larger inserts
+        small_cohort, large_cohort = self.create_students(5, 'small'), self.create_students(150, 'large')
+        with CaptureQueriesContext(connection) as small:
+            self.enroll(small_cohort)
+        with CaptureQueriesContext(connection) as large:
+            self.enroll(large_cohort)
+        assert len(large) == len(small)
+
+    def test_rejects_unknown_users_and_non_students(self):
+        user_ids = self.create_students(2, 'valid')
+        instructor = UserFactory(role=Roles.INSTRUCTOR)
+
+        for invalid in (999999, instructor.id):
+            response = self.enroll(user_ids + [invalid])
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert str(invalid) in str(response.data['user_ids'])
+        assert not UserCourseInstance.objects.exists()
+
+    def test_students_cannot_enroll_others(self):
+        self.client.force_authenticate(user=UserFactory(role=Roles.STUDENT))
+        response = self.enroll(self.create_students(2, 'other'))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -1,11 +1,16 @@
-import requests
-from rest_framework import viewsets
+from django.db import transaction
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from core.course.models import Course
+from core.auth.permissions import WriteAccessPermission
+from .enrollment import bulk_enroll
 from .models import User, UserInstitution, UserCourseInstance
-from .serializers import UserSerializer, UserInstitutionSerializer, UserCoursesSerializer
-from core.hardcodes import ae_url
+from .progress import enqueue_progress_initialization
+from .serializers import BulkEnrollmentSerializer, UserSerializer, UserInstitutionSerializer, UserCoursesSerializer
+from core.utils.pagination import KeysetPagination
 
 
 @extend_schema_view(
@@ -51,6 +56,8 @@ from core.hardcodes import ae_url
 )
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
+    pagination_class = KeysetPagination
+    keyset_ordering = ("created_at", "id")
     serializer_class = UserSerializer
 
 
@@ -97,6 +104,8 @@ class UserViewSet(viewsets.ModelViewSet):
 )
 class UserInstitutionViewSet(viewsets.ModelViewSet):
     queryset = UserInstitution.objects.all()
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
     serializer_class = UserInstitutionSerializer
 
 
@@ -140,57 +149,46 @@ class UserInstitutionViewSet(viewsets.ModelViewSet):
         description="Delete an existing user course instance.",
         responses={"204": "Course instance deleted successfully."},
     ),
+    bulk=extend_schema(
+        tags=["User Courses"],
+        summary="Bulk Enroll Students",
+        description=(
+            "Enroll up to thousands of students in a course instance at once. The user IDs are "
+            "validated in one query and students already enrolled are skipped. Progress "
+            "initialization is queued and sent to the activity engine in a few coalesced calls."
+        ),
+        request=BulkEnrollmentSerializer,
+        responses={
+            201: {
+                "type": "object",
+                "properties": {"enrolled": {"type": "integer"}, "already_enrolled": {"type": "integer"}},
+            },
+        },
+    ),
 )
 class UserCoursesViewSet(viewsets.ModelViewSet):
     queryset = UserCourseInstance.objects.all()
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
     serializer_class = UserCoursesSerializer
 
     def perform_create(self, serializer):
-        # Save the course-user relationship
-        instance = serializer.save()
-
-        # Fetch course details for the payload
-        course = instance.course
-        course = Course.objects.get(id=course.id)
-
-        modules = course.modules.all()
-
-        # Construct `modules` part of the payload
-        modules_payload = []
-        for module in modules:
-            sections_payload = []
-            for section in module.sections.all():
-                items_payload = []
-                for item in section.section_item_info.all():
-                    items_payload.append({
-                        "sectionItemId": item.prefixed_item_id,
-                        "sequence": item.sequence,
-                    })
-                sections_payload.append({
-                    "sectionId": f"{section.id}",
-                    "sequence": section.sequence,
-                    "sectionItems": items_payload,
-                })
-            modules_payload.append({
-                "moduleId": f"{module.id}",
-                "sequence": module.sequence,
-                "sections": sections_payload,
-            })
-
-        # Prepare the full payload
-        payload = {
-            "courseInstanceId": str(course.id),
-            "studentIds": [str(instance.user.id)],
-            "modules": modules_payload,
-        }
+        # The activity engine is notified by the outbox worker once this commits
+        with transaction.atomic():
+            instance = serializer.save()
+            enqueue_progress_initialization([instance])
 
-        # Send the POST request
-        url = f"{ae_url}v1/course-progress/initialize-progress"
+    @action(detail=False, methods=["post"], permission_classes=[IsAuthenticated, WriteAccessPermission])
+    def bulk(self, request, *args, **kwargs):
+        """
+        Enroll many students in a course instance in a constant number of queries.
+        """
+        serializer = BulkEnrollmentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        course_instance = serializer.validated_data["course"]
+        self.check_object_permissions(request, course_instance)
 
-        try:
-            response = requests.post(url, json=payload)
-            print("Successfully sent!")
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            # Handle request exceptions if needed
-            raise Exception(f"Error sending course initialization: {e}")
\ No newline at end of file
+        enrolled, already_enrolled = bulk_enroll(course_instance, serializer.validated_data["user_ids"])
+        return Response(
+            {"enrolled": enrolled, "already_enrolled": already_enrolled}, status=status.HTTP_201_CREATED
+        )
@@ -0,0 +1,231 @@
+import bisect
+import os
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf"))
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Raised instead of calling the activity engine while the circuit is open.
+
+    It is a `requests` exception, so callers handling failed calls handle it too.
+    """
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing service for a while, so that callers fail fast
+    instead of each waiting for a timeout.
+
+    After `threshold` consecutive failures the circuit opens, and calls are
+    rejected for `reset_timeout` seconds. Then a single trial call is let
+    through: its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, threshold, reset_timeout):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._trial = False
+
+    def release(self):
+        """
+        End a call that did not reach the service, without judging its health.
+
+        A trial call that fails this way lets the next call be the trial.
+        """
+        with self._lock:
+            self._trial = False
+
+
+class Metrics:
+    """
+    Call counts, failure counts and latency histograms per endpoint, for this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = defaultdict(lambda: {
+                "calls": 0,
+                "failures": 0,
+                "rejected": 0,
+                "latency_sum": 0.0,
+                "latency_buckets": [0] * len(LATENCY_BUCKETS),
+            })
+
+    def observe(self, endpoint, seconds, failed):
+        with self._lock:
+            stats = self._endpoints[endpoint]
+            stats["calls"] += 1
+            stats["failures"] += failed
+            stats["latency_sum"] += seconds
+            stats["latency_buckets"][bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def reject(self, endpoint):
+        with self._lock:
+            self._endpoints[endpoint]["rejected"] += 1
+
+    def snapshot(self):
+        """
+        Return the metrics of each endpoint, keyed by "METHOD path".
+
+        Latency buckets are keyed by their upper bound and count the calls
+        that took at most that long, like a Prometheus histogram.
+        """
+        with self._lock:
+            snapshot = {}
+            for endpoint, stats in self._endpoints.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(LATENCY_BUCKETS, stats["latency_buckets"]):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot[endpoint] = {**stats, "latency_buckets": buckets}
+            return snapshot
+
+
+class ActivityEngineClient:
+    """
+    An HTTP client for the activity engine, shared by the calls of a process.
+
+    Connections are pooled and kept alive by one `requests.Session` per
+    process, every call has connect and read timeouts, and a circuit breaker
+    rejects calls while the engine keeps failing. Idempotent methods are
+    retried on connection errors and 502, 503 and 504 responses; POST calls
+    are not, and are left to the caller, like the progress outbox, to retry.
+
+    The base URL and the limits come from the `ACTIVITY_ENGINE_*` settings.
+    """
+
+    def __init__(self):
+        self.metrics = Metrics()
+        self.breaker = CircuitBreaker(
+            settings.ACTIVITY_ENGINE_BREAKER_THRESHOLD, settings.ACTIVITY_ENGINE_BREAKER_RESET
+        )
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        # Pooled sockets must not be shared with processes forked after they were opened
+        with self._lock:
+            if self._session is None or self._pid != os.getpid():
+                self._session = self._create_session()
+                self._pid = os.getpid()
+            return self._session
+
+    def _create_session(self):
+        retry = Retry(
+            total=settings.ACTIVITY_ENGINE_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=settings.ACTIVITY_ENGINE_POOL_SIZE, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def request(self, method, path, **kwargs):
+        """
+        Call an activity-engine endpoint.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The endpoint path, relative to `ACTIVITY_ENGINE_URL`.
+            **kwargs: Passed on to `requests.Session.request`, like `json`.
+
+        Returns:
+            requests.Response: The successful response.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and the engine was not called.
+            requests.exceptions.RequestException: If the call failed or got an error status.
+        """
+        endpoint = f"{method.upper()} {path}"
+        if not self.breaker.allow():
+            self.metrics.reject(endpoint)
+            raise CircuitOpenError(f"Activity engine circuit is open, not calling {endpoint}")
+
+        kwargs.setdefault(
+            "timeout", (settings.ACTIVITY_ENGINE_CONNECT_TIMEOUT, settings.ACTIVITY_ENGINE_READ_TIMEOUT)
+        )
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, f"{settings.ACTIVITY_ENGINE_URL}{path}", **kwargs)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # Client errors mean the engine is up, so they do not trip the breaker
+            response = getattr(e, "response", None)
+            if response is not None and response.status_code < 500:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+            self.metrics.observe(endpoint, time.perf_counter() - started, failed=True)
+            raise
+        except Exception:
+            # Like a payload that cannot be encoded: a trial call must not stay pending forever
+            self.breaker.release()
+            raise
+
+        self.breaker.record_success()
+        self.metrics.observe(endpoint, time.perf_counter() - started, failed=False)
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+
+activity_engine = ActivityEngineClient()
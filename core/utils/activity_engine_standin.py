@@ -0,0 +1,182 @@
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@dataclass
+class RecordedCall:
+    """
+    A request received by the stand-in, with the status it was answered with.
+    """
+
+    method: str
+    path: str
+    payload: object
+    status: int
+
+
+def _valid_progress(payload):
+    return (
+        isinstance(payload, dict)
+        and isinstance(payload.get("courseInstanceId"), str)
+        and isinstance(payload.get("studentIds"), list)
+        and isinstance(payload.get("modules"), list)
+    )
+
+
+def _valid_login(payload):
+    return isinstance(payload, dict) and "user_id" in payload and "access_token" in payload
+
+
+# (method, path pattern, payload validator) of the endpoints the stand-in implements
+ROUTES = [
+    ("POST", re.compile(r"v1/course-progress/initialize-progress"), _valid_progress),
+    ("POST", re.compile(r"auth"), _valid_login),
+    ("DELETE", re.compile(r"auth/\d+"), None),
+]
+
+
+class StandInActivityEngine:
+    """
+    A local stand-in for the activity engine, for integration and load tests.
+
+    It implements the initialize-progress and auth endpoints, records every
+    request it receives, and can be slowed down or made to fail:
+
+    - `latency` delays every response by that many seconds, or by a random
+      duration within a `(min, max)` pair;
+    - `error_rate` answers that fraction of requests with `error_status`;
+    - `fail_next()` answers the next requests with given statuses.
+
+    Usage:
+        with StandInActivityEngine(latency=0.05) as engine:
+            with override_settings(ACTIVITY_ENGINE_URL=engine.url):
+                ...
+            engine.calls  # What was received
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0, error_rate=0, error_status=503, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.calls = []
+        self._scripted = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        """
+        Serve requests from a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def fail_next(self, *statuses):
+        """
+        Answer the next requests with these statuses, in order, whatever the error rate.
+        """
+        with self._lock:
+            self._scripted.extend(statuses)
+
+    def reset(self):
+        """
+        Forget the recorded calls and scripted failures.
+        """
+        with self._lock:
+            self.calls = []
+            self._scripted = []
+
+    def calls_to(self, path):
+        return [call for call in self.calls if call.path == path]
+
+    def _delay(self):
+        if isinstance(self.latency, (tuple, list)):
+            with self._lock:
+                return self._random.uniform(*self.latency)
+        return self.latency
+
+    def _injected_status(self):
+        with self._lock:
+            if self._scripted:
+                return self._scripted.pop(0)
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def handle(self, method, path, body):
+        """
+        Return the status of a request, and record it.
+        """
+        path = path.lstrip("/")
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            payload = body
+
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+
+        status = self._injected_status()
+        if status is None:
+            status = 404
+            for route_method, pattern, validate in ROUTES:
+                if route_method == method and pattern.fullmatch(path):
+                    status = 200 if validate is None or validate(payload) else 400
+                    break
+
+        with self._lock:
+            self.calls.append(RecordedCall(method, path, payload, status))
+        return status
+
+    def _handler_class(self):
+        engine = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                status = engine.handle(self.command, self.path, self.rfile.read(length) if length else b"")
+                body = json.dumps({"status": status}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = respond
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+
+def get_version(key):
+    """
+    Return the current value of a version counter.
+
+    Versions start from a nanosecond timestamp, so a version key that was evicted
+    is re-created above every value it held before and stale entries are never reused.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(*keys):
+    """
+    Move the given version counters forward, invalidating entries keyed on them.
+    """
+    for key in set(keys):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+class LRUCache:
+    """
+    A bounded, thread-safe, in-process cache whose entries also expire.
+
+    When full, setting a new key evicts the least recently used entry.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout):
+        """
+        Store `value` for `timeout` seconds.
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,44 @@
+import re
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+
+from core.utils.activity_engine_standin import StandInActivityEngine
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve a local stand-in for the activity engine, with optional latency and error "
+        "injection. Point ACTIVITY_ENGINE_URL at it to run enrollments and logins offline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument(
+            "--latency", type=float, nargs="+", default=[0], metavar="SECONDS",
+            help="Delay of every response, or the bounds of a random delay.",
+        )
+        parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests answered with an error.")
+        parser.add_argument("--error-status", type=int, default=503, help="Status of injected errors.")
+
+    def handle(self, *args, **options):
+        latency = options["latency"]
+        engine = StandInActivityEngine(
+            host=options["host"],
+            port=options["port"],
+            latency=tuple(latency[:2]) if len(latency) > 1 else latency[0],
+            error_rate=options["error_rate"],
+            error_status=options["error_status"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Activity engine stand-in listening on {engine.url}"))
+        try:
+            engine.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            engine.stop()
+
+        statuses = Counter((call.method, re.sub(r"\d+", "<id>", call.path), call.status) for call in engine.calls)
+        for (method, path, status), count in sorted(statuses.items()):
+            self.stdout.write(f"{method} {path}: {count} answered {status}")
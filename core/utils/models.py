@@ -6,3 +6,25 @@ class TimestampMixin(models.Model):
 
     class Meta:
         abstract = True
+
+
+class CounterFieldsMixin(models.Model):
+    """
+    Keeps denormalized counter columns out of regular saves.
+
+    Counters are maintained with `F()` expressions, so the copy held by an
+    in-memory instance may be stale and must not be written back.
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
+
+    class Meta:
+        abstract = True
@@ -0,0 +1,157 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination with an opt-in keyset mode and an optional count.
+
+    Passing `cursor` (empty for the first page) switches a request to keyset
+    pagination: a page is selected with `WHERE (key) > (last key of the previous
+    page)` on the view's `keyset_ordering` instead of an `OFFSET`, so every page
+    costs the same however deep the client pages. Keyset pages only link forward.
+
+    Passing `count=false` skips the `COUNT(*)` query in either mode; whether a
+    next page exists is then decided by fetching one extra row.
+
+    Views set `keyset_ordering` to a tuple of non-nullable local fields ending
+    with a unique one, e.g. `("created_at", "id")`. Prefix a field with `-` to
+    order it descending. Defaults to `("id",)`.
+    """
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    default_keyset_ordering = ("id",)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.include_count = request.query_params.get(self.count_query_param, "").lower() not in ("false", "0", "no")
+        self.keyset = self.cursor_query_param in request.query_params
+
+        if not self.keyset and self.include_count:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.count = self.get_count(queryset) if self.include_count else None
+
+        if self.keyset:
+            return self.paginate_keyset(queryset, request, view)
+
+        self.offset = self.get_offset(request)
+        return self.fetch_page(queryset, self.offset)
+
+    def paginate_keyset(self, queryset, request, view):
+        self.ordering = tuple(getattr(view, "keyset_ordering", self.default_keyset_ordering))
+        opts = queryset.model._meta
+        self.ordering_fields = [
+            opts.pk if name.lstrip("-") == "pk" else opts.get_field(name.lstrip("-"))
+            for name in self.ordering
+        ]
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.keyset_filter(position))
+
+        page = self.fetch_page(queryset)
+        self.next_position = self.get_position(page[-1]) if self.has_next else None
+        return page
+
+    def fetch_page(self, queryset, offset=0):
+        """
+        Evaluate a page, reading one row past it to tell whether a next page exists.
+        """
+        page = list(queryset[offset:offset + self.limit + 1])
+        self.has_next = len(page) > self.limit
+        return page[:self.limit]
+
+    def keyset_filter(self, position):
+        """
+        Build `(f1, f2, ...) > (v1, v2, ...)` for the ordering, honoring descending fields.
+        """
+        condition = Q()
+        equal = Q()
+        for name, field, value in zip(self.ordering, self.ordering_fields, position):
+            lookup = "lt" if name.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{field.name}__{lookup}": value})
+            equal &= Q(**{field.name: value})
+        return condition
+
+    def get_position(self, obj):
+        return [field.value_to_string(obj) for field in self.ordering_fields]
+
+    def encode_cursor(self, position):
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if not isinstance(position, list) or len(position) != len(self.ordering_fields):
+                raise ValueError
+            return [field.to_python(value) for field, value in zip(self.ordering_fields, position)]
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, ValidationError):
+            raise NotFound("Invalid cursor.")
+
+    def get_next_link(self):
+        if not self.keyset and self.include_count:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        if self.keyset:
+            url = remove_query_param(url, self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
+    def get_previous_link(self):
+        if self.keyset:
+            return None
+        return super().get_previous_link()
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.include_count:
+            response["count"] = self.count
+        response["next"] = self.get_next_link()
+        if not self.keyset:
+            response["previous"] = self.get_previous_link()
+        response["results"] = data
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["required"] = ["results"]
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opt into keyset pagination; pass an empty value for the first page, "
+                               "then follow the `next` link.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Pass `false` to omit the total `count` from the response.",
+                "schema": {"type": "boolean"},
+            },
+        ]
@@ -0,0 +1,101 @@
+# tests/test_activity_engine.py
+import pytest
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from core.utils.activity_engine import ActivityEngineClient, CircuitOpenError
+
+
+LOGIN = {'user_id': 1, 'access_token': 'token', 'expires_in': 3600}
+
+
+@override_settings(ACTIVITY_ENGINE_BREAKER_THRESHOLD=2, ACTIVITY_ENGINE_BREAKER_RESET=60)
+class TestActivityEngineClient(SimpleTestCase):
+    @pytest.fixture(autouse=True)
+    def use_standin(self, activity_engine_standin):
+        self.engine = activity_engine_standin
+
+    def setUp(self):
+        self.client = ActivityEngineClient()
+
+    def test_idempotent_calls_are_retried(self):
+        self.engine.fail_next(503, 503)
+        assert self.client.delete('auth/1').status_code == 200
+        assert [call.status for call in self.engine.calls] == [503, 503, 200]
+
+    def test_posts_are_not_retried(self):
+        self.engine.fail_next(503)
+        with pytest.raises(requests.HTTPError):
+            self.client.post('auth', json=LOGIN)
+        assert len(self.engine.calls) == 1
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        self.engine.fail_next(500, 500)
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                self.client.post('auth', json=LOGIN)
+
+        with pytest.raises(CircuitOpenError):
+            self.client.post('auth', json=LOGIN)
+        assert len(self.engine.calls) == 2
+
+        # A trial call is let through once the reset timeout has passed
+        self.client.breaker.opened_at -= 60
+        assert self.client.post('auth', json=LOGIN).status_code == 200
+        assert not self.client.breaker.is_open
+
+    def test_trial_call_that_raises_does_not_keep_the_circuit_open(self):
+        self.engine.fail_next(500, 500)
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                self.client.post('auth', json=LOGIN)
+        self.client.breaker.opened_at -= 60
+
+        # The payload cannot be encoded, so the engine is never reached
+        with pytest.raises(TypeError):
+            self.client.post('auth', json={'user_id': object()})
+
+        assert self.client.post('auth', json=LOGIN).status_code == 200
+        assert not self.client.breaker.is_open
+
+    def test_client_errors_do_not_open_the_circuit(self):
+        for _ in range(3):
+            with pytest.raises(requests.HTTPError):
+                self.client.get('missing')
+        assert not self.client.breaker.is_open
+
+    def test_metrics_record_latency_and_failures(self):
+        self.engine.fail_next(500)
+        with pytest.raises(requests.HTTPError):
+            self.client.post('auth', json=LOGIN)
+        self.client.post('auth', json=LOGIN)
+
+        metrics = self.client.metrics.snapshot()['POST auth']
+        assert metrics['calls'] == 2
+        assert metrics['failures'] == 1
+        assert metrics['latency_buckets'][float('inf')] == 2
+
+    def test_session_is_pooled_per_process(self):
+        assert self.client.session is self.client.session
+
+
+class TestStandInActivityEngine(SimpleTestCase):
+    @pytest.fixture(autouse=True)
+    def use_standin(self, activity_engine_standin):
+        self.engine = activity_engine_standin
+
+    def test_validates_payloads(self):
+        client = ActivityEngineClient()
+        with pytest.raises(requests.HTTPError):
+            client.post('v1/course-progress/initialize-progress', json={'courseInstanceId': '1'})
+        assert self.engine.calls[-1].status == 400
+
+    def test_injects_latency_and_errors(self):
+        self.engine.latency = 0.2
+        self.engine.error_rate = 1
+        client = ActivityEngineClient()
+        with pytest.raises(requests.HTTPError):
+            client.post('auth', json=LOGIN)
+
+        assert self.engine.calls[-1].status == self.engine.error_status
+        assert client.metrics.snapshot()['POST auth']['latency_buckets'][0.1] == 0
@@ -0,0 +1,137 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+class NotModified(Exception):
+    """
+    Raised from `initial` to short-circuit a request whose validators match.
+    """
+
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag / Last-Modified support to GET and HEAD requests of a DRF view.
+
+    Validators are computed from `MAX(updated_at)` and a row count of the
+    view's queryset, so a `304 Not Modified` is answered without loading or
+    serializing the response body. The check runs after authentication and
+    permission checks.
+
+    Deleting a row from a list cannot raise `MAX(updated_at)`, so lists only
+    get an ETag, whose row count sees deletes; Last-Modified is sent for
+    single objects.
+
+    Attributes:
+        conditional_actions (tuple): Viewset actions that honor conditional requests.
+        last_modified_fields (tuple): Timestamp fields, possibly across relations,
+            whose maximum marks the last modification of the response.
+    """
+
+    conditional_actions = ("list", "retrieve")
+    last_modified_fields = ("updated_at",)
+
+    def is_detail_request(self):
+        return (self.lookup_url_kwarg or self.lookup_field) in self.kwargs
+
+    def get_validator_queryset(self):
+        """
+        Return the queryset whose rows make up the response.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.is_detail_request():
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+    def get_etag_extra(self):
+        """
+        Return additional state that the response depends on but that is not
+        covered by `last_modified_fields`.
+        """
+        return ""
+
+    def get_validators(self):
+        """
+        Compute the validators of the current request.
+
+        Returns:
+            tuple: The ETag and the last modification time, which may be None.
+            Returning None instead skips conditional handling for the request.
+        """
+        aggregates = {"count": Count("pk")}
+        for index, field in enumerate(self.last_modified_fields):
+            aggregates[f"last_modified_{index}"] = Max(field)
+        stats = self.get_validator_queryset().aggregate(**aggregates)
+
+        timestamps = [
+            stats[f"last_modified_{index}"]
+            for index in range(len(self.last_modified_fields))
+            if stats[f"last_modified_{index}"] is not None
+        ]
+        last_modified = max(timestamps) if timestamps and self.is_detail_request() else None
+        return self.make_etag(stats["count"], *timestamps), last_modified
+
+    def make_etag(self, *parts):
+        """
+        Hash the given state together with what else varies the response.
+        """
+        request = self.request
+        key = "|".join(
+            str(part)
+            for part in (
+                request.get_full_path(),
+                request.META.get("HTTP_ACCEPT", ""),
+                request.user.pk,
+                self.get_etag_extra(),
+                *parts,
+            )
+        )
+        return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    def is_conditional(self, request):
+        return (
+            request.method in ("GET", "HEAD")
+            and getattr(self, "action", "list") in self.conditional_actions
+        )
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        self.conditional_validators = None
+        if not self.is_conditional(request):
+            return
+
+        self.conditional_validators = self.get_validators()
+        if self.conditional_validators is None:
+            return
+
+        etag, last_modified = self.conditional_validators
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if response is not None:
+            raise NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        validators = getattr(self, "conditional_validators", None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response["ETag"] = etag
+            if last_modified:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response